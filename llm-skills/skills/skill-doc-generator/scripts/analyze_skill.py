@@ -3,7 +3,6 @@
 Analyzes a SKILL.md file and extracts metadata, structure, and resources.
 """
 
-import yaml
 import re
 import os
 import sys
@@ -11,23 +10,94 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 
-def parse_frontmatter(content: str) -> tuple[Dict, str]:
-    """Extract YAML frontmatter and remaining content."""
+FLAT_FIELD_PATTERN = re.compile(r'^([A-Za-z_][\w-]*): +(\S.*?) *\r?$')
+# Plain YAML scalars can't start with these; such values go through PyYAML
+YAML_INDICATORS = set('-?:,[]{}#&*!|>\'"%@`')
+# Values PyYAML would type as bool/null/number/date rather than str (YAML
+# 1.1 resolvers); matching a little more than PyYAML does only costs a
+# fallback to the full parser
+YAML_TYPED_VALUE = re.compile(
+    r"""^(?:
+        ~|null|true|false|yes|no|on|off
+      | [-+]?(?=[\d_.]*\d)[\d_]*\.?[\d_]*(?:e[-+]?\d+)?   # int, float, 1_000, 1., .5
+      | [-+]?0x[0-9a-f_]+ | [-+]?0o?[0-7_]+ | [-+]?0b[01_]+  # hex, octal, binary
+      | [-+]?\d[\d_]*(?::[0-5]?\d)+(?:\.[\d_]*)?           # sexagesimal: 1:30, 12:30:00
+      | [-+]?\.(?:inf|nan)
+      | \d{4}-\d\d?-\d\d?(?:[t\s].*)?                      # date, timestamp
+    )$""",
+    re.IGNORECASE | re.VERBOSE
+)
+# Tabs, line breaks YAML knows beyond \n (\r, NEL, LS, PS) and characters
+# PyYAML refuses to read; any of these in a value goes through PyYAML
+YAML_SPECIAL_CHAR = re.compile('[^\x20-\x7E\xA0-\u2027\u202A-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]')
+
+
+def parse_flat_frontmatter(yaml_content: str) -> Optional[Dict]:
+    """
+    Parse frontmatter made only of flat 'key: plain string' lines.
+    
+    Returns None if anything needs a real YAML parser (nesting, lists,
+    quoting, block scalars, comments, typed values, ...).
+    """
+    metadata = {}
+    for line in yaml_content.split('\n'):
+        if not line.strip():
+            continue
+        match = FLAT_FIELD_PATTERN.match(line)
+        if not match:
+            return None
+        key, value = match.groups()
+        if (value[0] in YAML_INDICATORS or ': ' in value or value.endswith(':') or ' #' in value
+                or YAML_SPECIAL_CHAR.search(value) or YAML_TYPED_VALUE.match(value)):
+            return None
+        metadata[key] = value
+    return metadata
+
+
+def load_frontmatter(content: str) -> tuple[Dict, str, Optional[str]]:
+    """
+    Extract YAML frontmatter and remaining content.
+    
+    Returns (metadata, body, error). error describes frontmatter that isn't
+    valid YAML or isn't a mapping; metadata is then empty.
+    """
     frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
     match = re.match(frontmatter_pattern, content, re.DOTALL)
     
     if not match:
-        return {}, content
+        return {}, content, None
     
     yaml_content = match.group(1)
     body = match.group(2)
     
+    # Fast path: skip importing PyYAML for flat name/description frontmatter
+    metadata = parse_flat_frontmatter(yaml_content)
+    if metadata is not None:
+        return metadata, body, None
+    
+    import yaml
+    
     try:
         metadata = yaml.safe_load(yaml_content)
-        return metadata or {}, body
     except yaml.YAMLError as e:
-        print(f"Warning: Failed to parse YAML frontmatter: {e}", file=sys.stderr)
-        return {}, content
+        mark = getattr(e, 'problem_mark', None)
+        if mark is None:
+            return {}, content, str(e)
+        # Mark lines count from the line after the opening ---
+        return {}, content, f"{e.problem} (SKILL.md line {mark.line + 2}, column {mark.column + 1})"
+    if metadata is None:
+        return {}, body, None
+    if not isinstance(metadata, dict):
+        return {}, body, f"frontmatter is a {type(metadata).__name__}, not a mapping of fields"
+    return metadata, body, None
+
+
+def parse_frontmatter(content: str) -> tuple[Dict, str]:
+    """Extract YAML frontmatter and remaining content."""
+    metadata, body, error = load_frontmatter(content)
+    if error:
+        print(f"Warning: Failed to parse YAML frontmatter: {error}", file=sys.stderr)
+    return metadata, body
 
 
 def extract_sections(body: str) -> Dict[str, str]:
@@ -130,11 +200,31 @@ def analyze_skill(skill_path: str) -> Dict:
         raise FileNotFoundError(f"SKILL.md not found at {skill_file}")
     
     content = skill_file.read_text(encoding='utf-8')
-    metadata, body = parse_frontmatter(content)
+    analysis = analyze_content(content, skill_dir)
+    if analysis['frontmatter_error']:
+        print(f"Warning: Failed to parse YAML frontmatter: {analysis['frontmatter_error']}", file=sys.stderr)
+    return analysis
+
+
+def analyze_content(content: str, skill_dir: Path) -> Dict:
+    """
+    Analyze already-loaded SKILL.md content.
+    
+    Args:
+        content: Full SKILL.md text, including frontmatter
+        skill_dir: Skill directory (used for resource discovery)
+        
+    Returns:
+        Dictionary containing skill analysis. 'frontmatter_error' describes
+        frontmatter that couldn't be parsed ('metadata' is then empty).
+    """
+    skill_dir = Path(skill_dir)
+    metadata, body, frontmatter_error = load_frontmatter(content)
     
     analysis = {
         'path': str(skill_dir),
         'metadata': metadata,
+        'frontmatter_error': frontmatter_error,
         'name': metadata.get('name', skill_dir.name),
         'description': metadata.get('description', ''),
         'sections': extract_sections(body),
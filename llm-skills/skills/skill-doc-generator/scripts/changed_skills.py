@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Maps a git diff to the skills that need re-validation.
+
+A skill is selected when a file under its directory changed since the given
+ref, or when its markdown links (transitively) reach into a changed skill.
+
+Usage:
+    changed_skills.py <directory> <ref>
+
+Examples:
+    changed_skills.py /mnt/skills/user origin/main
+    changed_skills.py ./skills HEAD~1
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Optional, Set
+from document_directory import find_skills
+from reference_graph import ReferenceGraph
+
+
+def git_changed_files(directory: Path, ref: str) -> List[Path]:
+    """
+    Absolute paths of files changed between ref and the working tree.
+    
+    Raises:
+        RuntimeError: If git fails (not a repository, unknown ref, ...)
+    """
+    try:
+        toplevel = subprocess.run(
+            ['git', 'rev-parse', '--show-toplevel'],
+            cwd=directory, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        diff = subprocess.run(
+            ['git', 'diff', '--name-only', ref, '--'],
+            cwd=toplevel, capture_output=True, text=True, check=True
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"git failed: {e.stderr.strip()}")
+    return [Path(toplevel, line) for line in diff.splitlines() if line]
+
+
+def skill_root(path: Path, directory: Path) -> Optional[Path]:
+    """Closest directory at or above path (within directory) holding a SKILL.md."""
+    for parent in [path] + list(path.parents):
+        if parent != directory and directory not in parent.parents:
+            return None
+        if (parent / 'SKILL.md').is_file():
+            return parent
+    return None
+
+
+def find_changed_skills(directory: str, ref: str) -> List[Path]:
+    """
+    Find skills affected by changes since a git ref.
+
+    Args:
+        directory: Skill library root
+        ref: Any git ref accepted by 'git diff'
+
+    Returns:
+        Sorted skill directories: changed skills plus skills linking into them
+    """
+    directory = Path(os.path.normpath(Path(directory).resolve()))
+    changed: Set[Path] = set()
+
+    for path in git_changed_files(directory, ref):
+        root = skill_root(Path(os.path.normpath(path)), directory)
+        if root is not None:
+            changed.add(root)
+
+    if not changed:
+        return []
+
+    graph = ReferenceGraph()
+    affected = set(changed)
+    for skill_file in find_skills(directory):
+        skill_file = Path(os.path.normpath(skill_file.resolve()))
+        if skill_file.parent in changed:
+            continue
+        graph.add_file(skill_file)
+        for reached in graph.depths(skill_file):
+            if any(root == reached.parent or root in reached.parents for root in changed):
+                affected.add(skill_file.parent)
+                break
+
+    return sorted(affected)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print("Usage: python changed_skills.py <directory> <ref>")
+        sys.exit(1)
+
+    try:
+        for skill_dir in find_changed_skills(sys.argv[1], sys.argv[2]):
+            print(skill_dir)
+    except RuntimeError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
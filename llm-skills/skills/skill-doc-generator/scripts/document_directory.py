@@ -8,8 +8,9 @@ import traceback
 from pathlib import Path
 from typing import List, Dict
 from analyze_skill import analyze_skill
-from generate_readme import generate_readme, save_readme
+from generate_readme import generate_readme, save_readme, write_if_changed
 from validate_consistency import validate_skill
+from skill_index import update_index
 
 
 def find_skills(directory: str, recursive: bool = True) -> List[Path]:
@@ -38,8 +39,13 @@ def find_skills(directory: str, recursive: bool = True) -> List[Path]:
     return sorted(skill_files)
 
 
-def create_index_file(skills: List[Dict], output_path: Path):
-    """Generate an index/catalog of all skills."""
+def create_index_file(skills: List[Dict], output_path: Path) -> tuple[str, bool]:
+    """
+    Generate an index/catalog of all skills.
+    
+    Returns:
+        Tuple of (index path, whether the file was written)
+    """
     lines = []
     
     lines.append("# Skills Documentation Index")
@@ -96,8 +102,8 @@ def create_index_file(skills: List[Dict], output_path: Path):
             lines.append("")
     
     content = '\n'.join(lines)
-    output_path.write_text(content, encoding='utf-8')
-    return str(output_path)
+    written = write_if_changed(output_path, content)
+    return str(output_path), written
 
 
 def document_directory(
@@ -105,7 +111,8 @@ def document_directory(
     output_dir: str = None,
     recursive: bool = True,
     generate_index_file: bool = True,
-    validate: bool = True
+    validate: bool = True,
+    search_index: str = None
 ) -> Dict:
     """
     Document all skills in a directory.
@@ -116,6 +123,7 @@ def document_directory(
         recursive: Whether to search subdirectories
         generate_index_file: Whether to create an index file
         validate: Whether to run validation
+        search_index: Optional path of a BM25 search index to create or update
         
     Returns:
         Statistics dictionary
@@ -131,7 +139,7 @@ def document_directory(
     
     if not skill_files:
         print("⚠️  No SKILL.md files found")
-        return {'total': 0, 'successful': 0, 'failed': 0}
+        return {'total': 0, 'successful': 0, 'failed': 0, 'written': 0, 'unchanged': 0}
     
     print(f"Found {len(skill_files)} skill(s)")
     print("")
@@ -141,7 +149,9 @@ def document_directory(
         'successful': 0,
         'failed': 0,
         'errors': 0,
-        'warnings': 0
+        'warnings': 0,
+        'written': 0,
+        'unchanged': 0
     }
     
     analyzed_skills = []
@@ -186,8 +196,13 @@ def document_directory(
                 # Save alongside SKILL.md
                 readme_path = skill_dir / 'README.md'
             
-            readme_path.write_text(readme_content, encoding='utf-8')
-            print(f"  📄 README: {readme_path}")
+            _, written = save_readme(skill_dir, readme_content, readme_path)
+            if written:
+                stats['written'] += 1
+                print(f"  📄 README: {readme_path}")
+            else:
+                stats['unchanged'] += 1
+                print(f"  📄 README unchanged: {readme_path}")
             
             stats['successful'] += 1
             
@@ -200,8 +215,22 @@ def document_directory(
     # Generate index if requested
     if generate_index_file and analyzed_skills:
         index_path = output_dir / 'INDEX.md' if output_dir else directory / 'INDEX.md'
-        create_index_file(analyzed_skills, index_path)
-        print(f"📚 Index generated: {index_path}")
+        _, written = create_index_file(analyzed_skills, index_path)
+        if written:
+            stats['written'] += 1
+            print(f"📚 Index generated: {index_path}")
+        else:
+            stats['unchanged'] += 1
+            print(f"📚 Index unchanged: {index_path}")
+        print("")
+    
+    # Update search index if requested
+    if search_index:
+        analyses = {skill['path']: skill for skill in analyzed_skills}
+        index_stats = update_index(search_index, skill_files, analyses)
+        state = "written" if index_stats['written'] else "unchanged"
+        print(f"🔎 Search index {state}: {search_index} "
+              f"({index_stats['indexed']} indexed, {index_stats['reused']} reused)")
         print("")
     
     # Summary
@@ -210,6 +239,8 @@ def document_directory(
     print(f"  Total skills: {stats['total']}")
     print(f"  Successful: {stats['successful']}")
     print(f"  Failed: {stats['failed']}")
+    print(f"  Files written: {stats['written']}")
+    print(f"  Files unchanged: {stats['unchanged']}")
     if validate:
         print(f"  Total errors: {stats['errors']}")
         print(f"  Total warnings: {stats['warnings']}")
@@ -225,6 +256,7 @@ if __name__ == '__main__':
         print("  --no-recursive     Don't search subdirectories")
         print("  --no-index         Don't generate index file")
         print("  --no-validate      Skip validation checks")
+        print("  --search-index <file>  Create/update a BM25 search index")
         print("\nExamples:")
         print("  python document_directory.py /mnt/skills/user")
         print("  python document_directory.py ./skills --output ./docs")
@@ -239,6 +271,12 @@ if __name__ == '__main__':
     generate_index = '--no-index' not in args
     validate = '--no-validate' not in args
     
+    search_index = None
+    if '--search-index' in args:
+        idx = args.index('--search-index')
+        if idx + 1 < len(args):
+            search_index = args[idx + 1]
+    
     if '--output' in args:
         idx = args.index('--output')
         if idx + 1 < len(args):
@@ -250,7 +288,8 @@ if __name__ == '__main__':
             output_dir=output_dir,
             recursive=recursive,
             generate_index_file=generate_index,
-            validate=validate
+            validate=validate,
+            search_index=search_index
         )
         
         sys.exit(0 if stats['failed'] == 0 else 1)
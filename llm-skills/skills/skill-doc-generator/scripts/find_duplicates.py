@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Finds near-duplicate skills with MinHash and locality-sensitive hashing.
+
+Each skill's description and section bodies are reduced to a set of word
+shingles and summarized by a MinHash signature. Signatures are split into
+bands and hashed into buckets, so only skills that share a bucket are compared
+and the run scales roughly linearly with the size of the library.
+
+Usage:
+    find_duplicates.py <directory> [--threshold 0.5] [--num-perm 128] [--no-recursive] [--json]
+
+Examples:
+    find_duplicates.py /mnt/skills/user
+    find_duplicates.py ./skills --threshold 0.3 --json
+"""
+
+import hashlib
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+from analyze_skill import analyze_skill
+from document_directory import find_skills
+from skill_index import tokenize
+
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+SHINGLE_SIZE = 3
+SEED = 1
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[bytes]:
+    """Return the set of word n-grams of a text (or its tokens if shorter)."""
+    tokens = tokenize(text)
+    if len(tokens) < size:
+        return {t.encode('utf-8') for t in tokens}
+    return {' '.join(tokens[i:i + size]).encode('utf-8') for i in range(len(tokens) - size + 1)}
+
+
+def skill_shingles(analysis: Dict) -> Set[bytes]:
+    """Shingle a skill's description and all section bodies."""
+    result = shingles(analysis.get('description', '') or '')
+    for body in analysis.get('sections', {}).values():
+        result |= shingles(body)
+    return result
+
+
+class MinHasher:
+    """Computes MinHash signatures from universal hash permutations."""
+
+    def __init__(self, num_perm: int = 128, seed: int = SEED):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.permutations = [(rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME))
+                             for _ in range(num_perm)]
+
+    def signature(self, items: Set[bytes]) -> Tuple[int, ...]:
+        if not items:
+            return (MAX_HASH,) * self.num_perm
+        hashes = [int.from_bytes(hashlib.blake2b(item, digest_size=4).digest(), 'little')
+                  for item in items]
+        return tuple(
+            min((a * h + b) % MERSENNE_PRIME for h in hashes) & MAX_HASH
+            for a, b in self.permutations
+        )
+
+
+def estimate_jaccard(sig1: Tuple[int, ...], sig2: Tuple[int, ...]) -> float:
+    """Fraction of agreeing signature slots estimates Jaccard similarity."""
+    return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Pick (bands, rows) whose LSH threshold (1/b)^(1/r) is closest to the target."""
+    best = (num_perm, 1)
+    best_error = float('inf')
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if bands == 0:
+            break
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+def find_candidate_pairs(signatures: List[Tuple[int, ...]], bands: int, rows: int) -> Set[Tuple[int, int]]:
+    """Bucket each signature band and return index pairs sharing any bucket."""
+    candidates = set()
+    for band in range(bands):
+        start = band * rows
+        buckets: Dict[Tuple[int, ...], List[int]] = {}
+        for i, sig in enumerate(signatures):
+            buckets.setdefault(sig[start:start + rows], []).append(i)
+        for members in buckets.values():
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    candidates.add((members[x], members[y]))
+    return candidates
+
+
+def find_duplicates(
+    directory: str,
+    threshold: float = 0.5,
+    num_perm: int = 128,
+    recursive: bool = True
+) -> Dict:
+    """
+    Find candidate redundant skill pairs in a directory.
+
+    Args:
+        directory: Directory containing skills
+        threshold: Minimum estimated Jaccard similarity to report
+        num_perm: Number of MinHash permutations (signature length)
+        recursive: Whether to search subdirectories
+
+    Returns:
+        Dictionary with the skills compared, LSH parameters, ranked pairs
+        and the names of skills skipped for having no text to compare
+    """
+    hasher = MinHasher(num_perm)
+    skills = []
+    signatures = []
+    empty = []
+
+    for skill_file in find_skills(directory, recursive):
+        try:
+            analysis = analyze_skill(skill_file.parent)
+        except Exception as e:
+            print(f"⚠️  Skipping {skill_file.parent}: {e}", file=sys.stderr)
+            continue
+        items = skill_shingles(analysis)
+        if not items:
+            # All-MAX_HASH signatures would make every empty skill a 1.0
+            # match for every other one: nothing to compare, so skip it
+            empty.append(analysis['name'])
+            continue
+        skills.append({'name': analysis['name'], 'path': analysis['path']})
+        signatures.append(hasher.signature(items))
+
+    bands, rows = choose_bands(num_perm, threshold)
+    candidates = find_candidate_pairs(signatures, bands, rows)
+
+    pairs = []
+    for i, j in candidates:
+        similarity = estimate_jaccard(signatures[i], signatures[j])
+        if similarity >= threshold:
+            pairs.append({
+                'skill_a': skills[i]['name'],
+                'skill_b': skills[j]['name'],
+                'path_a': skills[i]['path'],
+                'path_b': skills[j]['path'],
+                'similarity': round(similarity, 3),
+            })
+
+    pairs.sort(key=lambda p: (-p['similarity'], p['skill_a'], p['skill_b']))
+
+    return {
+        'skills': len(skills),
+        'num_perm': num_perm,
+        'bands': bands,
+        'rows': rows,
+        'candidates': len(candidates),
+        'threshold': threshold,
+        'pairs': pairs,
+        'skipped_empty': empty,
+    }
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python find_duplicates.py <directory> [options]")
+        print("\nOptions:")
+        print("  --threshold <0-1>  Minimum estimated Jaccard similarity (default: 0.5)")
+        print("  --num-perm <n>     MinHash signature length (default: 128)")
+        print("  --no-recursive     Don't search subdirectories")
+        print("  --json             Print results as JSON")
+        print("\nExamples:")
+        print("  python find_duplicates.py /mnt/skills/user")
+        print("  python find_duplicates.py ./skills --threshold 0.3 --json")
+        sys.exit(1)
+
+    directory = sys.argv[1]
+    args = sys.argv[2:]
+    threshold = 0.5
+    num_perm = 128
+
+    if '--threshold' in args:
+        idx = args.index('--threshold')
+        if idx + 1 < len(args):
+            threshold = float(args[idx + 1])
+
+    if '--num-perm' in args:
+        idx = args.index('--num-perm')
+        if idx + 1 < len(args):
+            num_perm = int(args[idx + 1])
+
+    try:
+        result = find_duplicates(directory, threshold, num_perm, '--no-recursive' not in args)
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if '--json' in args:
+        print(json.dumps(result, indent=2))
+        sys.exit(0)
+
+    print(f"Near-duplicate skills in: {Path(directory)}")
+    print("=" * 60)
+    print(f"Skills: {result['skills']}, LSH: {result['bands']} bands x {result['rows']} rows, "
+          f"{result['candidates']} candidate pair(s)")
+    if result['skipped_empty']:
+        print(f"Skipped {len(result['skipped_empty'])} skill(s) with no description or body text: "
+              f"{', '.join(result['skipped_empty'])}")
+    print("")
+
+    if not result['pairs']:
+        print(f"✅ No skill pairs above {threshold:.2f} estimated similarity")
+    else:
+        print(f"⚠️  {len(result['pairs'])} pair(s) above {threshold:.2f} estimated similarity:")
+        for pair in result['pairs']:
+            print(f"  {pair['similarity']:.2f}  {pair['skill_a']} ↔ {pair['skill_b']}")
@@ -3,9 +3,13 @@
 Generates a README.md file for a skill based on its analysis.
 """
 
+import hashlib
+import os
+import re
 import sys
+import tempfile
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Union
 from analyze_skill import analyze_skill
 from validate_consistency import validate_skill
 
@@ -40,20 +44,26 @@ def extract_key_examples(analysis: Dict) -> List[Dict]:
     return examples
 
 
-def generate_usage_section(analysis: Dict) -> str:
-    """Generate usage/trigger examples section."""
-    name = analysis['name']
-    description = analysis['description']
-    
-    # Try to extract trigger phrases from description
+def extract_trigger_phrases(description: str) -> List[str]:
+    """Extract trigger phrases (the text following "when") from a description."""
     triggers = []
     if 'when' in description.lower():
         # Extract phrases after "when"
-        import re
         when_matches = re.finditer(r'when\s+([^.,;]+)', description, re.IGNORECASE)
         for match in when_matches:
             triggers.append(match.group(1).strip())
     
+    return triggers
+
+
+def generate_usage_section(analysis: Dict) -> str:
+    """Generate usage/trigger examples section."""
+    name = analysis['name']
+    description = analysis['description']
+    
+    # Try to extract trigger phrases from description
+    triggers = extract_trigger_phrases(description)
+    
     usage = f"This skill is triggered when working with tasks related to {name}.\n\n"
     
     if triggers:
@@ -66,13 +76,14 @@ def generate_usage_section(analysis: Dict) -> str:
     return usage
 
 
-def generate_readme(analysis: Dict, include_validation: bool = True) -> str:
+def generate_readme(analysis: Dict, include_validation: bool = True, issues: List = None) -> str:
     """
     Generate README.md content from skill analysis.
     
     Args:
         analysis: Skill analysis dictionary
         include_validation: Whether to include validation results
+        issues: Precomputed validation issues (validated here if omitted)
         
     Returns:
         README.md content as string
@@ -168,7 +179,8 @@ def generate_readme(analysis: Dict, include_validation: bool = True) -> str:
     # Validation results (optional)
     if include_validation:
         try:
-            issues, has_errors = validate_skill(analysis['path'])
+            if issues is None:
+                issues, has_errors = validate_skill(analysis['path'])
             
             readme.append("## Quality Validation")
             readme.append("")
@@ -205,9 +217,50 @@ def generate_readme(analysis: Dict, include_validation: bool = True) -> str:
     return '\n'.join(readme)
 
 
-def save_readme(skill_path: str, readme_content: str, output_path: str = None) -> str:
+def write_if_changed(path: Path, content: Union[str, bytes]) -> bool:
     """
-    Save README to file.
+    Atomically write content to path unless the file already holds it.
+    
+    The existing file is compared by SHA-256 hash; when it differs (or is
+    missing) the content goes to a temp file in the same directory which is
+    then renamed over the target, so readers never see a half-written file.
+    
+    Returns:
+        True if the file was written, False if it was left unchanged
+    """
+    path = Path(path)
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    
+    if path.is_file():
+        if hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(data).digest():
+            return False
+        mode = path.stat().st_mode & 0o777
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    
+    return True
+
+
+def save_readme(skill_path: str, readme_content: str, output_path: str = None) -> tuple[str, bool]:
+    """
+    Save README to file, skipping the write if the content is unchanged.
     
     Args:
         skill_path: Path to skill directory
@@ -215,7 +268,7 @@ def save_readme(skill_path: str, readme_content: str, output_path: str = None) -
         output_path: Optional custom output path
         
     Returns:
-        Path where README was saved
+        Tuple of (path where README was saved, whether it was written)
     """
     skill_path = Path(skill_path)
     
@@ -227,8 +280,8 @@ def save_readme(skill_path: str, readme_content: str, output_path: str = None) -
     else:
         readme_path = skill_path / 'README.md'
     
-    readme_path.write_text(readme_content, encoding='utf-8')
-    return str(readme_path)
+    written = write_if_changed(readme_path, readme_content)
+    return str(readme_path), written
 
 
 if __name__ == '__main__':
@@ -249,9 +302,12 @@ if __name__ == '__main__':
         print(f"Generating README for: {analysis['name']}")
         readme = generate_readme(analysis, include_validation=True)
         
-        saved_path = save_readme(skill_path, readme, output_path)
+        saved_path, written = save_readme(skill_path, readme, output_path)
         
-        print(f"✅ README generated successfully: {saved_path}")
+        if written:
+            print(f"✅ README generated successfully: {saved_path}")
+        else:
+            print(f"✅ README unchanged: {saved_path}")
         print(f"   {len(readme.split(chr(10)))} lines, {len(readme)} characters")
         
     except Exception as e:
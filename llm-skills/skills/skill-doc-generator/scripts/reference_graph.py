@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Builds the markdown link graph of a skill library and reports context cost.
+
+Starting from each SKILL.md, relative markdown links are followed into
+references, other files and other skills. For every skill the report gives:
+
+- Worst case: tokens of every file reachable through links (all loaded)
+- Expected: each file weighted by p^depth, where p is the chance a link is
+  followed and depth is its shortest link distance from SKILL.md
+
+Link cycles and dead links are reported across the whole library.
+
+Usage:
+    reference_graph.py <directory> [--follow-probability 0.5] [--cache <file>] [--no-cache] [--json]
+
+Examples:
+    reference_graph.py /mnt/skills/user
+    reference_graph.py ./skills --follow-probability 0.3 --json
+"""
+
+import json
+import os
+import re
+import stat
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote
+from document_directory import find_skills
+from token_budget import DEFAULT_CACHE, TokenCache, _measure_resource
+
+
+LINK_PATTERN = re.compile(r'\[(?:[^\]]*)\]\(([^)\s]+)(?:\s+"[^"]*")?\)')
+FENCED_CODE_PATTERN = re.compile(r'```.*?```', re.DOTALL)
+SCHEME_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*:')
+
+
+class StatCache:
+    """Memoizes os.stat lookups so each path hits the filesystem once per run."""
+
+    def __init__(self):
+        self._stats: Dict[Path, Optional[os.stat_result]] = {}
+
+    def stat(self, path: Path) -> Optional[os.stat_result]:
+        if path not in self._stats:
+            try:
+                self._stats[path] = path.stat()
+            except OSError:
+                self._stats[path] = None
+        return self._stats[path]
+
+    def is_dir(self, path: Path) -> bool:
+        st = self.stat(path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
+
+def extract_links(content: str) -> List[str]:
+    """Return relative link targets from markdown, ignoring fenced code."""
+    content = FENCED_CODE_PATTERN.sub('', content)
+    targets = []
+    for match in LINK_PATTERN.finditer(content):
+        target = match.group(1).strip('<>')
+        if not target or target.startswith('#') or SCHEME_PATTERN.match(target):
+            continue
+        target = unquote(target.split('#', 1)[0])
+        if target:
+            targets.append(target)
+    return targets
+
+
+class ReferenceGraph:
+    """Link graph over the markdown files reachable from a set of skills."""
+
+    def __init__(self, stats: Optional[StatCache] = None, tokens: Optional[TokenCache] = None):
+        self.stats = stats or StatCache()
+        self.tokens = tokens or TokenCache(None)
+        self.edges: Dict[Path, List[Path]] = {}
+        self.dead_links: List[Tuple[Path, str]] = []
+        self._token_counts: Dict[Path, int] = {}
+
+    def resolve(self, source: Path, target: str) -> Optional[Path]:
+        """Resolve a link target relative to its source file."""
+        path = Path(os.path.normpath(source.parent / target))
+        if self.stats.is_dir(path):
+            skill_md = path / 'SKILL.md'
+            return skill_md if self.stats.stat(skill_md) else None
+        return path if self.stats.stat(path) else None
+
+    def add_file(self, path: Path):
+        """Add a file and, for markdown, everything reachable through its links."""
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            if current in self.edges:
+                continue
+            self.edges[current] = []
+            if current.suffix.lower() != '.md':
+                continue
+            try:
+                content = current.read_text(encoding='utf-8')
+            except (UnicodeDecodeError, OSError):
+                continue
+            for target in extract_links(content):
+                resolved = self.resolve(current, target)
+                if resolved is None:
+                    self.dead_links.append((current, target))
+                    continue
+                if resolved not in self.edges[current]:
+                    self.edges[current].append(resolved)
+                stack.append(resolved)
+
+    def token_count(self, path: Path) -> int:
+        if path not in self._token_counts:
+            measured = self.tokens.get(path, _measure_resource, self.stats.stat(path))
+            self._token_counts[path] = measured['tokens']
+        return self._token_counts[path]
+
+    def depths(self, root: Path) -> Dict[Path, int]:
+        """Shortest link distance from root to every reachable file."""
+        depth = {root: 0}
+        queue = deque([root])
+        while queue:
+            current = queue.popleft()
+            for nxt in self.edges.get(current, []):
+                if nxt not in depth:
+                    depth[nxt] = depth[current] + 1
+                    queue.append(nxt)
+        return depth
+
+    def cycles(self) -> List[List[Path]]:
+        """Strongly connected components that form cycles (Tarjan, iterative)."""
+        index: Dict[Path, int] = {}
+        lowlink: Dict[Path, int] = {}
+        on_stack = set()
+        stack: List[Path] = []
+        result = []
+        counter = 0
+
+        for start in self.edges:
+            if start in index:
+                continue
+            work = [(start, iter(self.edges[start]))]
+            index[start] = lowlink[start] = counter
+            counter += 1
+            stack.append(start)
+            on_stack.add(start)
+
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.edges.get(child, []))))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self.edges.get(node, []):
+                        result.append(sorted(component))
+
+        return result
+
+
+def analyze_library(directory: str, follow_probability: float = 0.5, tokens: Optional[TokenCache] = None) -> Dict:
+    """
+    Build the link graph of a library and compute per-skill load costs.
+
+    Args:
+        directory: Directory containing skills
+        follow_probability: Chance that any single link is followed
+        tokens: Optional TokenCache for per-file token counts
+
+    Returns:
+        Dictionary with per-skill costs, cycles and dead links
+    """
+    root = Path(directory).resolve()
+    graph = ReferenceGraph(tokens=tokens)
+    skill_files = [Path(os.path.normpath(f.resolve())) for f in find_skills(directory)]
+
+    for skill_file in skill_files:
+        graph.add_file(skill_file)
+
+    def rel(path: Path) -> str:
+        try:
+            return str(path.relative_to(root))
+        except ValueError:
+            return str(path)
+
+    skills = []
+    for skill_file in skill_files:
+        depth = graph.depths(skill_file)
+        del depth[skill_file]
+        worst = sum(graph.token_count(p) for p in depth)
+        expected = sum(graph.token_count(p) * follow_probability ** d for p, d in depth.items())
+        other_skills = sorted(rel(p.parent) for p in depth if p.name == 'SKILL.md')
+        skills.append({
+            'skill': rel(skill_file.parent),
+            'skill_md_tokens': graph.token_count(skill_file),
+            'reachable_files': len(depth),
+            'max_depth': max(depth.values(), default=0),
+            'worst_case_tokens': worst,
+            'expected_tokens': round(expected),
+            'linked_skills': other_skills,
+        })
+
+    skills.sort(key=lambda s: s['worst_case_tokens'], reverse=True)
+
+    return {
+        'follow_probability': follow_probability,
+        'files': len(graph.edges),
+        'skills': skills,
+        'cycles': [[rel(p) for p in cycle] for cycle in graph.cycles()],
+        'dead_links': [{'source': rel(src), 'target': target} for src, target in graph.dead_links],
+    }
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python reference_graph.py <directory> [options]")
+        print("\nOptions:")
+        print("  --follow-probability <p>  Chance a link is followed (default: 0.5)")
+        print("  --cache <file>            Token count cache file")
+        print("  --no-cache                Don't read or write the cache")
+        print("  --json                    Print results as JSON")
+        print("\nExamples:")
+        print("  python reference_graph.py /mnt/skills/user")
+        print("  python reference_graph.py ./skills --follow-probability 0.3 --json")
+        sys.exit(1)
+
+    directory = sys.argv[1]
+    args = sys.argv[2:]
+    follow_probability = 0.5
+    cache_path = DEFAULT_CACHE
+
+    if '--follow-probability' in args:
+        idx = args.index('--follow-probability')
+        if idx + 1 < len(args):
+            follow_probability = float(args[idx + 1])
+
+    if '--cache' in args:
+        idx = args.index('--cache')
+        if idx + 1 < len(args):
+            cache_path = Path(args[idx + 1])
+
+    if '--no-cache' in args:
+        cache_path = None
+
+    try:
+        cache = TokenCache(cache_path)
+        result = analyze_library(directory, follow_probability, cache)
+        cache.save()
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if '--json' in args:
+        print(json.dumps(result, indent=2))
+        sys.exit(1 if result['dead_links'] else 0)
+
+    print(f"Reference graph: {directory}")
+    print("=" * 60)
+    print(f"Files in graph: {result['files']}, follow probability: {follow_probability}")
+    print("")
+    print(f"{'worst':>8} {'expected':>9} {'files':>6}  skill")
+    for skill in result['skills']:
+        print(f"{skill['worst_case_tokens']:>8} {skill['expected_tokens']:>9} "
+              f"{skill['reachable_files']:>6}  {skill['skill']}")
+        if skill['linked_skills']:
+            print(f"{'':>26}└─ links to: {', '.join(skill['linked_skills'])}")
+
+    if result['cycles']:
+        print(f"\n⚠️  {len(result['cycles'])} link cycle(s):")
+        for cycle in result['cycles']:
+            print(f"  - {' → '.join(cycle)}")
+
+    if result['dead_links']:
+        print(f"\n❌ {len(result['dead_links'])} dead link(s):")
+        for link in result['dead_links']:
+            print(f"  - {link['source']}: {link['target']}")
+
+    sys.exit(1 if result['dead_links'] else 0)
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Builds and queries a compact BM25 inverted index over a skill library.
+
+The index covers skill names, descriptions, section headings and trigger
+phrases. It is stored as a single binary file that is opened with mmap, so a
+query only touches the term table entries and postings it needs.
+
+Usage:
+    skill_index.py build <directory> <index-file> [--no-recursive]
+    skill_index.py query <index-file> "<request>" [--top N]
+
+Examples:
+    skill_index.py build /mnt/skills/user skills.idx
+    skill_index.py query skills.idx "convert a pdf to markdown" --top 5
+"""
+
+import heapq
+import math
+import mmap
+import re
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from analyze_skill import analyze_skill
+from generate_readme import extract_trigger_phrases, write_if_changed
+
+
+# File layout (all little-endian):
+#   header
+#   doc table     n_docs    x DOC_RECORD
+#   term table    n_terms   x TERM_RECORD (sorted by term bytes)
+#   postings      n_postings x POSTING_RECORD (grouped by term)
+#   string pool   utf-8 terms, skill names and paths
+MAGIC = b'SKIX'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIIIfI')          # magic, version, flags, n_docs, n_terms, n_postings, avgdl, pool_len
+DOC_RECORD = struct.Struct('<IIIIIqq')        # length, name_off, name_len, path_off, path_len, mtime_ns, size
+TERM_RECORD = struct.Struct('<IIII')          # str_off, str_len, post_off, post_count
+POSTING_RECORD = struct.Struct('<II')         # doc_id, weighted term frequency
+
+# Field weights: a term in the name counts three times, and so on
+FIELD_WEIGHTS = {
+    'name': 3,
+    'triggers': 2,
+    'headings': 2,
+    'description': 1,
+}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'how',
+    'i', 'in', 'into', 'is', 'it', 'its', 'me', 'my', 'of', 'on', 'or',
+    'please', 'that', 'the', 'this', 'to', 'use', 'used', 'using', 'when',
+    'which', 'with', 'you', 'your',
+}
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+QUOTED_PATTERN = re.compile(r'["“]([^"”]+)["”]')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split on non-alphanumerics, drop stopwords and plural 's'."""
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def skill_fields(analysis: Dict) -> Dict[str, str]:
+    """Collect the indexed text fields of an analyzed skill."""
+    description = analysis.get('description', '') or ''
+    triggers = extract_trigger_phrases(description)
+    triggers.extend(m.group(1) for m in QUOTED_PATTERN.finditer(description))
+    headings = [s.replace('_', ' ') for s in analysis.get('sections', {}).keys()
+                if s != 'introduction']
+
+    return {
+        'name': analysis['name'].replace('-', ' '),
+        'description': description,
+        'headings': '\n'.join(headings),
+        'triggers': '\n'.join(triggers),
+    }
+
+
+def term_frequencies(analysis: Dict) -> Dict[str, int]:
+    """Compute field-weighted term frequencies for one skill."""
+    tf: Dict[str, int] = {}
+    for field, text in skill_fields(analysis).items():
+        weight = FIELD_WEIGHTS[field]
+        for token in tokenize(text):
+            tf[token] = tf.get(token, 0) + weight
+    return tf
+
+
+def _file_signature(skill_file: Path) -> Tuple[int, int]:
+    stat = skill_file.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SkillIndex:
+    """Read-only view over an index file, backed by mmap."""
+
+    def __init__(self, index_path: str):
+        self.index_path = Path(index_path)
+        self._file = open(self.index_path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Index file is empty: {self.index_path}")
+
+        magic, version, _, n_docs, n_terms, n_postings, avgdl, pool_len = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a skill index (or unsupported version): {self.index_path}")
+
+        self.n_docs = n_docs
+        self.n_terms = n_terms
+        self.n_postings = n_postings
+        self.avgdl = avgdl
+        self._docs_off = HEADER.size
+        self._terms_off = self._docs_off + n_docs * DOC_RECORD.size
+        self._postings_off = self._terms_off + n_terms * TERM_RECORD.size
+        self._pool_off = self._postings_off + n_postings * POSTING_RECORD.size
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._pool_off + offset
+        return self._mm[start:start + length].decode('utf-8')
+
+    def doc(self, doc_id: int) -> Dict:
+        """Return the stored record of a document."""
+        length, name_off, name_len, path_off, path_len, mtime_ns, size = DOC_RECORD.unpack_from(
+            self._mm, self._docs_off + doc_id * DOC_RECORD.size)
+        return {
+            'name': self._string(name_off, name_len),
+            'path': self._string(path_off, path_len),
+            'length': length,
+            'signature': (mtime_ns, size),
+        }
+
+    def _find_term(self, term: bytes) -> Optional[Tuple[int, int]]:
+        """Binary search the sorted term table; return (post_off, post_count)."""
+        lo, hi = 0, self.n_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            str_off, str_len, post_off, post_count = TERM_RECORD.unpack_from(
+                self._mm, self._terms_off + mid * TERM_RECORD.size)
+            start = self._pool_off + str_off
+            candidate = self._mm[start:start + str_len]
+            if candidate == term:
+                return post_off, post_count
+            if candidate < term:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def postings(self, term: str) -> List[Tuple[int, int]]:
+        """Return [(doc_id, tf), ...] for a term."""
+        found = self._find_term(term.encode('utf-8'))
+        if not found:
+            return []
+        post_off, post_count = found
+        start = self._postings_off + post_off * POSTING_RECORD.size
+        return [POSTING_RECORD.unpack_from(self._mm, start + i * POSTING_RECORD.size)
+                for i in range(post_count)]
+
+    def doc_length(self, doc_id: int) -> int:
+        return struct.unpack_from('<I', self._mm, self._docs_off + doc_id * DOC_RECORD.size)[0]
+
+    def search(self, query: str, top: int = 10) -> List[Tuple[float, Dict]]:
+        """Rank skills against a natural-language request with BM25."""
+        scores: Dict[int, float] = {}
+
+        for term in set(tokenize(query)):
+            postings = self.postings(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (self.n_docs - df + 0.5) / (df + 0.5))
+            for doc_id, tf in postings:
+                norm = 1 - BM25_B + BM25_B * self.doc_length(doc_id) / (self.avgdl or 1)
+                score = idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+
+        best = heapq.nlargest(top, scores.items(), key=lambda item: item[1])
+        return [(score, self.doc(doc_id)) for doc_id, score in best]
+
+    def load_documents(self) -> Dict[str, Dict]:
+        """
+        Reconstruct per-document term frequencies from the postings.
+
+        Used when updating an index so unchanged skills are not re-parsed.
+        """
+        docs = {}
+        by_id = []
+        for doc_id in range(self.n_docs):
+            record = self.doc(doc_id)
+            record['tf'] = {}
+            docs[record['path']] = record
+            by_id.append(record)
+
+        for t in range(self.n_terms):
+            str_off, str_len, post_off, post_count = TERM_RECORD.unpack_from(
+                self._mm, self._terms_off + t * TERM_RECORD.size)
+            term = self._string(str_off, str_len)
+            start = self._postings_off + post_off * POSTING_RECORD.size
+            for i in range(post_count):
+                doc_id, tf = POSTING_RECORD.unpack_from(self._mm, start + i * POSTING_RECORD.size)
+                by_id[doc_id]['tf'][term] = tf
+
+        return docs
+
+
+def serialize_index(docs: List[Dict]) -> bytes:
+    """
+    Pack documents into the on-disk index format.
+
+    Args:
+        docs: List of dicts with 'name', 'path', 'signature' and 'tf'
+    """
+    docs = sorted(docs, key=lambda d: d['path'])
+    pool = bytearray()
+
+    def intern(text: str) -> Tuple[int, int]:
+        data = text.encode('utf-8')
+        offset = len(pool)
+        pool.extend(data)
+        return offset, len(data)
+
+    inverted: Dict[bytes, List[Tuple[int, int]]] = {}
+    doc_table = bytearray()
+    total_length = 0
+
+    for doc_id, doc in enumerate(docs):
+        length = sum(doc['tf'].values())
+        total_length += length
+        name_off, name_len = intern(doc['name'])
+        path_off, path_len = intern(doc['path'])
+        mtime_ns, size = doc['signature']
+        doc_table.extend(DOC_RECORD.pack(length, name_off, name_len, path_off, path_len, mtime_ns, size))
+        for term, tf in doc['tf'].items():
+            inverted.setdefault(term.encode('utf-8'), []).append((doc_id, tf))
+
+    term_table = bytearray()
+    postings = bytearray()
+    n_postings = 0
+    for term in sorted(inverted):
+        str_off = len(pool)
+        pool.extend(term)
+        entries = inverted[term]
+        term_table.extend(TERM_RECORD.pack(str_off, len(term), n_postings, len(entries)))
+        for doc_id, tf in entries:
+            postings.extend(POSTING_RECORD.pack(doc_id, tf))
+        n_postings += len(entries)
+
+    avgdl = total_length / len(docs) if docs else 0.0
+    header = HEADER.pack(MAGIC, VERSION, 0, len(docs), len(inverted), n_postings, avgdl, len(pool))
+    return bytes(header + doc_table + term_table + postings + pool)
+
+
+def update_index(index_path: str, skill_files: List[Path], analyses: Optional[Dict[str, Dict]] = None) -> Dict:
+    """
+    Create or incrementally update an index for the given SKILL.md files.
+
+    Skills whose SKILL.md mtime and size match the stored signature keep
+    their indexed terms; only changed or new skills are analyzed.
+
+    Args:
+        index_path: Path of the index file
+        skill_files: SKILL.md files that make up the library
+        analyses: Optional map of skill directory -> analysis already computed
+
+    Returns:
+        Statistics dictionary
+    """
+    index_path = Path(index_path)
+    analyses = analyses or {}
+    existing: Dict[str, Dict] = {}
+
+    if index_path.exists():
+        try:
+            with SkillIndex(index_path) as index:
+                existing = index.load_documents()
+        except (ValueError, struct.error) as e:
+            print(f"⚠️  Rebuilding unreadable index: {e}", file=sys.stderr)
+
+    stats = {'total': 0, 'reused': 0, 'indexed': 0, 'removed': 0, 'failed': 0, 'written': False}
+    docs = []
+
+    for skill_file in skill_files:
+        skill_dir = str(skill_file.parent)
+        signature = _file_signature(skill_file)
+        previous = existing.pop(skill_dir, None)
+
+        if previous and previous['signature'] == signature:
+            docs.append(previous)
+            stats['reused'] += 1
+            continue
+
+        try:
+            analysis = analyses.get(skill_dir) or analyze_skill(skill_dir)
+        except Exception as e:
+            print(f"⚠️  Skipping {skill_dir}: {e}", file=sys.stderr)
+            stats['failed'] += 1
+            continue
+
+        docs.append({
+            'name': analysis['name'],
+            'path': skill_dir,
+            'signature': signature,
+            'tf': term_frequencies(analysis),
+        })
+        stats['indexed'] += 1
+
+    stats['removed'] = len(existing)
+    stats['total'] = len(docs)
+    stats['written'] = write_if_changed(index_path, serialize_index(docs))
+    return stats
+
+
+def main():
+    if len(sys.argv) < 4 or sys.argv[1] not in ('build', 'query'):
+        print("Usage:")
+        print("  skill_index.py build <directory> <index-file> [--no-recursive]")
+        print('  skill_index.py query <index-file> "<request>" [--top N]')
+        print("\nExamples:")
+        print("  skill_index.py build /mnt/skills/user skills.idx")
+        print('  skill_index.py query skills.idx "convert a pdf to markdown" --top 5')
+        sys.exit(1)
+
+    command = sys.argv[1]
+    args = sys.argv[4:]
+
+    if command == 'build':
+        from document_directory import find_skills
+
+        directory, index_path = sys.argv[2], sys.argv[3]
+        start = time.perf_counter()
+        skill_files = find_skills(directory, '--no-recursive' not in args)
+        stats = update_index(index_path, skill_files)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        state = "written" if stats['written'] else "unchanged"
+        print(f"📇 Index {state}: {index_path} ({elapsed:.1f} ms)")
+        print(f"  Skills: {stats['total']} ({stats['indexed']} indexed, {stats['reused']} reused, "
+              f"{stats['removed']} removed, {stats['failed']} failed)")
+        sys.exit(0 if stats['failed'] == 0 else 1)
+
+    index_path, query = sys.argv[2], sys.argv[3]
+    top = 10
+    if '--top' in args:
+        idx = args.index('--top')
+        if idx + 1 < len(args):
+            top = int(args[idx + 1])
+
+    start = time.perf_counter()
+    with SkillIndex(index_path) as index:
+        results = index.search(query, top)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        print(f"🔎 {len(results)} match(es) across {index.n_docs} skills ({elapsed:.2f} ms)")
+        for rank, (score, doc) in enumerate(results, 1):
+            print(f"  {rank:>2}. {score:6.2f}  {doc['name']}  ({doc['path']})")
+
+    sys.exit(0 if results else 1)
+
+
+if __name__ == '__main__':
+    main()
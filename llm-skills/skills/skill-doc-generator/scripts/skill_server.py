@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Long-lived skill tooling server speaking JSON-RPC 2.0.
+
+Keeps analyzed skills in memory and re-parses a skill only when one of its
+files is added, removed or changes mtime or size, so editor integrations can
+call analyze/validate/render on every save without paying interpreter startup.
+
+Requests and responses are newline-delimited JSON objects, read from stdin
+(default) or from connections on a Unix socket.
+
+Methods (params: {"path": "<skill_directory>"}):
+    analyze         Skill analysis (analyze_skill.py)
+    validate        Consistency issues (validate_consistency.py)
+    validate_skill  Packaging checks (skill-debugging-assistant/scripts/validate_skill.py)
+    render          README content (generate_readme.py), not written to disk
+    stats           Cache statistics (no params)
+    shutdown        Stop the server (no params)
+
+Usage:
+    skill_server.py [--socket <path>]
+
+Examples:
+    skill_server.py
+    echo '{"jsonrpc": "2.0", "id": 1, "method": "analyze", "params": {"path": "./my-skill"}}' | skill_server.py
+    skill_server.py --socket /tmp/skill-tools.sock
+"""
+
+import importlib.util
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from analyze_skill import analyze_skill
+from generate_readme import generate_readme
+from validate_consistency import SkillValidator
+
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+VALIDATE_SKILL_PATH = (Path(__file__).resolve().parents[2]
+                       / 'skill-debugging-assistant' / 'scripts' / 'validate_skill.py')
+
+
+class RPCError(Exception):
+    """Error returned to the client as a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def skill_signature(skill_dir: Path) -> Tuple:
+    """
+    (relative path, mtime, size) of every file in the skill, which changes
+    whenever any file is added, removed or edited. Editing a nested file
+    doesn't touch its directories' mtimes, so each file is stat'ed.
+    Hidden directories and __pycache__ are skipped.
+    """
+    signature = []
+    for root, dirs, files in os.walk(skill_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d != '__pycache__')
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature.append((os.path.relpath(path, skill_dir), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class SkillCache:
+    """Per-skill results, invalidated when the skill's signature changes."""
+
+    def __init__(self):
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, skill_dir: Path, key: str, compute: Callable[[], Any]) -> Any:
+        signature = skill_signature(skill_dir)
+        path = str(skill_dir)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry['signature'] != signature:
+                entry = {'signature': signature, 'results': {}}
+                self._entries[path] = entry
+            if key in entry['results']:
+                self.hits += 1
+                return entry['results'][key]
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            entry['results'][key] = value
+        return value
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {'skills': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+class SkillServer:
+    """Dispatches JSON-RPC requests to the skill tooling functions."""
+
+    def __init__(self):
+        self.cache = SkillCache()
+        self.running = True
+        self._validate_skill_module = None
+        self.methods = {
+            'analyze': self.analyze,
+            'validate': self.validate,
+            'validate_skill': self.validate_skill,
+            'render': self.render,
+            'stats': self.stats,
+            'shutdown': self.shutdown,
+        }
+
+    def _skill_dir(self, params: Dict) -> Path:
+        path = params.get('path') if isinstance(params, dict) else None
+        if not path:
+            raise RPCError(INVALID_PARAMS, "Missing 'path' parameter")
+        skill_dir = Path(path).resolve()
+        if skill_dir.is_file():
+            skill_dir = skill_dir.parent
+        if not (skill_dir / 'SKILL.md').exists():
+            raise RPCError(INVALID_PARAMS, f"SKILL.md not found at {skill_dir / 'SKILL.md'}")
+        return skill_dir
+
+    def _analysis(self, skill_dir: Path) -> Dict:
+        return self.cache.get(skill_dir, 'analyze', lambda: analyze_skill(skill_dir))
+
+    def _issues(self, skill_dir: Path):
+        return self.cache.get(
+            skill_dir, 'validate',
+            lambda: SkillValidator().validate_analysis(self._analysis(skill_dir)))
+
+    def analyze(self, params: Dict) -> Dict:
+        return self._analysis(self._skill_dir(params))
+
+    def validate(self, params: Dict) -> Dict:
+        issues = self._issues(self._skill_dir(params))
+        return {
+            'has_errors': any(i.severity == 'ERROR' for i in issues),
+            'issues': [{'severity': i.severity, 'category': i.category, 'message': i.message}
+                       for i in issues],
+        }
+
+    def validate_skill(self, params: Dict) -> Dict:
+        skill_dir = self._skill_dir(params)
+
+        if self._validate_skill_module is None:
+            if not VALIDATE_SKILL_PATH.exists():
+                raise RPCError(SERVER_ERROR, f"validate_skill.py not found at {VALIDATE_SKILL_PATH}")
+            spec = importlib.util.spec_from_file_location('validate_skill', VALIDATE_SKILL_PATH)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._validate_skill_module = module
+
+        def run():
+            validator = self._validate_skill_module.SkillValidator(str(skill_dir))
+            is_valid = validator.validate()
+            return {
+                'valid': is_valid,
+                'errors': validator.errors,
+                'warnings': validator.warnings,
+                'info': validator.info,
+            }
+
+        return self.cache.get(skill_dir, 'validate_skill', run)
+
+    def render(self, params: Dict) -> Dict:
+        skill_dir = self._skill_dir(params)
+        include_validation = params.get('include_validation', True)
+        key = f"render:{bool(include_validation)}"
+
+        def run():
+            issues = self._issues(skill_dir) if include_validation else None
+            return {'readme': generate_readme(self._analysis(skill_dir), include_validation, issues)}
+
+        return self.cache.get(skill_dir, key, run)
+
+    def stats(self, params: Optional[Dict] = None) -> Dict:
+        return self.cache.stats()
+
+    def shutdown(self, params: Optional[Dict] = None) -> Dict:
+        self.running = False
+        return {'stopping': True}
+
+    def handle(self, line: str) -> Optional[str]:
+        """Handle one request line; return the response line (None for notifications)."""
+        request_id = None
+        notification = False
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                raise RPCError(PARSE_ERROR, f"Parse error: {e}")
+
+            if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+                raise RPCError(INVALID_REQUEST, "Invalid request")
+
+            request_id = request.get('id')
+            # No id: a notification, which gets no response, not even an error
+            notification = 'id' not in request
+            method = self.methods.get(request['method'])
+            if method is None:
+                raise RPCError(METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+
+            start = time.perf_counter()
+            result = method(request.get('params') or {})
+            elapsed = (time.perf_counter() - start) * 1000
+
+            response = {'jsonrpc': '2.0', 'id': request_id, 'result': result,
+                        'elapsed_ms': round(elapsed, 3)}
+
+        except RPCError as e:
+            response = {'jsonrpc': '2.0', 'id': request_id,
+                        'error': {'code': e.code, 'message': e.message}}
+        except Exception as e:
+            response = {'jsonrpc': '2.0', 'id': request_id,
+                        'error': {'code': SERVER_ERROR, 'message': str(e)}}
+
+        if notification:
+            return None
+        return json.dumps(response, default=str)
+
+
+def serve_stdio(server: SkillServer):
+    """Serve newline-delimited requests from stdin until EOF or shutdown."""
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        response = server.handle(line)
+        if response is not None:
+            sys.stdout.write(response + '\n')
+            sys.stdout.flush()
+        if not server.running:
+            break
+
+
+def serve_socket(server: SkillServer, socket_path: str):
+    """Serve newline-delimited requests on a Unix socket, one thread per connection."""
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                line = raw.decode('utf-8')
+                if not line.strip():
+                    continue
+                response = server.handle(line)
+                if response is not None:
+                    self.wfile.write((response + '\n').encode('utf-8'))
+                    self.wfile.flush()
+                if not server.running:
+                    threading.Thread(target=unix_server.shutdown, daemon=True).start()
+                    break
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    unix_server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+    unix_server.daemon_threads = True
+    print(f"🔌 Listening on {socket_path}", file=sys.stderr)
+    try:
+        unix_server.serve_forever()
+    finally:
+        unix_server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print("Usage: python skill_server.py [--socket <path>]")
+        print("\nReads JSON-RPC 2.0 requests (one per line) from stdin, or from a Unix socket.")
+        print("Methods: analyze, validate, validate_skill, render, stats, shutdown")
+        sys.exit(0)
+
+    server = SkillServer()
+
+    if '--socket' in args:
+        idx = args.index('--socket')
+        if idx + 1 >= len(args):
+            print("❌ Error: --socket requires a path", file=sys.stderr)
+            sys.exit(1)
+        try:
+            serve_socket(server, args[idx + 1])
+        except KeyboardInterrupt:
+            pass
+    else:
+        serve_stdio(server)
+
+
+if __name__ == '__main__':
+    main()
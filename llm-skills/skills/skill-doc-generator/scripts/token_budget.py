@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Reports the token cost of a skill, split by when each part enters context.
+
+- Metadata: frontmatter name/description, always in context
+- Trigger time: SKILL.md body, loaded when the skill fires
+- On demand: references, scripts and assets, loaded only when read
+
+Counts use tiktoken (cl100k_base) when it is installed, otherwise a
+word-piece approximation. Per-file counts are cached by path, mtime and size.
+
+Usage:
+    token_budget.py <skill_directory> [--top N] [--cache <file>] [--no-cache] [--json]
+
+Examples:
+    token_budget.py ./my-skill
+    token_budget.py ./my-skill --top 5 --json
+"""
+
+import json
+import math
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from analyze_skill import analyze_skill, find_code_blocks
+from generate_readme import write_if_changed
+
+
+DEFAULT_CACHE = Path.home() / '.cache' / 'skill-doc-generator' / 'token-counts.json'
+FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+PIECE_PATTERN = re.compile(r'\w+|[^\w\s]|\n+')
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+
+# A section is flagged when it holds at least this share of trigger-time tokens
+FLAG_SHARE = 0.2
+
+_encoder = None
+_tokenizer_name = None
+
+
+def tokenizer_name() -> str:
+    """Name of the tokenizer used for counting."""
+    _load_encoder()
+    return _tokenizer_name
+
+
+def _load_encoder():
+    global _encoder, _tokenizer_name
+    if _tokenizer_name is not None:
+        return _encoder
+    try:
+        import tiktoken
+        _encoder = tiktoken.get_encoding('cl100k_base')
+        _tokenizer_name = 'tiktoken/cl100k_base'
+    except Exception:
+        _encoder = None
+        _tokenizer_name = 'approx/word-piece'
+    return _encoder
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in text with the best available tokenizer."""
+    if not text:
+        return 0
+    encoder = _load_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text, disallowed_special=()))
+
+    # Approximation: one token per punctuation mark or newline run, and one
+    # per ~4 characters of each word
+    tokens = 0
+    for piece in PIECE_PATTERN.findall(text):
+        if piece[0].isalnum() or piece[0] == '_':
+            tokens += math.ceil(len(piece) / 4)
+        else:
+            tokens += 1
+    return tokens
+
+
+def split_sections(body: str) -> List[Tuple[str, str]]:
+    """
+    Split a markdown body into (heading, text) pairs at '#' and '##' headings.
+
+    Unlike extract_sections, headings inside code fences are ignored and
+    repeated headings are kept as separate sections.
+    """
+    sections = []
+    heading = 'introduction'
+    lines: List[str] = []
+    in_fence = False
+
+    for line in body.split('\n'):
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        elif not in_fence and (line.startswith('# ') or line.startswith('## ')):
+            if any(l.strip() for l in lines):
+                sections.append((heading, '\n'.join(lines)))
+            heading = line.lstrip('#').strip()
+            lines = [line]
+            continue
+        lines.append(line)
+
+    if any(l.strip() for l in lines):
+        sections.append((heading, '\n'.join(lines)))
+
+    return sections
+
+
+class TokenCache:
+    """JSON cache of per-file token breakdowns keyed by path, mtime and size."""
+
+    def __init__(self, cache_path: Optional[Path]):
+        self.cache_path = cache_path
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        if cache_path and cache_path.exists():
+            try:
+                self.entries = json.loads(cache_path.read_text(encoding='utf-8'))
+            except (ValueError, OSError):
+                self.entries = {}
+
+    def get(self, path: Path, compute, stat: Optional[os.stat_result] = None) -> Dict:
+        stat = stat or path.stat()
+        key = str(path.resolve())
+        signature = [stat.st_mtime_ns, stat.st_size, tokenizer_name()]
+        entry = self.entries.get(key)
+        if entry and entry['signature'] == signature:
+            self.hits += 1
+            return entry['value']
+        self.misses += 1
+        value = compute(path)
+        self.entries[key] = {'signature': signature, 'value': value}
+        return value
+
+    def save(self):
+        if not self.cache_path or not self.misses:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(self.cache_path, json.dumps(self.entries, sort_keys=True))
+
+
+def _measure_skill_md(skill_file: Path) -> Dict:
+    content = skill_file.read_text(encoding='utf-8')
+    match = FRONTMATTER_PATTERN.match(content)
+    frontmatter = match.group(0) if match else ''
+    body = content[len(frontmatter):]
+
+    return {
+        'frontmatter': count_tokens(frontmatter),
+        'body': count_tokens(body),
+        'sections': [
+            {'heading': heading, 'tokens': count_tokens(text)}
+            for heading, text in split_sections(body)
+        ],
+        'code_blocks': [
+            {'language': block['language'], 'tokens': count_tokens(block['code'])}
+            for block in find_code_blocks(body)
+        ],
+    }
+
+
+def _measure_resource(path: Path) -> Dict:
+    try:
+        text = path.read_text(encoding='utf-8')
+    except (UnicodeDecodeError, OSError):
+        return {'tokens': 0, 'binary': True}
+    return {'tokens': count_tokens(text), 'binary': False}
+
+
+def token_budget(skill_path: str, cache: Optional[TokenCache] = None, top: int = 3) -> Dict:
+    """
+    Measure the token budget of a skill.
+
+    Args:
+        skill_path: Path to skill directory or SKILL.md file
+        cache: Optional TokenCache for per-file counts
+        top: Number of largest sections to flag
+
+    Returns:
+        Dictionary with metadata, trigger-time and on-demand breakdowns
+    """
+    cache = cache or TokenCache(None)
+    analysis = analyze_skill(skill_path)
+    skill_dir = Path(analysis['path'])
+    skill_file = skill_dir / 'SKILL.md' if Path(skill_path).is_dir() else Path(skill_path)
+
+    skill_md = cache.get(skill_file, _measure_skill_md)
+    trigger_total = skill_md['body']
+
+    ranked = sorted(skill_md['sections'], key=lambda s: s['tokens'], reverse=True)
+    flagged = [
+        dict(section, share=round(section['tokens'] / trigger_total, 3))
+        for i, section in enumerate(ranked)
+        if trigger_total and (i < top or section['tokens'] / trigger_total >= FLAG_SHARE)
+    ]
+
+    on_demand = []
+    for resource_type, files in analysis['resources'].items():
+        for rel_path in files:
+            path = skill_dir / rel_path
+            if not path.is_file():
+                continue
+            measured = cache.get(path, _measure_resource)
+            on_demand.append(dict(measured, path=rel_path, type=resource_type))
+    on_demand.sort(key=lambda r: r['tokens'], reverse=True)
+
+    return {
+        'name': analysis['name'],
+        'path': str(skill_dir),
+        'tokenizer': tokenizer_name(),
+        'metadata': {
+            'frontmatter': skill_md['frontmatter'],
+            'description': count_tokens(analysis['description']),
+        },
+        'trigger_time': {
+            'total': trigger_total,
+            'sections': skill_md['sections'],
+            'code_blocks': skill_md['code_blocks'],
+            'flagged_sections': flagged,
+        },
+        'on_demand': {
+            'total': sum(r['tokens'] for r in on_demand),
+            'files': on_demand,
+        },
+    }
+
+
+def print_report(report: Dict):
+    """Print a human-readable token budget report."""
+    metadata = report['metadata']
+    trigger = report['trigger_time']
+    on_demand = report['on_demand']
+
+    print(f"Token Budget: {report['name']}")
+    print("=" * 60)
+    print(f"Tokenizer: {report['tokenizer']}")
+    print(f"\nAlways loaded (frontmatter): {metadata['frontmatter']} tokens "
+          f"(description: {metadata['description']})")
+    print(f"Loaded at trigger (SKILL.md body): {trigger['total']} tokens")
+    print(f"Loaded on demand (resources): {on_demand['total']} tokens")
+
+    print(f"\nSections ({len(trigger['sections'])}):")
+    for section in trigger['sections']:
+        print(f"  {section['tokens']:>6}  {section['heading']}")
+
+    if trigger['code_blocks']:
+        code_total = sum(b['tokens'] for b in trigger['code_blocks'])
+        print(f"\nCode blocks: {len(trigger['code_blocks'])} ({code_total} tokens)")
+        for i, block in enumerate(trigger['code_blocks'], 1):
+            print(f"  {block['tokens']:>6}  #{i} {block['language']}")
+
+    if trigger['flagged_sections']:
+        print("\n⚠️  Largest contributors at trigger time:")
+        for section in trigger['flagged_sections']:
+            print(f"  {section['tokens']:>6}  {section['share']:>5.0%}  {section['heading']}")
+
+    if on_demand['files']:
+        print(f"\nOn-demand files ({len(on_demand['files'])}):")
+        for resource in on_demand['files']:
+            size = 'binary' if resource['binary'] else resource['tokens']
+            print(f"  {size:>6}  {resource['path']}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python token_budget.py <skill_directory> [options]")
+        print("\nOptions:")
+        print("  --top <n>          Number of largest sections to flag (default: 3)")
+        print("  --cache <file>     Token count cache file")
+        print("  --no-cache         Don't read or write the cache")
+        print("  --json             Print the report as JSON")
+        print("\nExamples:")
+        print("  python token_budget.py ./my-skill")
+        print("  python token_budget.py ./my-skill --top 5 --json")
+        sys.exit(1)
+
+    skill_path = sys.argv[1]
+    args = sys.argv[2:]
+    top = 3
+    cache_path = DEFAULT_CACHE
+
+    if '--top' in args:
+        idx = args.index('--top')
+        if idx + 1 < len(args):
+            top = int(args[idx + 1])
+
+    if '--cache' in args:
+        idx = args.index('--cache')
+        if idx + 1 < len(args):
+            cache_path = Path(args[idx + 1])
+
+    if '--no-cache' in args:
+        cache_path = None
+
+    try:
+        cache = TokenCache(cache_path)
+        report = token_budget(skill_path, cache, top)
+        cache.save()
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if '--json' in args:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
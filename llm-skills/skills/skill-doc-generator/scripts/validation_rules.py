@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+"""
+Declarative validation rules shared by validate_consistency.py and
+skill-debugging-assistant/scripts/validate_skill.py.
+
+Each rule declares the document inputs it reads, its severity and the
+profiles it belongs to. A skill is parsed once into a SkillDocument and every
+rule of a profile runs over that document in a single pass.
+
+Profiles:
+    consistency  Documentation quality (validate_consistency.py)
+    packaging    Packaging readiness (validate_skill.py)
+
+Usage:
+    validation_rules.py [--profile consistency|packaging]
+
+Lists the registered rules.
+"""
+
+import re
+import sys
+import time
+from collections import Counter
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from analyze_skill import analyze_content
+
+
+class ValidationIssue:
+    """Represents a validation issue."""
+
+    SEVERITY_ERROR = 'ERROR'
+    SEVERITY_WARNING = 'WARNING'
+    SEVERITY_INFO = 'INFO'
+
+    def __init__(self, severity: str, category: str, message: str, rule_id: str = None):
+        self.severity = severity
+        self.category = category
+        self.message = message
+        self.rule_id = rule_id
+
+    def __str__(self):
+        return f"[{self.severity}] {self.category}: {self.message}"
+
+
+ERROR = ValidationIssue.SEVERITY_ERROR
+WARNING = ValidationIssue.SEVERITY_WARNING
+INFO = ValidationIssue.SEVERITY_INFO
+
+
+class SkillDocument:
+    """
+    A skill parsed once for validation.
+
+    Every attribute is computed on first access and then reused by all rules.
+    Attributes are None when SKILL.md is missing.
+    """
+
+    FRONTMATTER_PATTERN = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+
+    def __init__(self, skill_path: Union[str, Path], analysis: Optional[Dict] = None):
+        skill_path = Path(skill_path)
+        if skill_path.is_file():
+            self.skill_dir = skill_path.parent
+            self.skill_file = skill_path
+        else:
+            self.skill_dir = skill_path
+            self.skill_file = skill_path / 'SKILL.md'
+        if analysis is not None:
+            self.__dict__['analysis'] = analysis
+
+    @cached_property
+    def skill_md_exists(self) -> bool:
+        return self.skill_file.exists()
+
+    @cached_property
+    def content(self) -> Optional[str]:
+        if not self.skill_md_exists:
+            return None
+        return self.skill_file.read_text(encoding='utf-8')
+
+    @cached_property
+    def frontmatter_text(self) -> Optional[str]:
+        """Raw frontmatter block, or None if absent or unterminated."""
+        if self.content is None:
+            return None
+        match = self.FRONTMATTER_PATTERN.match(self.content)
+        return match.group(1) if match else None
+
+    @cached_property
+    def analysis(self) -> Optional[Dict]:
+        if self.content is None:
+            return None
+        return analyze_content(self.content, self.skill_dir)
+
+    @cached_property
+    def frontmatter_error(self) -> Optional[str]:
+        """Why the YAML frontmatter couldn't be parsed, or None."""
+        return None if self.analysis is None else self.analysis['frontmatter_error']
+
+    @cached_property
+    def metadata(self) -> Optional[Dict]:
+        # Unparseable frontmatter has no fields to check: the metadata rules
+        # are skipped and frontmatter-yaml reports the error instead
+        if self.analysis is None or self.frontmatter_error:
+            return None
+        return self.analysis['metadata']
+
+    @cached_property
+    def description(self) -> Optional[str]:
+        if self.metadata is None:
+            return None
+        description = self.metadata.get('description') or ''
+        return str(description).strip()
+
+    @cached_property
+    def sections_text(self) -> Optional[str]:
+        """All section bodies joined (headings excluded)."""
+        if self.analysis is None:
+            return None
+        return '\n'.join(self.analysis.get('sections', {}).values())
+
+    @cached_property
+    def line_count(self) -> Optional[int]:
+        return None if self.content is None else len(self.content.split('\n'))
+
+    @cached_property
+    def resource_dirs(self) -> Dict[str, bool]:
+        return {name: (self.skill_dir / name).exists() for name in ('scripts', 'references', 'assets')}
+
+    @cached_property
+    def reference_files(self) -> List[str]:
+        references_dir = self.skill_dir / 'references'
+        if not references_dir.exists():
+            return []
+        return sorted(f.name for f in references_dir.glob('*.md'))
+
+    @cached_property
+    def top_level_files(self) -> List[str]:
+        if not self.skill_dir.is_dir():
+            return []
+        return sorted(p.name for p in self.skill_dir.iterdir())
+
+
+class Rule:
+    """A single validation check and its declared inputs, severity and profiles."""
+
+    def __init__(
+        self,
+        rule_id: str,
+        category: str,
+        severity: str,
+        inputs: Tuple[str, ...],
+        profiles: Tuple[str, ...],
+        check: Callable[..., Iterable[str]],
+        passed: Optional[Callable[..., str]] = None
+    ):
+        self.rule_id = rule_id
+        self.category = category
+        self.severity = severity
+        self.inputs = inputs
+        self.profiles = profiles
+        self.check = check
+        self.passed = passed
+
+    def run(self, doc: SkillDocument) -> List[ValidationIssue]:
+        """Run the check; rules whose inputs are unavailable are skipped."""
+        values = [getattr(doc, name) for name in self.inputs]
+        if any(value is None for value in values):
+            return []
+
+        issues = [ValidationIssue(self.severity, self.category, message, self.rule_id)
+                  for message in self.check(*values)]
+        if not issues and self.passed:
+            message = self.passed(*values)
+            if message:
+                issues.append(ValidationIssue(INFO, self.category, message, self.rule_id))
+        return issues
+
+
+RULES: List[Rule] = []
+
+
+def rule(rule_id: str, category: str, severity: str, inputs: Tuple[str, ...],
+         profiles: Tuple[str, ...], passed: Optional[Callable[..., str]] = None):
+    """Register a check function as a rule. The function yields failure messages."""
+    def register(check):
+        RULES.append(Rule(rule_id, category, severity, inputs, profiles, check, passed))
+        return check
+    return register
+
+
+def rules_for(profile: str) -> List[Rule]:
+    return [r for r in RULES if profile in r.profiles]
+
+
+def run_rules(doc: SkillDocument, profile: str, timings: Optional[Dict[str, float]] = None) -> List[ValidationIssue]:
+    """
+    Run every rule of a profile over a parsed document.
+
+    Args:
+        doc: Parsed skill
+        profile: Rule profile name
+        timings: Optional dict filled with seconds per rule (inputs are
+            timed separately as 'input:<name>' the first time they're parsed)
+
+    Returns:
+        Issues in rule registration order
+    """
+    issues = []
+    for r in rules_for(profile):
+        if timings is not None:
+            for name in r.inputs:
+                if name not in doc.__dict__:
+                    start = time.perf_counter()
+                    getattr(doc, name)
+                    timings[f"input:{name}"] = time.perf_counter() - start
+            start = time.perf_counter()
+            issues.extend(r.run(doc))
+            timings[r.rule_id] = timings.get(r.rule_id, 0.0) + time.perf_counter() - start
+        else:
+            issues.extend(r.run(doc))
+    return issues
+
+
+def print_timings(timings: Dict[str, float]):
+    """Print rule and input timings, slowest first."""
+    print(f"\nRule timings ({sum(timings.values()) * 1000:.2f} ms total):")
+    for name, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        print(f"  {seconds * 1000:>8.3f} ms  {name}")
+
+
+# Compiled once at import
+
+KEBAB_CASE = re.compile(r'^[a-z0-9-]+$')
+FILE_TYPE_TRIGGER = re.compile(r'\.(docx|pdf|csv|xlsx|json|py|js|html)')
+ACTION_VERB_TRIGGER = re.compile(r'\b(create|edit|analyze|debug|review|generate|extract|convert)\b')
+ABSOLUTE_WORDS = ('ALWAYS', 'NEVER', 'MUST', 'REQUIRED', 'CRITICAL')
+ABSOLUTE_PATTERN = re.compile(r'\b(' + '|'.join(ABSOLUTE_WORDS) + r')\b')
+
+CONSISTENCY_VAGUE_TERMS = ('various', 'multiple', 'different', 'some', 'general')
+PACKAGING_GENERIC_TERMS = ('helps with', 'assists', 'various', 'multiple', 'different')
+WHEN_INDICATORS = ('when', 'use for', 'use when', 'for queries', 'trigger', 'applies')
+NON_IMPERATIVE_STARTS = (
+    'you should', 'you can', 'you must', 'you will',
+    'we should', 'we can', 'we must', 'we will'
+)
+EXTRANEOUS_FILES = ('README.md', 'CHANGELOG.md', 'INSTALLATION.md',
+                    'QUICK_REFERENCE.md', 'CONTRIBUTING.md')
+
+CONSISTENCY = ('consistency',)
+PACKAGING = ('packaging',)
+
+
+# Consistency profile
+
+@rule('name-present', 'Frontmatter', ERROR, ('metadata',), CONSISTENCY)
+def check_name_present(metadata):
+    if 'name' not in metadata:
+        yield "Missing required field: 'name'"
+    elif not metadata['name']:
+        yield "'name' field is empty"
+
+
+@rule('description-present', 'Frontmatter', ERROR, ('metadata',), CONSISTENCY)
+def check_description_present(metadata):
+    if 'description' not in metadata:
+        yield "Missing required field: 'description'"
+    elif not metadata['description']:
+        yield "'description' field is empty"
+
+
+@rule('name-lowercase', 'Frontmatter', WARNING, ('metadata',), CONSISTENCY)
+def check_name_lowercase(metadata):
+    name = metadata.get('name')
+    if name and (not str(name).islower() or ' ' in str(name)):
+        yield f"Name '{name}' should be lowercase with hyphens (e.g., 'skill-name')"
+
+
+@rule('description-short', 'Description', WARNING, ('description',), CONSISTENCY)
+def check_description_short(description):
+    if description and len(description) < 50:
+        yield f"Description is very short ({len(description)} chars). Should be comprehensive and specific."
+
+
+@rule('description-long', 'Description', INFO, ('description',), CONSISTENCY)
+def check_description_long(description):
+    if len(description) > 500:
+        yield f"Description is quite long ({len(description)} chars). Consider if all content is essential for skill selection."
+
+
+@rule('description-capitalized', 'Description', WARNING, ('description',), CONSISTENCY)
+def check_description_capitalized(description):
+    if description and not description[0].isupper():
+        yield "Description should start with a capital letter"
+
+
+@rule('description-vague', 'Description', INFO, ('description',), CONSISTENCY)
+def check_description_vague(description):
+    lowered = description.lower()
+    for term in CONSISTENCY_VAGUE_TERMS:
+        if term in lowered:
+            yield f"Description contains vague term '{term}' - consider being more specific"
+            break
+
+
+@rule('description-triggers', 'Description', INFO, ('description',), CONSISTENCY)
+def check_description_triggers(description):
+    lowered = description.lower()
+    if description and 'when' not in lowered and 'use' not in lowered:
+        yield "Consider adding trigger phrases ('when', 'use this when') to help with skill selection"
+
+
+@rule('body-short', 'Structure', WARNING, ('analysis',), CONSISTENCY)
+def check_body_short(analysis):
+    body_length = analysis.get('body_length', 0)
+    if body_length < 100:
+        yield f"SKILL.md body is very short ({body_length} chars)"
+
+
+@rule('body-long', 'Structure', WARNING, ('analysis',), CONSISTENCY)
+def check_body_long(analysis):
+    line_count = analysis.get('line_count', 0)
+    if line_count > 500:
+        yield f"SKILL.md is quite long ({line_count} lines). Consider moving detailed content to references/"
+
+
+@rule('overview-section', 'Structure', INFO, ('analysis',), CONSISTENCY)
+def check_overview_section(analysis):
+    section_names = [s.lower() for s in analysis.get('sections', {}).keys()]
+    if not any('overview' in s or 'about' in s for s in section_names):
+        yield "Consider adding an 'Overview' section to introduce the skill"
+
+
+@rule('imperative-form', 'Terminology', INFO, ('sections_text',), CONSISTENCY)
+def check_imperative_form(sections_text):
+    lowered = sections_text.lower()
+    for phrase in NON_IMPERATIVE_STARTS:
+        if phrase in lowered:
+            yield f"Found '{phrase}' - consider using imperative form (e.g., 'Use' instead of 'You should use')"
+            break
+
+
+@rule('scripts-referenced', 'Resources', WARNING, ('analysis', 'sections_text'), CONSISTENCY)
+def check_scripts_referenced(analysis, sections_text):
+    for script in analysis.get('resources', {}).get('scripts', []):
+        if Path(script).name not in sections_text:
+            yield f"Script '{script}' exists but isn't referenced in SKILL.md"
+
+
+@rule('references-referenced', 'Resources', WARNING, ('analysis', 'sections_text'), CONSISTENCY)
+def check_references_referenced(analysis, sections_text):
+    for ref in analysis.get('resources', {}).get('references', []):
+        if Path(ref).name not in sections_text:
+            yield f"Reference file '{ref}' exists but isn't mentioned in SKILL.md"
+
+
+@rule('examples-present', 'Examples', INFO, ('analysis',), CONSISTENCY)
+def check_examples_present(analysis):
+    if not analysis.get('code_blocks', []):
+        yield "No code examples found. Consider adding examples if they would help clarify usage."
+
+
+@rule('examples-language', 'Examples', INFO, ('analysis',), CONSISTENCY)
+def check_examples_language(analysis):
+    for i, block in enumerate(analysis.get('code_blocks', []), 1):
+        if block['language'] == 'text':
+            yield f"Code block {i} has no language tag. Consider adding one for syntax highlighting."
+
+
+# Packaging profile
+
+@rule('skill-md-exists', 'Structure', ERROR, ('skill_md_exists',), PACKAGING,
+      passed=lambda exists: "SKILL.md found")
+def check_skill_md_exists(exists):
+    if not exists:
+        yield "SKILL.md not found"
+
+
+@rule('resource-dirs', 'Structure', INFO, ('resource_dirs',), PACKAGING)
+def check_resource_dirs(resource_dirs):
+    # Informational only: lists the optional directories that are present
+    for name, present in resource_dirs.items():
+        if present:
+            yield f"{name}/ directory present"
+
+
+@rule('frontmatter-format', 'Frontmatter', ERROR, ('content',), PACKAGING)
+def check_frontmatter_format(content):
+    if not content.startswith('---'):
+        yield "No YAML frontmatter found (must start with ---)"
+    elif not SkillDocument.FRONTMATTER_PATTERN.match(content):
+        yield "Invalid frontmatter format (must end with ---)"
+
+
+@rule('frontmatter-yaml', 'Frontmatter', ERROR, ('frontmatter_error',), CONSISTENCY + PACKAGING)
+def check_frontmatter_yaml(frontmatter_error):
+    yield f"Invalid YAML frontmatter: {frontmatter_error}"
+
+
+@rule('name-kebab-case', 'Frontmatter', ERROR, ('frontmatter_text', 'metadata'), PACKAGING,
+      passed=lambda text, metadata: f"Name '{metadata['name']}' follows conventions" if metadata.get('name') else None)
+def check_name_kebab_case(frontmatter_text, metadata):
+    if 'name' not in metadata:
+        yield "Missing 'name' field in frontmatter"
+        return
+    name = str(metadata['name'] or '').strip()
+    if not KEBAB_CASE.match(name):
+        yield f"Name '{name}' must be kebab-case (lowercase, digits, hyphens only)"
+    elif name.startswith('-') or name.endswith('-'):
+        yield f"Name '{name}' cannot start or end with hyphen"
+    elif '--' in name:
+        yield f"Name '{name}' cannot contain consecutive hyphens"
+
+
+@rule('description-content', 'Frontmatter', ERROR, ('frontmatter_text', 'metadata'), PACKAGING)
+def check_description_content(frontmatter_text, metadata):
+    if 'description' not in metadata:
+        yield "Missing 'description' field in frontmatter"
+        return
+    description = str(metadata['description'] or '')
+    if '<' in description or '>' in description:
+        yield "Description contains angle brackets (< or >)"
+    if 'TODO' in description or '[' in description:
+        yield "Description contains TODO or placeholder text"
+
+
+@rule('description-length', 'Description', WARNING, ('description',), PACKAGING,
+      passed=lambda d: f"Description length appropriate ({len(d)} chars)" if d else None)
+def check_description_length(description):
+    if not description:
+        return
+    if len(description) < 50:
+        yield f"Description is short ({len(description)} chars). Consider adding more detail."
+    elif len(description) > 500:
+        yield f"Description is long ({len(description)} chars). Consider being more concise."
+
+
+@rule('description-when', 'Description', WARNING, ('description',), PACKAGING)
+def check_description_when(description):
+    lowered = description.lower()
+    if description and not any(indicator in lowered for indicator in WHEN_INDICATORS):
+        yield "Description might lack 'when to use' indicators (when, use for, etc.)"
+
+
+@rule('description-generic', 'Description', WARNING, ('description',), PACKAGING)
+def check_description_generic(description):
+    lowered = description.lower()
+    if any(term in lowered for term in PACKAGING_GENERIC_TERMS):
+        yield "Description contains generic terms (helps with, assists, various). Be more specific."
+
+
+@rule('description-specific', 'Description', WARNING, ('description',), PACKAGING)
+def check_description_specific(description):
+    lowered = description.lower()
+    if description and not (FILE_TYPE_TRIGGER.search(lowered) or ACTION_VERB_TRIGGER.search(lowered)):
+        yield "Consider adding specific triggers (file types, action verbs, task types)"
+
+
+def _token_budget_passed(line_count):
+    if line_count > 300:
+        return f"SKILL.md has {line_count} lines (approaching limit, consider references)"
+    return f"SKILL.md has {line_count} lines (well within budget)"
+
+
+@rule('token-budget', 'Token Budget', WARNING, ('line_count',), PACKAGING, passed=_token_budget_passed)
+def check_token_budget(line_count):
+    if line_count > 500:
+        yield f"SKILL.md has {line_count} lines (>500). Consider moving content to references/"
+
+
+@rule('absolute-statements', 'Wording', WARNING, ('content',), PACKAGING)
+def check_absolute_statements(content):
+    counts = Counter(ABSOLUTE_PATTERN.findall(content))
+    if counts:
+        message = "Found absolute statements that might override user intent:"
+        for word in ABSOLUTE_WORDS:
+            if counts[word]:
+                message += f"\n    - {word}: {counts[word]} occurrence(s)"
+        message += "\n    Consider using: 'prefer', 'avoid', 'typically', 'by default' with conditional clauses"
+        yield message
+
+
+@rule('reference-mentions', 'Resources', WARNING, ('content', 'reference_files'), PACKAGING)
+def check_reference_mentions(content, reference_files):
+    unmentioned = [ref for ref in reference_files if ref not in content]
+    if unmentioned:
+        yield (f"Reference files not mentioned in SKILL.md: {', '.join(unmentioned)}"
+               "\n      Consider adding descriptions of when to load these files")
+
+
+@rule('extraneous-files', 'Structure', WARNING, ('top_level_files',), PACKAGING)
+def check_extraneous_files(top_level_files):
+    found = [name for name in EXTRANEOUS_FILES if name in top_level_files]
+    if found:
+        yield (f"Extraneous files found: {', '.join(found)}"
+               "\n      Skills should only contain SKILL.md and bundled resources")
+
+
+if __name__ == '__main__':
+    profile = None
+    if '--profile' in sys.argv:
+        idx = sys.argv.index('--profile')
+        if idx + 1 < len(sys.argv):
+            profile = sys.argv[idx + 1]
+
+    selected = rules_for(profile) if profile else RULES
+    print(f"{len(selected)} rule(s){f' in profile {profile}' if profile else ''}:")
+    for r in selected:
+        print(f"  {r.rule_id:<24} {r.severity:<8} {r.category:<14} inputs={','.join(r.inputs)}  [{','.join(r.profiles)}]")
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Async Execution Backend
+
+Runs regression test inputs through an executor on one asyncio event loop,
+so network-bound tests wait concurrently instead of one after another.
+Requests are bounded by a concurrency limit and a token-bucket rate limit;
+each attempt has a timeout, and transient failures (rate limits, server
+errors, timeouts, lost connections) are retried with exponential backoff.
+
+run_tests.py uses it when the suite's executor sets "concurrency" (or
+with --concurrency). The bench command measures throughput against a
+local stub endpoint with a fixed latency.
+
+Usage:
+    async_backend.py bench [--requests N] [--concurrency N,N,...] [--latency S]
+                           [--rate R] [--error-every K]
+
+Examples:
+    async_backend.py bench --requests 200 --concurrency 1,8,32 --latency 0.05
+    async_backend.py bench --requests 100 --concurrency 16 --rate 50 --error-every 5
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import random
+import ssl
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from executors import Executor, ExecutorError, HTTPExecutor
+
+
+# Backend defaults (overridable in the executor config)
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 120.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+
+
+async def http_post(url: str, body: bytes, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+    """
+    Minimal HTTP/1.1 POST over asyncio streams (one connection per request)
+
+    Returns: (status, lowercased response headers, body)
+    Raises: OSError on connection errors, ValueError on a malformed response
+    """
+    parts = urlsplit(url)
+    secure = parts.scheme == 'https'
+    port = parts.port or (443 if secure else 80)
+    reader, writer = await asyncio.open_connection(
+        parts.hostname, port, ssl=ssl.create_default_context() if secure else None)
+    try:
+        target = parts.path or '/'
+        if parts.query:
+            target += f"?{parts.query}"
+        lines = [f"POST {target} HTTP/1.1", f"Host: {parts.netloc}", f"Content-Length: {len(body)}",
+                 "Connection: close"]
+        lines += [f"{name}: {value}" for name, value in headers.items()
+                  if name.lower() not in ('host', 'content-length', 'connection')]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            raise ValueError(f"malformed status line: {status_line[:80]!r}")
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0].strip() or b'0', 16)
+                if size == 0:
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            payload = b''.join(chunks)
+        elif 'content-length' in response_headers:
+            payload = await reader.readexactly(int(response_headers['content-length']))
+        else:
+            payload = await reader.read()
+        return status, response_headers, payload
+    finally:
+        writer.close()
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average, bursts of up to `burst`"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def backoff_delay(attempt: int, base: float, retry_after: Optional[float] = None) -> float:
+    """Exponential backoff with jitter for the given retry (0-based), at least retry_after"""
+    delay = min(MAX_BACKOFF, base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+    return max(delay, retry_after or 0.0)
+
+
+class AsyncBackend:
+    """
+    Runs executor.execute_async calls on a private event loop thread
+
+    submit() may be called from any thread and returns a
+    concurrent.futures.Future with the output (or the final ExecutorError).
+    """
+
+    def __init__(self, executor: Executor, concurrency: int = DEFAULT_CONCURRENCY,
+                 rate: Optional[float] = None, burst: Optional[float] = None,
+                 timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF):
+        self.executor = executor
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.stats = {'requests': 0, 'retries': 0, 'timeouts': 0}
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        # Created on the loop so they bind to it
+        self._semaphore, self._bucket = asyncio.run_coroutine_threadsafe(
+            self._limits(concurrency, rate, burst), self._loop).result()
+
+    @classmethod
+    def from_config(cls, executor: Executor, config: Dict[str, Any],
+                    concurrency: Optional[int] = None) -> 'AsyncBackend':
+        """Backend using the executor config's concurrency, rate_limit, burst, timeout, retries and backoff"""
+        return cls(executor,
+                   concurrency=concurrency or config.get('concurrency', DEFAULT_CONCURRENCY),
+                   rate=config.get('rate_limit'), burst=config.get('burst'),
+                   timeout=config.get('timeout', DEFAULT_TIMEOUT),
+                   retries=config.get('retries', DEFAULT_RETRIES),
+                   backoff=config.get('backoff', DEFAULT_BACKOFF))
+
+    @staticmethod
+    async def _limits(concurrency: int, rate: Optional[float], burst: Optional[float]):
+        return asyncio.Semaphore(max(1, concurrency)), (TokenBucket(rate, burst) if rate else None)
+
+    def submit(self, input_data: Dict[str, Any], timeout: Optional[float] = None) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(self._run(input_data, timeout or self.timeout), self._loop)
+
+    async def _run(self, input_data: Dict[str, Any], timeout: float) -> Optional[str]:
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                if self._bucket is not None:
+                    await self._bucket.acquire()
+                self.stats['requests'] += 1
+                try:
+                    return await asyncio.wait_for(self.executor.execute_async(input_data), timeout)
+                except asyncio.TimeoutError:
+                    self.stats['timeouts'] += 1
+                    error = ExecutorError(f"timed out after {timeout:g}s", retryable=True)
+                except ExecutorError as e:
+                    error = e
+            # Back off outside the semaphore so other tests keep going
+            if not error.retryable or attempt >= self.retries:
+                if attempt:
+                    raise ExecutorError(f"{error} (after {attempt + 1} attempts)")
+                raise error
+            await asyncio.sleep(backoff_delay(attempt, self.backoff, error.retry_after))
+            attempt += 1
+            self.stats['retries'] += 1
+
+    def close(self):
+        """Cancel requests still in flight, let them unwind, then stop the loop"""
+        asyncio.run_coroutine_threadsafe(self._cancel_pending(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    @staticmethod
+    async def _cancel_pending():
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Messages-API-shaped stub: echoes the prompt after a fixed latency"""
+
+    server: 'StubServer'
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)))
+        time.sleep(self.server.latency)
+        if self.server.should_fail():
+            payload = json.dumps({'type': 'error', 'error': {'type': 'rate_limit_error',
+                                                             'message': 'stub rate limit'}}).encode()
+            self.send_response(429)
+            self.send_header('Retry-After', '0')
+        else:
+            text = body['messages'][0]['content']
+            payload = json.dumps({'content': [{'type': 'text', 'text': f"echo: {text}"}]}).encode()
+            self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """Local endpoint for testing the backend: fixed latency, optional 429 on every k-th request"""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, latency: float = 0.05, error_every: int = 0):
+        super().__init__(('127.0.0.1', 0), _StubHandler)
+        self.latency = latency
+        self.error_every = error_every
+        self._served = 0
+        self._lock = threading.Lock()
+        threading.Thread(target=self.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1/messages"
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            self._served += 1
+            return bool(self.error_every) and self._served % self.error_every == 0
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def bench(requests: int, concurrency: int, latency: float, rate: Optional[float],
+          error_every: int) -> Dict[str, Any]:
+    """Push `requests` inputs through an HTTPExecutor + AsyncBackend against a stub"""
+    stub = StubServer(latency, error_every)
+    executor = HTTPExecutor({'url': stub.url, 'model': 'stub'}, Path.cwd())
+    backend = AsyncBackend(executor, concurrency=concurrency, rate=rate, backoff=0.01)
+    try:
+        start = time.perf_counter()
+        futures = [backend.submit({'user_query': f"request {i}"}) for i in range(requests)]
+        failed = 0
+        for i, future in enumerate(futures):
+            try:
+                if future.result() != f"echo: request {i}":
+                    failed += 1
+            except ExecutorError:
+                failed += 1
+        elapsed = time.perf_counter() - start
+    finally:
+        backend.close()
+        stub.stop()
+    return {'concurrency': concurrency, 'elapsed_s': elapsed, 'per_second': requests / elapsed,
+            'failed': failed, **backend.stats}
+
+
+def main():
+    args = sys.argv[1:]
+    if not args or args[0] != 'bench':
+        print("Usage: async_backend.py bench [--requests N] [--concurrency N,N,...] [--latency S] "
+              "[--rate R] [--error-every K]")
+        print("\nExamples:")
+        print("  async_backend.py bench --requests 200 --concurrency 1,8,32 --latency 0.05")
+        print("  async_backend.py bench --requests 100 --concurrency 16 --rate 50 --error-every 5")
+        sys.exit(1)
+
+    requests = 100
+    levels = [1, 4, 16]
+    latency = 0.05
+    rate = None
+    error_every = 0
+
+    i = 1
+    while i < len(args):
+        if args[i] == '--requests' and i + 1 < len(args):
+            requests = int(args[i + 1])
+        elif args[i] == '--concurrency' and i + 1 < len(args):
+            levels = [int(level) for level in args[i + 1].split(',')]
+        elif args[i] == '--latency' and i + 1 < len(args):
+            latency = float(args[i + 1])
+        elif args[i] == '--rate' and i + 1 < len(args):
+            rate = float(args[i + 1])
+        elif args[i] == '--error-every' and i + 1 < len(args):
+            error_every = int(args[i + 1])
+        else:
+            print(f"Unknown argument: {args[i]}")
+            sys.exit(1)
+        i += 2
+
+    print(f"\n⚡ {requests} requests, {latency * 1000:.0f} ms stub latency"
+          + (f", rate limit {rate:g}/s" if rate else "")
+          + (f", 429 on every {error_every}th request" if error_every else ""))
+    print(f"{'='*60}")
+    for level in levels:
+        result = bench(requests, level, latency, rate, error_every)
+        print(f"concurrency {level:>4}: {result['elapsed_s']:6.2f} s  {result['per_second']:8.1f} req/s  "
+              f"{result['retries']} retries  {result['failed']} failed")
+    print()
+
+
+if __name__ == "__main__":
+    main()
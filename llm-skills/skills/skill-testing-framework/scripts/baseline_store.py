@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Baseline Store
+
+Content-addressed, compressed storage for regression test baselines. Each
+distinct output is stored once, compressed, under its SHA-256 hash; a small
+manifest maps test names to their baseline versions.
+
+Layout:
+    <store>/manifest.json
+    <store>/objects/<first 2 hex>/<sha256>.zst   (or .gz without zstandard)
+
+Usage:
+    baseline_store.py add <store> <test-name> <output-file> [--version V]
+    baseline_store.py show <store> [<test-name>]
+    baseline_store.py cat <store> <test-name> [--version V]
+    baseline_store.py import <store> <baseline-dir>
+    baseline_store.py gc <store> [--keep N] [--dry-run]
+
+Examples:
+    baseline_store.py add tests/baselines "Regression: Output format" output.txt
+    baseline_store.py import tests/baselines tests/old-baselines/
+    baseline_store.py gc tests/baselines --keep 3
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # Optional: fall back to gzip
+    zstandard = None
+
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+READ_SIZE = 1 << 20
+ZSTD_LEVEL = 10
+GZIP_LEVEL = 9
+
+
+def _atomic_write(path: Path, write):
+    """Call write(f) on a temp file next to path, then rename it into place"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def file_digest(source: BinaryIO) -> Tuple[str, int]:
+    """SHA-256 hex digest and size of a binary stream, read in chunks"""
+    hasher = hashlib.sha256()
+    size = 0
+    for block in iter(lambda: source.read(READ_SIZE), b''):
+        hasher.update(block)
+        size += len(block)
+    return hasher.hexdigest(), size
+
+
+class BaselineStore:
+    """Manifest plus content-addressed blobs in one directory"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.manifest_path = self.root / MANIFEST_NAME
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        else:
+            self.manifest = {'version': MANIFEST_VERSION, 'tests': {}}
+
+    @property
+    def tests(self) -> Dict[str, Dict[str, Any]]:
+        return self.manifest['tests']
+
+    def save(self):
+        # Key order is kept: versions are listed oldest first
+        content = json.dumps(self.manifest, indent=2).encode('utf-8') + b'\n'
+        _atomic_write(self.manifest_path, lambda f: f.write(content))
+
+    def _blob_path(self, digest: str, suffix: str) -> Path:
+        return self.root / 'objects' / digest[:2] / f"{digest}{suffix}"
+
+    def _find_blob(self, digest: str) -> Optional[Path]:
+        for suffix in ('.zst', '.gz'):
+            path = self._blob_path(digest, suffix)
+            if path.exists():
+                return path
+        return None
+
+    def _write_blob(self, source: BinaryIO, digest: str) -> Path:
+        """Compress source into the blob for digest (zstd when available, else gzip)"""
+        if zstandard is not None:
+            path = self._blob_path(digest, '.zst')
+
+            def write(f):
+                zstandard.ZstdCompressor(level=ZSTD_LEVEL).copy_stream(source, f)
+        else:
+            path = self._blob_path(digest, '.gz')
+
+            def write(f):
+                # mtime=0 keeps blobs byte-identical for identical content
+                with gzip.GzipFile(filename='', mode='wb', fileobj=f, compresslevel=GZIP_LEVEL, mtime=0) as gz:
+                    shutil.copyfileobj(source, gz, READ_SIZE)
+
+        _atomic_write(path, write)
+        return path
+
+    def add(self, test_name: str, source_path: Path, version: Optional[str] = None) -> Tuple[str, str, bool]:
+        """
+        Store a file as the new current baseline of a test
+
+        Args:
+            test_name: Test the baseline belongs to
+            source_path: Output file to store
+            version: Version label (default: v1, v2, ...)
+
+        Returns:
+            (version, digest, stored) where stored is False when an identical
+            blob already existed
+
+        Raises:
+            ValueError: If the version label already exists for this test
+        """
+        with open(source_path, 'rb') as f:
+            digest, size = file_digest(f)
+            blob = self._find_blob(digest)
+            stored = blob is None
+            if stored:
+                f.seek(0)
+                blob = self._write_blob(f, digest)
+
+        entry = self.tests.setdefault(test_name, {'current': None, 'versions': {}})
+        if version is None:
+            version = f"v{len(entry['versions']) + 1}"
+            while version in entry['versions']:
+                version = f"v{int(version[1:]) + 1}"
+        elif version in entry['versions']:
+            raise ValueError(f"Baseline version {version!r} already exists for {test_name!r}")
+
+        entry['versions'][version] = {
+            'digest': digest,
+            'size': size,
+            'blob': blob.relative_to(self.root).as_posix(),
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'source': Path(source_path).name,
+        }
+        entry['current'] = version
+        self.save()
+        return version, digest, stored
+
+    def resolve(self, test_name: str, version: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Manifest entry for a test's baseline (current version by default)
+
+        Raises:
+            ValueError: If the test or version is not in the manifest
+        """
+        entry = self.tests.get(test_name)
+        if entry is None:
+            raise ValueError(f"No baseline for {test_name!r} in {self.manifest_path}")
+        version = version or entry['current']
+        if version not in entry['versions']:
+            raise ValueError(f"No baseline version {version!r} for {test_name!r} "
+                             f"(have: {', '.join(entry['versions'])})")
+        return entry['versions'][version]
+
+    def open(self, test_name: str, version: Optional[str] = None) -> BinaryIO:
+        """Decompressing binary stream over a baseline"""
+        blob = self.root / self.resolve(test_name, version)['blob']
+        if blob.suffix == '.zst':
+            if zstandard is None:
+                raise ValueError(f"{blob} is zstd-compressed; install zstandard to read it")
+            return zstandard.ZstdDecompressor().stream_reader(open(blob, 'rb'), closefd=True)
+        return gzip.open(blob, 'rb')
+
+    def open_text(self, test_name: str, version: Optional[str] = None) -> io.TextIOBase:
+        """Decompressing text stream over a baseline"""
+        return io.TextIOWrapper(self.open(test_name, version), encoding='utf-8')
+
+    def read_text(self, test_name: str, version: Optional[str] = None) -> str:
+        with self.open_text(test_name, version) as f:
+            return f.read()
+
+    def gc(self, keep: Optional[int] = None, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Drop old versions (all but the newest keep per test, never the
+        current one) and delete blobs no remaining version references
+
+        Returns:
+            Counts of pruned versions, removed blobs and freed bytes
+        """
+        prune = []
+        if keep is not None:
+            for test_name, entry in self.tests.items():
+                versions = list(entry['versions'])
+                prune += [(test_name, version) for version in versions[:max(0, len(versions) - keep)]
+                          if version != entry['current']]
+        pruned = set(prune)
+
+        referenced = {info['blob']
+                      for test_name, entry in self.tests.items()
+                      for version, info in entry['versions'].items()
+                      if (test_name, version) not in pruned}
+        objects = self.root / 'objects'
+        garbage = [blob for blob in (sorted(objects.glob('*/*')) if objects.is_dir() else [])
+                   if not blob.name.startswith('.') and blob.relative_to(self.root).as_posix() not in referenced]
+        freed = sum(blob.stat().st_size for blob in garbage)
+
+        if not dry_run:
+            for test_name, version in prune:
+                del self.tests[test_name]['versions'][version]
+            if prune:
+                self.save()
+            for blob in garbage:
+                blob.unlink()
+
+        return {'pruned_versions': len(prune), 'removed_blobs': len(garbage), 'freed_bytes': freed}
+
+    def stats(self) -> Dict[str, int]:
+        """Logical size of all baseline versions vs. bytes stored in blobs"""
+        logical = sum(info['size'] for entry in self.tests.values() for info in entry['versions'].values())
+        objects = self.root / 'objects'
+        blobs = list(objects.glob('*/*')) if objects.is_dir() else []
+        return {
+            'tests': len(self.tests),
+            'versions': sum(len(entry['versions']) for entry in self.tests.values()),
+            'blobs': len(blobs),
+            'logical_bytes': logical,
+            'stored_bytes': sum(blob.stat().st_size for blob in blobs),
+        }
+
+
+def import_directory(store: BaselineStore, baseline_dir: Path) -> List[Tuple[str, str, bool]]:
+    """Add every file of a flat baseline directory, named after the file"""
+    results = []
+    for path in sorted(baseline_dir.iterdir()):
+        if path.is_file() and not path.name.startswith('.') and path.name != MANIFEST_NAME:
+            version, digest, stored = store.add(path.name, path)
+            results.append((path.name, version, stored))
+    return results
+
+
+def _size(n: int) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if n < 1024 or unit == 'GB':
+            return f"{n:.0f} {unit}" if unit == 'B' else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def main():
+    args = sys.argv[1:]
+    options: Dict[str, Any] = {'version': None, 'keep': None, 'dry_run': False}
+    positional = []
+
+    i = 0
+    while i < len(args):
+        if args[i] == '--version' and i + 1 < len(args):
+            options['version'] = args[i + 1]
+            i += 2
+        elif args[i] == '--keep' and i + 1 < len(args):
+            options['keep'] = int(args[i + 1])
+            i += 2
+        elif args[i] == '--dry-run':
+            options['dry_run'] = True
+            i += 1
+        else:
+            positional.append(args[i])
+            i += 1
+
+    usage = {
+        'add': 3, 'show': 1, 'cat': 2, 'import': 2, 'gc': 1,
+    }
+    if not positional or positional[0] not in usage or len(positional) - 1 < usage[positional[0]]:
+        print("Usage:")
+        print("  baseline_store.py add <store> <test-name> <output-file> [--version V]")
+        print("  baseline_store.py show <store> [<test-name>]")
+        print("  baseline_store.py cat <store> <test-name> [--version V]")
+        print("  baseline_store.py import <store> <baseline-dir>")
+        print("  baseline_store.py gc <store> [--keep N] [--dry-run]")
+        sys.exit(1)
+
+    command, store = positional[0], BaselineStore(Path(positional[1]))
+
+    try:
+        if command == 'add':
+            source = Path(positional[3])
+            if not source.exists():
+                print(f"❌ Error: Output file not found: {source}")
+                sys.exit(1)
+            version, digest, stored = store.add(positional[2], source, options['version'])
+            print(f"✅ {positional[2]} → {version} ({digest[:12]}{'' if stored else ', already stored'})")
+
+        elif command == 'show':
+            names = [positional[2]] if len(positional) > 2 else sorted(store.tests)
+            for name in names:
+                entry = store.tests.get(name)
+                if entry is None:
+                    raise ValueError(f"No baseline for {name!r}")
+                print(f"\n📄 {name}")
+                for version, info in entry['versions'].items():
+                    marker = '*' if version == entry['current'] else ' '
+                    print(f"  {marker} {version:<8} {info['digest'][:12]}  {_size(info['size']):>9}  "
+                          f"{info['created']}  {info['source']}")
+            stats = store.stats()
+            if stats['stored_bytes']:
+                print(f"\n📦 {stats['tests']} tests, {stats['versions']} versions, {stats['blobs']} blobs: "
+                      f"{_size(stats['logical_bytes'])} stored in {_size(stats['stored_bytes'])} "
+                      f"({stats['logical_bytes'] / stats['stored_bytes']:.1f}x)")
+            print()
+
+        elif command == 'cat':
+            with store.open(positional[2], options['version']) as f:
+                shutil.copyfileobj(f, sys.stdout.buffer, READ_SIZE)
+
+        elif command == 'import':
+            source_dir = Path(positional[2])
+            if not source_dir.is_dir():
+                print(f"❌ Error: Not a directory: {source_dir}")
+                sys.exit(1)
+            for name, version, stored in import_directory(store, source_dir):
+                print(f"  {name} → {version}{'' if stored else ' (duplicate content)'}")
+            stats = store.stats()
+            print(f"✅ Imported into {store.root}: {_size(stats['logical_bytes'])} stored in "
+                  f"{_size(stats['stored_bytes'])}")
+
+        elif command == 'gc':
+            result = store.gc(options['keep'], options['dry_run'])
+            prefix = "Would remove" if options['dry_run'] else "Removed"
+            print(f"🧹 {prefix} {result['pruned_versions']} old versions and {result['removed_blobs']} "
+                  f"unreferenced blobs ({_size(result['freed_bytes'])})")
+
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+
+Measures cold start to first output for skill scripts: each run starts a fresh
+interpreter and times how long it takes for the first byte to appear on
+stdout or stderr.
+
+Usage:
+    benchmark_startup.py [--runs N] "<script> [args...]" ["<script> [args...]" ...]
+
+Examples:
+    benchmark_startup.py scripts/run_tests.py scripts/generate_test_template.py
+    benchmark_startup.py --runs 20 "../skill-doc-generator/scripts/analyze_skill.py ../skill-doc-generator"
+"""
+
+import os
+import selectors
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+
+def time_to_first_output(command: List[str], timeout: float = 30) -> float:
+    """Run a command and return seconds until its first byte of output."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    try:
+        selector = selectors.DefaultSelector()
+        selector.register(proc.stdout, selectors.EVENT_READ)
+        selector.register(proc.stderr, selectors.EVENT_READ)
+        first_output = None
+
+        while first_output is None:
+            remaining = timeout - (time.perf_counter() - start)
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(command, timeout)
+            for key, _ in selector.select(remaining):
+                if os.read(key.fileobj.fileno(), 1):
+                    first_output = time.perf_counter() - start
+                    break
+                selector.unregister(key.fileobj)
+            if first_output is None and not selector.get_map():
+                # Exited without printing anything: fall back to exit time
+                proc.wait()
+                first_output = time.perf_counter() - start
+        selector.close()
+    finally:
+        proc.kill()
+        proc.communicate()
+
+    return first_output
+
+
+def benchmark(command: List[str], runs: int = 10) -> Dict[str, float]:
+    """Time a command over several runs, after one discarded warmup run."""
+    time_to_first_output(command)
+    samples = [time_to_first_output(command) for _ in range(runs)]
+
+    return {
+        'min_ms': min(samples) * 1000,
+        'median_ms': statistics.median(samples) * 1000,
+        'mean_ms': statistics.mean(samples) * 1000,
+        'stdev_ms': (statistics.stdev(samples) if len(samples) > 1 else 0.0) * 1000,
+    }
+
+
+def main():
+    args = sys.argv[1:]
+    runs = 10
+
+    if '--runs' in args:
+        idx = args.index('--runs')
+        if idx + 1 >= len(args):
+            print("❌ Error: --runs requires a number")
+            sys.exit(1)
+        runs = int(args[idx + 1])
+        del args[idx:idx + 2]
+
+    if not args:
+        print('Usage: benchmark_startup.py [--runs N] "<script> [args...]" ...')
+        print("\nExamples:")
+        print("  benchmark_startup.py scripts/run_tests.py scripts/generate_test_template.py")
+        print('  benchmark_startup.py --runs 20 "../skill-doc-generator/scripts/analyze_skill.py ../skill-doc-generator"')
+        sys.exit(1)
+
+    baseline = benchmark([sys.executable, '-c', 'print()'], runs)
+
+    print(f"\n⏱️  Startup benchmark ({runs} runs each, first output)")
+    print(f"{'='*60}")
+    print(f"{'median':>9} {'min':>9} {'stdev':>8}  command")
+    print(f"{baseline['median_ms']:>7.1f}ms {baseline['min_ms']:>7.1f}ms "
+          f"{baseline['stdev_ms']:>6.1f}ms  (bare interpreter)")
+
+    for spec in args:
+        parts = shlex.split(spec)
+        script = Path(parts[0])
+        if not script.exists():
+            print(f"❌ Script not found: {script}")
+            continue
+        result = benchmark([sys.executable, str(script)] + parts[1:], runs)
+        print(f"{result['median_ms']:>7.1f}ms {result['min_ms']:>7.1f}ms "
+              f"{result['stdev_ms']:>6.1f}ms  {spec}")
+
+    print()
+
+
+if __name__ == "__main__":
+    main()
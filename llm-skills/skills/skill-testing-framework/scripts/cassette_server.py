@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Cassette Server
+
+A local HTTP stand-in for a model API. Each request is normalized (method,
+path and JSON body with sorted keys, ignoring volatile fields) and hashed;
+replay mode answers with the response recorded under that hash, so
+regression suites run offline with deterministic outputs. Record mode
+forwards requests to the real API and saves the responses.
+
+Cassettes are one JSON file per request hash in the cassette directory.
+Only the request body and the response status, content type and body are
+stored; request headers (API keys) never are.
+
+Usage:
+    cassette_server.py <cassette-dir> [--port N] [--mode replay|record|new] [--upstream <url>]
+
+Modes:
+    replay   answer from cassettes only; unknown requests get a 404 (default)
+    record   forward every request upstream and (re)write its cassette
+    new      replay known requests, forward and record unknown ones
+
+Examples:
+    cassette_server.py tests/cassettes --port 8765
+    cassette_server.py tests/cassettes --port 8765 --mode record --upstream https://api.anthropic.com
+"""
+
+import base64
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+CASSETTE_MODES = ('replay', 'record', 'new')
+
+# Top-level request body fields that do not change the answer
+DEFAULT_IGNORE_KEYS = ('metadata',)
+
+# Request headers never forwarded upstream (hop-by-hop, or set by urllib)
+SKIPPED_HEADERS = {'host', 'content-length', 'connection', 'accept-encoding', 'keep-alive',
+                   'transfer-encoding', 'upgrade', 'proxy-connection'}
+
+
+def normalize_request(method: str, path: str, body: bytes,
+                      ignore_keys: Sequence[str] = DEFAULT_IGNORE_KEYS) -> Dict[str, Any]:
+    """
+    Canonical form of a request: JSON bodies are parsed (so key order and
+    whitespace don't matter) minus ignore_keys; other bodies are kept as text
+    """
+    try:
+        payload = json.loads(body) if body else None
+    except ValueError:
+        payload = body.decode('utf-8', errors='replace')
+    else:
+        if isinstance(payload, dict):
+            payload = {key: value for key, value in payload.items() if key not in ignore_keys}
+    return {'method': method.upper(), 'path': path, 'body': payload}
+
+
+def request_hash(normalized: Dict[str, Any]) -> str:
+    canonical = json.dumps(normalized, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class CassetteStore:
+    """Directory of recorded interactions, one <hash>.json per request"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def path(self, digest: str) -> Path:
+        return self.root / f"{digest}.json"
+
+    def load(self, digest: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path(digest), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, digest: str, request: Dict[str, Any], status: int, content_type: str, body: bytes):
+        try:
+            response_body = {'text': body.decode('utf-8')}
+        except UnicodeDecodeError:
+            response_body = {'base64': base64.b64encode(body).decode('ascii')}
+        cassette = {'request': request,
+                    'response': dict(status=status, content_type=content_type, **response_body)}
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=f".{digest}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cassette, f, indent=2, ensure_ascii=False)
+                f.write('\n')
+            os.replace(tmp_name, self.path(digest))
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+
+def cassette_response(cassette: Dict[str, Any]) -> Tuple[int, str, bytes]:
+    """(status, content type, body) of a recorded response"""
+    response = cassette['response']
+    if 'base64' in response:
+        body = base64.b64decode(response['base64'])
+    else:
+        body = response['text'].encode('utf-8')
+    return response['status'], response.get('content_type', 'application/json'), body
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: 'CassetteServer'
+
+    def do_GET(self):
+        self._respond(*self.server.answer(self.command, self.path, self.headers, b''))
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self._respond(*self.server.answer(self.command, self.path, self.headers, self.rfile.read(length)))
+
+    def _respond(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class CassetteServer(ThreadingHTTPServer):
+    """
+    Replaying (and optionally recording) HTTP stand-in
+
+    Use start() to serve from a background thread, e.g. inside run_tests.py,
+    or serve_forever() directly.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, cassette_dir: Path, mode: str = 'replay', upstream: Optional[str] = None,
+                 host: str = '127.0.0.1', port: int = 0,
+                 ignore_keys: Sequence[str] = DEFAULT_IGNORE_KEYS, verbose: bool = False):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"unknown cassette mode '{mode}' (use {', '.join(CASSETTE_MODES)})")
+        if mode != 'replay' and not upstream:
+            raise ValueError(f"cassette mode '{mode}' needs an upstream URL")
+        super().__init__((host, port), _Handler)
+        self.store = CassetteStore(cassette_dir)
+        self.mode = mode
+        self.upstream = upstream.rstrip('/') if upstream else None
+        self.ignore_keys = tuple(ignore_keys)
+        self.verbose = verbose
+        self.counts = {'replayed': 0, 'recorded': 0, 'missed': 0}
+        self._counts_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'CassetteServer':
+        # Short poll interval so stop() returns promptly at the end of a test run
+        self._thread = threading.Thread(target=self.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _count(self, key: str):
+        with self._counts_lock:
+            self.counts[key] += 1
+
+    def answer(self, method: str, path: str, headers, body: bytes) -> Tuple[int, str, bytes]:
+        normalized = normalize_request(method, path, body, self.ignore_keys)
+        digest = request_hash(normalized)
+
+        if self.mode != 'record':
+            cassette = self.store.load(digest)
+            if cassette is not None:
+                self._count('replayed')
+                return cassette_response(cassette)
+            if self.mode == 'replay':
+                self._count('missed')
+                error = {'type': 'error', 'error': {
+                    'type': 'cassette_miss',
+                    'message': f"No cassette for {method} {path} (request hash {digest[:12]}); "
+                               f"record it with cassette mode 'new' or 'record'"}}
+                return 404, 'application/json', json.dumps(error).encode('utf-8')
+
+        status, content_type, response_body = self._forward(method, path, headers, body)
+        # Errors are passed through but not recorded, so a bad run can't become a baseline
+        if 200 <= status < 300:
+            self.store.save(digest, normalized, status, content_type, response_body)
+            self._count('recorded')
+        return status, content_type, response_body
+
+    def _forward(self, method: str, path: str, headers, body: bytes) -> Tuple[int, str, bytes]:
+        forwarded = {name: value for name, value in headers.items() if name.lower() not in SKIPPED_HEADERS}
+        request = urllib.request.Request(self.upstream + path, data=body if method == 'POST' else None,
+                                         headers=forwarded, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=300) as response:
+                return response.status, response.headers.get('Content-Type', 'application/json'), response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers.get('Content-Type', 'application/json'), e.read()
+        except (urllib.error.URLError, OSError) as e:
+            error = {'type': 'error', 'error': {'type': 'upstream_unreachable', 'message': str(e)}}
+            return 502, 'application/json', json.dumps(error).encode('utf-8')
+
+
+def main():
+    args = sys.argv[1:]
+    cassette_dir = None
+    port = 8765
+    mode = 'replay'
+    upstream = None
+
+    i = 0
+    while i < len(args):
+        if args[i] == '--port' and i + 1 < len(args):
+            port = int(args[i + 1])
+            i += 2
+        elif args[i] == '--mode' and i + 1 < len(args):
+            mode = args[i + 1]
+            i += 2
+        elif args[i] == '--upstream' and i + 1 < len(args):
+            upstream = args[i + 1]
+            i += 2
+        elif cassette_dir is None and not args[i].startswith('-'):
+            cassette_dir = Path(args[i])
+            i += 1
+        else:
+            print(f"Unknown argument: {args[i]}")
+            sys.exit(1)
+
+    if cassette_dir is None:
+        print("Usage: cassette_server.py <cassette-dir> [--port N] [--mode replay|record|new] [--upstream <url>]")
+        print("\nExamples:")
+        print("  cassette_server.py tests/cassettes --port 8765")
+        print("  cassette_server.py tests/cassettes --mode record --upstream https://api.anthropic.com")
+        sys.exit(1)
+
+    try:
+        server = CassetteServer(cassette_dir, mode, upstream, port=port, verbose=True)
+    except (ValueError, OSError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    print(f"📼 Serving {cassette_dir} ({mode}) on {server.url}" + (f" → {upstream}" if upstream else ""))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        counts = server.counts
+        print(f"\n📊 {counts['replayed']} replayed, {counts['recorded']} recorded, {counts['missed']} missed")
+
+
+if __name__ == "__main__":
+    main()
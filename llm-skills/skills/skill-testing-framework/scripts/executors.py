@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Test Executors
+
+Turn a regression test's "input" into the output compared with its baseline.
+A suite picks one with a top-level "executor" object in the test file:
+
+    "executor": {"type": "command", "command": ["python3", "ask_model.py"]}
+    "executor": {"type": "http", "url": "https://api.anthropic.com/v1/messages",
+                 "model": "<model>", "cassettes": "cassettes/"}
+    "executor": {"type": "my_executors:SkillExecutor", ...}
+
+"command" runs a program with the input as JSON on stdin and uses its stdout.
+"http" sends a Messages API request and uses the reply text; with
+"cassettes" it talks to a local cassette_server.py stand-in that replays
+recorded responses (cassette_mode "replay", the default) or records them
+("record", "new"). Any other type is "module:Class", imported from the
+test file's directory or sys.path, and should subclass Executor.
+
+Usage:
+    executors.py <test-file> [--cassette-mode replay|record|new]
+
+Examples:
+    executors.py tests/regression.json                  # print each test's output
+    executors.py tests/regression.json --cassette-mode new
+"""
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from cassette_server import CASSETTE_MODES, DEFAULT_IGNORE_KEYS, CassetteServer
+
+
+class ExecutorError(Exception):
+    """
+    A test input could not be executed
+
+    retryable marks transient failures (rate limits, server errors, lost
+    connections); retry_after is the delay the server asked for, in seconds.
+    """
+
+    def __init__(self, message: str, retryable: bool = False, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def http_error(status: int, payload: bytes, retry_after: Optional[str] = None) -> ExecutorError:
+    """ExecutorError for an HTTP error response; 408, 429 and 5xx are retryable"""
+    try:
+        message = json.loads(payload)['error']['message']
+    except (ValueError, KeyError, TypeError):
+        message = payload.decode('utf-8', errors='replace')[:200]
+    try:
+        delay = float(retry_after) if retry_after else None
+    except ValueError:
+        delay = None
+    return ExecutorError(f"HTTP {status}: {message}", retryable=status in (408, 429) or status >= 500,
+                         retry_after=delay)
+
+
+class Executor:
+    """
+    Base class: produces a test's output from its input
+
+    Executors may be called from several threads at once (run_tests.py -j).
+    """
+
+    def __init__(self, config: Dict[str, Any], base_dir: Path):
+        self.config = config
+        self.base_dir = base_dir
+
+    def execute(self, input_data: Dict[str, Any]) -> Optional[str]:
+        raise NotImplementedError
+
+    async def execute_async(self, input_data: Dict[str, Any]) -> Optional[str]:
+        """Used by the async backend (async_backend.py); runs execute() in a worker thread"""
+        import asyncio
+        return await asyncio.to_thread(self.execute, input_data)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class NullExecutor(Executor):
+    """No executor configured: there is no output to compare"""
+
+    def execute(self, input_data: Dict[str, Any]) -> Optional[str]:
+        return None
+
+
+class CommandExecutor(Executor):
+    """Runs config['command'] in the test file's directory with the input as JSON on stdin"""
+
+    def __init__(self, config: Dict[str, Any], base_dir: Path):
+        super().__init__(config, base_dir)
+        if not config.get('command'):
+            raise ValueError("command executor needs a 'command' list")
+        self.command: List[str] = config['command']
+        self.timeout = config.get('timeout', 120)
+
+    def execute(self, input_data: Dict[str, Any]) -> Optional[str]:
+        try:
+            result = subprocess.run(self.command, input=json.dumps(input_data), capture_output=True,
+                                    text=True, cwd=self.base_dir, timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            raise ExecutorError(f"command timed out after {self.timeout}s")
+        except OSError as e:
+            raise ExecutorError(f"cannot run {self.command[0]}: {e}")
+        if result.returncode != 0:
+            raise ExecutorError(f"command exited with {result.returncode}: {result.stderr.strip()[:200]}")
+        return result.stdout
+
+
+class HTTPExecutor(Executor):
+    """
+    Sends the input to a Messages API endpoint; the reply's text is the output
+
+    The user message is input['user_query'], followed by the contents of
+    input['files'] (relative to the test file). Requests default to
+    temperature 0. The API key is read from the environment variable named
+    by api_key_env (default ANTHROPIC_API_KEY) and is not needed for replay.
+    """
+
+    def __init__(self, config: Dict[str, Any], base_dir: Path):
+        super().__init__(config, base_dir)
+        if not config.get('url'):
+            raise ValueError("http executor needs a 'url'")
+        self.url = config['url']
+        self.timeout = config.get('timeout', 300)
+        self.server: Optional[CassetteServer] = None
+
+        if config.get('cassettes'):
+            parts = urlsplit(self.url)
+            self.server = CassetteServer(
+                base_dir / config['cassettes'], config.get('cassette_mode', 'replay'),
+                upstream=f"{parts.scheme}://{parts.netloc}",
+                ignore_keys=config.get('ignore_keys', DEFAULT_IGNORE_KEYS)).start()
+            self.url = self.server.url + parts.path + (f"?{parts.query}" if parts.query else "")
+
+    def build_request(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Messages API request body for a test input"""
+        content = str(input_data.get('user_query', ''))
+        for name in input_data.get('files', []):
+            path = self.base_dir / name
+            try:
+                text = path.read_text(encoding='utf-8')
+            except OSError as e:
+                raise ExecutorError(f"cannot read input file {path}: {e}")
+            content += f'\n\n<file name="{name}">\n{text}\n</file>'
+
+        body = {
+            'model': self.config.get('model'),
+            'max_tokens': self.config.get('max_tokens', 1024),
+            'temperature': self.config.get('temperature', 0),
+            'messages': [{'role': 'user', 'content': content}],
+        }
+        if self.config.get('system'):
+            body['system'] = self.config['system']
+        return body
+
+    def headers(self) -> Dict[str, str]:
+        headers = {'content-type': 'application/json',
+                   'anthropic-version': self.config.get('api_version', '2023-06-01')}
+        api_key = os.environ.get(self.config.get('api_key_env', 'ANTHROPIC_API_KEY'))
+        if api_key:
+            headers['x-api-key'] = api_key
+        headers.update(self.config.get('headers', {}))
+        return headers
+
+    @staticmethod
+    def parse_response(payload: bytes) -> str:
+        """Reply text: the text blocks of a Messages API response, else the raw body"""
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            return payload.decode('utf-8', errors='replace')
+        if isinstance(data, dict) and isinstance(data.get('content'), list):
+            return ''.join(block.get('text', '') for block in data['content'] if block.get('type') == 'text')
+        return payload.decode('utf-8', errors='replace')
+
+    def execute(self, input_data: Dict[str, Any]) -> Optional[str]:
+        request = urllib.request.Request(self.url, data=json.dumps(self.build_request(input_data)).encode('utf-8'),
+                                         headers=self.headers(), method='POST')
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return self.parse_response(response.read())
+        except urllib.error.HTTPError as e:
+            raise http_error(e.code, e.read(), e.headers.get('Retry-After'))
+        except (urllib.error.URLError, OSError) as e:
+            raise ExecutorError(f"request to {self.url} failed: {e}", retryable=True)
+
+    async def execute_async(self, input_data: Dict[str, Any]) -> Optional[str]:
+        """Same request over a non-blocking connection, so one thread can wait on many"""
+        from async_backend import http_post
+        body = json.dumps(self.build_request(input_data)).encode('utf-8')
+        try:
+            status, headers, payload = await http_post(self.url, body, self.headers())
+        except (OSError, ValueError) as e:
+            raise ExecutorError(f"request to {self.url} failed: {e}", retryable=True)
+        if not 200 <= status < 300:
+            raise http_error(status, payload, headers.get('retry-after'))
+        return self.parse_response(payload)
+
+    def close(self):
+        if self.server is not None:
+            self.server.stop()
+            self.server = None
+
+
+EXECUTOR_TYPES = {
+    'command': CommandExecutor,
+    'http': HTTPExecutor,
+}
+
+
+def load_executor(config: Optional[Dict[str, Any]], base_dir: Path) -> Executor:
+    """
+    Executor for a test file's "executor" config (None: NullExecutor)
+
+    Raises:
+        ValueError: If the type is unknown or the config is incomplete
+    """
+    if not config:
+        return NullExecutor({}, base_dir)
+    executor_type = config.get('type', '')
+    if executor_type in EXECUTOR_TYPES:
+        return EXECUTOR_TYPES[executor_type](config, base_dir)
+    if ':' not in executor_type:
+        raise ValueError(f"unknown executor type '{executor_type}' "
+                         f"(use {', '.join(EXECUTOR_TYPES)} or module:Class)")
+
+    module_name, class_name = executor_type.split(':', 1)
+    if str(base_dir) not in sys.path:
+        sys.path.insert(0, str(base_dir))
+    try:
+        executor_class = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"cannot load executor {executor_type}: {e}")
+    return executor_class(config, base_dir)
+
+
+def main():
+    args = sys.argv[1:]
+    test_file = None
+    cassette_mode = None
+
+    i = 0
+    while i < len(args):
+        if args[i] == '--cassette-mode' and i + 1 < len(args):
+            cassette_mode = args[i + 1]
+            i += 2
+        elif test_file is None and not args[i].startswith('-'):
+            test_file = Path(args[i])
+            i += 1
+        else:
+            print(f"Unknown argument: {args[i]}")
+            sys.exit(1)
+
+    if test_file is None:
+        print("Usage: executors.py <test-file> [--cassette-mode replay|record|new]")
+        sys.exit(1)
+    if cassette_mode is not None and cassette_mode not in CASSETTE_MODES:
+        print(f"❌ Error: Invalid cassette mode '{cassette_mode}'. Use {', '.join(CASSETTE_MODES)}")
+        sys.exit(1)
+
+    with open(test_file, 'r') as f:
+        if test_file.suffix in ('.yaml', '.yml'):
+            import yaml
+            test_data = yaml.safe_load(f)
+        else:
+            test_data = json.load(f)
+    config = test_data.get('executor')
+    if config and cassette_mode:
+        config = dict(config, cassette_mode=cassette_mode)
+
+    try:
+        executor = load_executor(config, test_file.resolve().parent)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    failed = 0
+    with executor:
+        for test in test_data.get('regression_tests', []):
+            print(f"\n▶️  {test.get('name', 'Unnamed test')}")
+            try:
+                print(executor.execute(test.get('input', {})))
+            except ExecutorError as e:
+                failed += 1
+                print(f"❌ {e}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,20 +4,260 @@ Test Template Generator
 
 Creates test case templates for skills based on the skill structure.
 
+With --benchmarks, each script is inspected statically (argparse calls,
+sys.argv use and its Usage: line) to find its input parameters. Scripts that
+take input files or skill directories get benchmark cases at 1x, 10x and
+100x input sizes, with suggested duration budgets. Their synthetic inputs
+(several MB) are written to benchmark_inputs/ next to the template.
+
 Usage:
-    generate_test_template.py <skill-path> [--output <output-file>] [--format json|yaml]
+    generate_test_template.py <skill-path> [--output <output-file>] [--format json|yaml] [--benchmarks]
 
 Examples:
     generate_test_template.py /mnt/skills/public/pdf
     generate_test_template.py /mnt/skills/public/docx --output docx-tests.json
     generate_test_template.py ../my-skill --format yaml
+    generate_test_template.py ../my-skill --benchmarks
 """
 
 import sys
+import ast
+import csv
 import json
-import yaml
+import random
+import re
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+from xml.sax.saxutils import escape
+
+
+# Benchmark input sizes, as multiples of BENCHMARK_BASE_RECORDS records
+BENCHMARK_SCALES = (1, 10, 100)
+BENCHMARK_BASE_RECORDS = 100
+
+# Suggested median duration per scale. Interpreter startup plus linear work
+# fits comfortably; a 100x input over budget usually means quadratic work.
+BENCHMARK_BUDGETS_MS = {1: 1000, 10: 2000, 100: 10000}
+
+# Formats synthetic inputs can be written in (yml, markdown etc. normalized)
+TEXT_FORMATS = ('txt', 'md', 'csv', 'json', 'jsonl', 'yaml', 'xml', 'html')
+FORMAT_ALIASES = {'text': 'txt', 'markdown': 'md', 'yml': 'yaml', 'htm': 'html', 'ndjson': 'jsonl'}
+BINARY_FORMATS = ('pdf', 'docx', 'xlsx', 'pptx', 'png', 'jpg', 'jpeg', 'gif', 'zip')
+
+# Parameter name words that mark what an argument is
+OUTPUT_WORDS = {'out', 'output', 'dest', 'destination', 'save', 'target', 'index', 'cache'}
+INPUT_WORDS = {'file', 'path', 'input', 'in', 'src', 'source', 'data'}
+DIRECTORY_WORDS = {'dir', 'directory', 'folder', 'root'}
+NON_FILE_WORDS = {'socket', 'port', 'url', 'host', 'ref', 'name', 'query', 'id'}
+
+# Calls of scripts that serve until stopped: no benchmark
+SERVER_CALLS = ('serve_forever', 'run_forever', 'serve')
+
+WORDS = ('skill', 'token', 'budget', 'reference', 'workflow', 'script', 'output', 'input', 'test',
+         'baseline', 'metric', 'document', 'section', 'example', 'validate', 'report', 'cache',
+         'latency', 'request', 'response', 'pattern', 'trigger', 'description', 'analysis')
+
+
+def _words(text: str) -> List[str]:
+    return [word for word in re.split(r'[^a-z0-9]+', text.lower()) if word]
+
+
+def detect_format(*texts: str) -> Optional[str]:
+    """File format named in parameter names, help text or paths (e.g. 'data_csv', 'report.json')"""
+    for text in texts:
+        for word in _words(text or ''):
+            word = FORMAT_ALIASES.get(word, word)
+            if word in TEXT_FORMATS or word in BINARY_FORMATS:
+                return word
+    return None
+
+
+def classify_parameter(name: str, *hints: str) -> str:
+    """
+    Role of a script argument from its name and hints (metavar, help, type):
+    'input', 'output', 'skill' (one skill directory), 'skills' (a directory
+    of skills) or 'other'
+    """
+    words = set(_words(name))
+    hint_words = set(_words(' '.join(hints)))
+    if words & NON_FILE_WORDS:
+        return 'other'
+    if words & OUTPUT_WORDS or 'filetype' in hint_words and "'w'" in ' '.join(hints):
+        return 'output'
+    if 'skill' in words and words & (DIRECTORY_WORDS | {'path'}):
+        return 'skill'
+    if words & DIRECTORY_WORDS or words == {'skills'}:
+        return 'skills'
+    if words & INPUT_WORDS or detect_format(name) or hint_words & {'path', 'filetype'}:
+        return 'input'
+    return 'other'
+
+
+def _constant(node: Optional[ast.AST]) -> Any:
+    return node.value if isinstance(node, ast.Constant) else None
+
+
+def _argparse_parameters(tree: ast.AST) -> Optional[List[Dict[str, Any]]]:
+    """Parameters from add_argument calls, in source order; None without argparse"""
+    if not any(isinstance(node, ast.Call) and ast.unparse(node.func).endswith('ArgumentParser')
+               for node in ast.walk(tree)):
+        return None
+    calls = sorted((node for node in ast.walk(tree)
+                    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                    and node.func.attr == 'add_argument'),
+                   key=lambda node: (node.lineno, node.col_offset))
+    parameters = []
+    for call in calls:
+        flags = [arg.value for arg in call.args if isinstance(_constant(arg), str)]
+        if not flags:
+            continue
+        keywords = {keyword.arg: keyword.value for keyword in call.keywords if keyword.arg}
+        positional = not flags[0].startswith('-')
+        action = _constant(keywords.get('action'))
+        if positional:
+            required = _constant(keywords.get('nargs')) not in ('?', '*') and 'default' not in keywords
+        else:
+            required = _constant(keywords.get('required')) is True
+        name = _constant(keywords.get('dest')) or (flags[0] if positional else max(flags, key=len)).lstrip('-')
+        hints = [str(_constant(keywords.get(key)) or '') for key in ('metavar', 'help')]
+        hints.append(ast.unparse(keywords['type']) if 'type' in keywords else '')
+        if action in ('store_true', 'store_false', 'store_const', 'count', 'help', 'version'):
+            role = 'flag'
+        else:
+            role = classify_parameter(name, *hints)
+        parameters.append({'name': name, 'flag': None if positional else max(flags, key=len),
+                           'required': required, 'role': role, 'format': detect_format(name, *hints)})
+    return parameters
+
+
+def _usage_line(tree: ast.AST, script_name: str) -> Optional[str]:
+    """The arguments part of the first 'Usage:' line in the docstring or a string literal"""
+    for node in ast.walk(tree):
+        text = _constant(node)
+        if not isinstance(text, str) or 'Usage:' not in text:
+            continue
+        lines = text.split('Usage:', 1)[1].strip().splitlines()
+        if not lines:
+            continue
+        tokens = lines[0].split()
+        for i, token in enumerate(tokens):
+            if token.endswith(script_name) or token.endswith('.py'):
+                return ' '.join(tokens[i + 1:])
+    return None
+
+
+def _usage_tokens(usage: str) -> List[str]:
+    """Split a usage line on spaces outside [optional] groups (which may nest) and quotes"""
+    tokens = []
+    current = ''
+    depth = 0
+    quoted = False
+    for char in usage:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == '[':
+            depth += 1
+        elif not quoted and char == ']':
+            depth -= 1
+        if char.isspace() and not depth and not quoted:
+            if current:
+                tokens.append(current)
+            current = ''
+        else:
+            current += char
+    if current:
+        tokens.append(current)
+    return tokens
+
+
+def _argv_parameters(tree: ast.AST, script_name: str) -> List[Dict[str, Any]]:
+    """Positional parameters of a script that reads sys.argv itself"""
+    parameters = []
+    usage = _usage_line(tree, script_name)
+    if usage is not None:
+        tokens = _usage_tokens(usage)
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if token.startswith('[') or token == '...':
+                i += 1
+                continue
+            if token.startswith('-'):
+                # Required option: --flag <value>
+                value = tokens[i + 1] if i + 1 < len(tokens) and not tokens[i + 1].startswith(('-', '[')) else None
+                if value is not None:
+                    name = value.replace('<', '').replace('>', '').strip('"')
+                    parameters.append({'name': name, 'flag': token, 'required': True,
+                                       'role': classify_parameter(token, name), 'format': detect_format(name)})
+                    i += 1
+            elif '<' in token:
+                name = token.replace('<', '').replace('>', '').strip('"')
+                parameters.append({'name': name, 'flag': None, 'required': True,
+                                   'role': 'other' if token.startswith('"') else classify_parameter(name),
+                                   'format': detect_format(name)})
+            else:
+                parameters.append({'name': token, 'flag': None, 'required': True, 'role': 'literal',
+                                   'format': None})
+            i += 1
+        return parameters
+    
+    # No usage line: name = sys.argv[N] assignments, required up to len(sys.argv) checks
+    positions: Dict[int, Dict[str, Any]] = {}
+    required = 0
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Compare) and ast.unparse(node.left) == 'len(sys.argv)' \
+                and isinstance(node.ops[0], (ast.Lt, ast.NotEq)) and isinstance(_constant(node.comparators[0]), int):
+            required = max(required, node.comparators[0].value - 1)
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            optional = isinstance(node.value, ast.IfExp)
+            for sub in ast.walk(node.value):
+                if isinstance(sub, ast.Subscript) and ast.unparse(sub.value) == 'sys.argv' \
+                        and isinstance(_constant(sub.slice), int):
+                    name = node.targets[0].id
+                    positions.setdefault(sub.slice.value, {'name': name, 'optional': optional})
+                    break
+    for index in range(1, max([required] + list(positions)) + 1):
+        entry = positions.get(index, {'name': f"arg{index}", 'optional': False})
+        parameters.append({'name': entry['name'], 'flag': None,
+                           'required': index <= required or not (entry['optional'] or required),
+                           'role': classify_parameter(entry['name']), 'format': detect_format(entry['name'])})
+    return parameters
+
+
+def inspect_script(script_file: Path) -> Dict[str, Any]:
+    """
+    Command-line interface of a script, found statically with ast
+    
+    Returns:
+        cli ('argparse', 'sys.argv' or None), parameters (name, flag,
+        required, role, format) and default_format (the format of the
+        module it parses input with, e.g. json for json.load)
+    """
+    try:
+        tree = ast.parse(script_file.read_text(encoding='utf-8'), filename=str(script_file))
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError) as e:
+        return {'cli': None, 'parameters': [], 'default_format': None, 'error': str(e)}
+    
+    source_calls = {ast.unparse(node.func) for node in ast.walk(tree) if isinstance(node, ast.Call)}
+    default_format = next((fmt for fmt, calls in (('json', ('json.load', 'json.loads')),
+                                                  ('csv', ('csv.reader', 'csv.DictReader')),
+                                                  ('yaml', ('yaml.safe_load', 'yaml.load')))
+                           if source_calls & set(calls)), None)
+    
+    if any(call.split('.')[-1] in SERVER_CALLS for call in source_calls):
+        return {'cli': None, 'parameters': [], 'default_format': default_format,
+                'error': "serves until stopped"}
+    
+    parameters = _argparse_parameters(tree)
+    if parameters is not None:
+        cli = 'argparse'
+    elif any(ast.unparse(node) == 'sys.argv' for node in ast.walk(tree) if isinstance(node, ast.Attribute)):
+        cli = 'sys.argv'
+        parameters = _argv_parameters(tree, script_file.name)
+    else:
+        cli = None
+        parameters = []
+    return {'cli': cli, 'parameters': parameters, 'default_format': default_format}
 
 
 def analyze_skill_structure(skill_path: Path) -> Dict[str, Any]:
@@ -34,10 +274,12 @@ def analyze_skill_structure(skill_path: Path) -> Dict[str, Any]:
     }
     
     # Find scripts
+    structure['interfaces'] = {}
     if structure['has_scripts']:
         for script_file in scripts_dir.glob('*.py'):
             if script_file.name != '__pycache__':
                 structure['scripts'].append(script_file.name)
+                structure['interfaces'][script_file.name] = inspect_script(script_file)
     
     return structure
 
@@ -62,6 +304,162 @@ def generate_unit_tests(structure: Dict[str, Any]) -> List[Dict[str, Any]]:
     return tests
 
 
+def _records(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    return [{'id': i + 1,
+             'name': f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i + 1}",
+             'category': rng.choice(WORDS[:6]),
+             'value': round(rng.uniform(0, 1000), 2),
+             'updated_at': f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T10:00:00Z",
+             'content': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(8, 24)))}
+            for i in range(count)]
+
+
+def write_synthetic_input(fmt: str, scale: int, inputs_dir: Path) -> Path:
+    """
+    Deterministic input file of BENCHMARK_BASE_RECORDS * scale records in a
+    text format; reused if it already exists
+    """
+    path = inputs_dir / f"input_{scale}x.{fmt}"
+    if path.exists():
+        return path
+    inputs_dir.mkdir(parents=True, exist_ok=True)
+    records = _records(BENCHMARK_BASE_RECORDS * scale, random.Random(f"{fmt}-{scale}"))
+    
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        if fmt == 'csv':
+            writer = csv.DictWriter(f, fieldnames=list(records[0]))
+            writer.writeheader()
+            writer.writerows(records)
+        elif fmt == 'json':
+            json.dump({'items': records}, f, indent=2)
+        elif fmt == 'jsonl':
+            f.writelines(json.dumps(record) + '\n' for record in records)
+        elif fmt == 'yaml':
+            # JSON strings are valid YAML scalars: no PyYAML needed
+            f.write('items:\n')
+            for record in records:
+                f.writelines(f"{'  - ' if i == 0 else '    '}{key}: {json.dumps(value)}\n"
+                             for i, (key, value) in enumerate(record.items()))
+        elif fmt == 'xml':
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n<items>\n')
+            for record in records:
+                fields = ''.join(f"<{key}>{escape(str(value))}</{key}>" for key, value in record.items() if key != 'id')
+                f.write(f'  <item id="{record["id"]}">{fields}</item>\n')
+            f.write('</items>\n')
+        elif fmt == 'html':
+            f.write('<!DOCTYPE html>\n<html><head><title>Synthetic input</title></head><body>\n')
+            for record in records:
+                f.write(f"<h2>{escape(record['name'])}</h2>\n<p>{escape(record['content'])}</p>\n")
+            f.write('</body></html>\n')
+        elif fmt == 'md':
+            f.write('# Synthetic input\n')
+            for record in records:
+                f.write(f"\n## {record['name']}\n\n{record['content']}\n")
+        else:
+            f.writelines(f"{record['content']}\n" for record in records)
+    return path
+
+
+def write_synthetic_skill(skill_dir: Path, scale: int, name: str = 'synthetic-skill') -> Path:
+    """Skill directory with a SKILL.md of 10 * scale sections and scale reference files"""
+    rng = random.Random(f"skill-{name}-{scale}")
+    (skill_dir / 'references').mkdir(parents=True, exist_ok=True)
+    lines = ['---', f"name: {name}",
+             f"description: Synthetic skill for benchmarks. Use when testing {' '.join(rng.sample(WORDS, 4))}.",
+             '---', '', f"# {name.replace('-', ' ').title()}", '']
+    for i in range(10 * scale):
+        record = _records(1, rng)[0]
+        lines += [f"## {record['name']}", '', record['content'], '']
+    lines += [f"- See [references/ref_{i + 1}.md](references/ref_{i + 1}.md)" for i in range(scale)]
+    (skill_dir / 'SKILL.md').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    for i in range(scale):
+        body = '\n\n'.join(record['content'] for record in _records(20, rng))
+        (skill_dir / 'references' / f"ref_{i + 1}.md").write_text(f"# Reference {i + 1}\n\n{body}\n",
+                                                                  encoding='utf-8')
+    return skill_dir
+
+
+def write_synthetic_input_dir(role: str, scale: int, inputs_dir: Path) -> Path:
+    """One synthetic skill ('skill') or a directory of 2 * scale skills ('skills'); reused if present"""
+    path = inputs_dir / f"{role}_{scale}x"
+    if path.exists():
+        return path
+    if role == 'skill':
+        return write_synthetic_skill(path, scale)
+    for i in range(2 * scale):
+        write_synthetic_skill(path / f"skill-{i + 1}", 1, name=f"skill-{i + 1}")
+    return path
+
+
+def benchmark_args(interface: Dict[str, Any], scale: int, inputs_dir: Path) -> Tuple[Optional[List[str]], str]:
+    """
+    Arguments for a run at the given scale, and a description of the input;
+    (None, reason) when the script's required arguments can't be synthesized
+    
+    Input paths are relative to the parent of inputs_dir, the test file's
+    directory; run_tests.py resolves them against it.
+    """
+    args: List[str] = []
+    inputs = []
+    for parameter in interface['parameters']:
+        if not parameter['required'] or parameter['role'] == 'flag':
+            continue
+        role = parameter['role']
+        fmt = parameter['format'] or interface['default_format'] or 'txt'
+        if role == 'literal':
+            value = parameter['name']
+        elif role == 'input':
+            if fmt in BINARY_FORMATS:
+                return None, f"no synthetic {fmt} input for <{parameter['name']}>"
+            value = write_synthetic_input(fmt, scale, inputs_dir).relative_to(inputs_dir.parent).as_posix()
+            inputs.append(f"{BENCHMARK_BASE_RECORDS * scale}-record {fmt}")
+        elif role in ('skill', 'skills'):
+            value = write_synthetic_input_dir(role, scale, inputs_dir).relative_to(inputs_dir.parent).as_posix()
+            inputs.append(f"{10 * scale}-section skill" if role == 'skill' else f"{2 * scale}-skill directory")
+        elif role == 'output':
+            # Relative: lands in the test's working directory
+            value = f"benchmark_output_{scale}x.{fmt if fmt not in BINARY_FORMATS else 'out'}"
+        else:
+            return None, f"no synthetic value for required argument <{parameter['name']}>"
+        args += [parameter['flag'], value] if parameter['flag'] else [value]
+    if not inputs:
+        return None, "no input file or directory parameter"
+    return args, ', '.join(inputs)
+
+
+def generate_benchmark_tests(structure: Dict[str, Any], inputs_dir: Path) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """
+    Benchmark tests at each of BENCHMARK_SCALES for scripts whose inputs can
+    be synthesized, writing the inputs to inputs_dir
+    
+    Returns:
+        (tests, reason each other script got none)
+    """
+    tests = []
+    skipped = {}
+    for script in sorted(structure['scripts']):
+        interface = structure['interfaces'][script]
+        if interface['cli'] is None:
+            skipped[script] = interface.get('error') or "no command-line arguments found"
+            continue
+        for scale in BENCHMARK_SCALES:
+            args, summary = benchmark_args(interface, scale, inputs_dir)
+            if args is None:
+                skipped[script] = summary
+                break
+            tests.append({
+                "name": f"Benchmark {script} ({scale}x input)",
+                "type": "benchmark",
+                "script": script,
+                "args": args,
+                "baseline_file": f"baselines/benchmarks/{Path(script).stem}_{scale}x.json",
+                "max_duration_ms": BENCHMARK_BUDGETS_MS[scale],
+                "description": f"Synthetic {summary} input; the first run records the baseline. "
+                               f"max_duration_ms is a suggested budget: tighten it once the baseline is known"
+            })
+    return tests, skipped
+
+
 def generate_integration_tests(structure: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Generate integration test templates"""
     skill_name = structure['skill_name']
@@ -120,10 +518,21 @@ def generate_regression_tests(structure: Dict[str, Any]) -> List[Dict[str, Any]]
     return tests
 
 
-def generate_test_template(skill_path: Path, output_format: str = 'json') -> Dict[str, Any]:
-    """Generate a complete test template for a skill"""
+def generate_test_template(skill_path: Path, output_format: str = 'json',
+                           inputs_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Generate a complete test template for a skill
+    
+    With inputs_dir, benchmark tests are added and their synthetic inputs
+    are written there; it should be a directory next to the test file.
+    """
     
     structure = analyze_skill_structure(skill_path)
+    unit_tests = generate_unit_tests(structure)
+    skipped = {}
+    if inputs_dir is not None:
+        benchmarks, skipped = generate_benchmark_tests(structure, inputs_dir)
+        unit_tests += benchmarks
     
     template = {
         "skill_name": structure['skill_name'],
@@ -131,7 +540,7 @@ def generate_test_template(skill_path: Path, output_format: str = 'json') -> Dic
         "test_version": "1.0",
         "description": f"Test cases for {structure['skill_name']} skill",
         
-        "unit_tests": generate_unit_tests(structure),
+        "unit_tests": unit_tests,
         "integration_tests": generate_integration_tests(structure),
         "regression_tests": generate_regression_tests(structure),
         
@@ -142,6 +551,13 @@ def generate_test_template(skill_path: Path, output_format: str = 'json') -> Dic
             "howto": "Fill in test details, then run with: run_tests.py <this-file>"
         }
     }
+    if inputs_dir is not None:
+        template["_instructions"]["benchmarks"] = (
+            f"Generated for scripts taking input files or skill directories, on synthetic inputs in "
+            f"{inputs_dir.name}/ next to this file at {', '.join(f'{scale}x' for scale in BENCHMARK_SCALES)}. "
+            f"Run with -j 1 and commit the baselines/benchmarks files the first run records")
+        if skipped:
+            template["_instructions"]["benchmarks_skipped"] = skipped
     
     return template
 
@@ -153,6 +569,7 @@ def save_template(template: Dict[str, Any], output_file: Path, output_format: st
         if output_format == 'json':
             json.dump(template, f, indent=2)
         elif output_format == 'yaml':
+            import yaml
             yaml.dump(template, f, default_flow_style=False, sort_keys=False)
     
     print(f"✅ Test template generated: {output_file}")
@@ -165,16 +582,19 @@ def save_template(template: Dict[str, Any], output_file: Path, output_format: st
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: generate_test_template.py <skill-path> [--output <output-file>] [--format json|yaml]")
+        print("Usage: generate_test_template.py <skill-path> [--output <output-file>] [--format json|yaml] "
+              "[--benchmarks]")
         print("\nExamples:")
         print("  generate_test_template.py /mnt/skills/public/pdf")
         print("  generate_test_template.py /mnt/skills/public/docx --output docx-tests.json")
         print("  generate_test_template.py ../my-skill --format yaml")
+        print("  generate_test_template.py ../my-skill --benchmarks   # writes several MB of synthetic inputs")
         sys.exit(1)
     
     skill_path = Path(sys.argv[1])
     output_file = None
     output_format = 'json'
+    benchmarks = False
     
     # Parse arguments
     i = 2
@@ -188,6 +608,9 @@ def main():
                 print(f"❌ Error: Invalid format '{output_format}'. Use 'json' or 'yaml'")
                 sys.exit(1)
             i += 2
+        elif sys.argv[i] == '--benchmarks':
+            benchmarks = True
+            i += 1
         else:
             print(f"Unknown argument: {sys.argv[i]}")
             sys.exit(1)
@@ -206,7 +629,17 @@ def main():
     print(f"📄 Output format: {output_format}")
     print()
     
-    template = generate_test_template(skill_path, output_format)
+    inputs_dir = output_file.resolve().parent / 'benchmark_inputs' if benchmarks else None
+    template = generate_test_template(skill_path, output_format, inputs_dir)
+    benchmark_count = sum(1 for test in template['unit_tests'] if test.get('type') == 'benchmark')
+    if inputs_dir is not None:
+        input_bytes = sum(path.stat().st_size for path in inputs_dir.rglob('*') if path.is_file()) \
+            if inputs_dir.exists() else 0
+        print(f"⏱️  {benchmark_count} benchmark case(s), {input_bytes / (1024 * 1024):.1f} MB of "
+              f"synthetic inputs in {inputs_dir}")
+        for script, reason in template['_instructions'].get('benchmarks_skipped', {}).items():
+            print(f"   └─ no benchmark for {script}: {reason}")
+        print()
     save_template(template, output_file, output_format)
 
 
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Prefork Script Runner
+
+Runs Python skill scripts without paying interpreter startup per test. A warm
+server process imports common modules once, then forks a child for every
+request and runs the script in it via runpy, with sys.argv, the working
+directory and stdio redirected as if it had been started on its own.
+
+run_tests.py starts the server when given --prefork; it listens on a Unix
+socket and exits when its stdin closes.
+
+Usage:
+    prefork_runner.py --serve <socket-path> [--preload mod1,mod2] [--path <dir>]
+"""
+
+import atexit
+import importlib
+import json
+import os
+import runpy
+import select
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+
+PREFORK_SUPPORTED = hasattr(os, 'fork') and hasattr(os, 'wait4') and hasattr(socket, 'AF_UNIX')
+
+# Imported by the server before it forks; skill scripts mostly use these
+DEFAULT_PRELOAD = (
+    'argparse', 'collections', 'csv', 'dataclasses', 'datetime', 'difflib', 'hashlib',
+    'io', 'itertools', 'json', 'logging', 'pathlib', 're', 'shutil', 'statistics',
+    'string', 'subprocess', 'tempfile', 'textwrap', 'typing', 'urllib.parse', 'xml.etree.ElementTree',
+)
+
+
+def is_python_script(path: Path) -> bool:
+    """
+    Whether a script can run in-process: a .py file, or an executable file
+    with a python shebang (run as its own process, a non-executable one
+    would fail, so it must not pass in the server)
+    """
+    if path.suffix == '.py':
+        return True
+    if not os.access(path, os.X_OK):
+        return False
+    try:
+        with open(path, 'rb') as f:
+            first_line = f.readline(256)
+    except OSError:
+        return False
+    return first_line.startswith(b'#!') and b'python' in first_line
+
+
+def _exit_code(exc: SystemExit) -> int:
+    """Process exit status for a SystemExit, as the interpreter computes it"""
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code & 0xFF
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def _exec_script(script: str, args: List[str], cwd: Optional[str], out_fd: int, err_fd: int) -> int:
+    """In the forked child: set up argv, cwd and stdio, run the script, return its exit code"""
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(out_fd, 1)
+    os.dup2(err_fd, 2)
+    if cwd:
+        os.chdir(cwd)
+    sys.argv = [script] + list(args)
+    # What the interpreter does for 'python script.py': the script's directory comes first
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+
+    try:
+        runpy.run_path(script, run_name='__main__')
+        code = 0
+    except SystemExit as e:
+        code = _exit_code(e)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    try:
+        atexit._run_exitfuncs()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    except BaseException:
+        pass
+    return code
+
+
+def run_forked(script: str, args: List[str], cwd: Optional[str], timeout: float) -> Dict[str, Any]:
+    """
+    Fork, run the script in the child and measure it like run_tests.run_measured
+
+    Peak RSS includes the modules the server preloaded, since the child
+    starts out sharing the server's memory.
+    """
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        start = time.monotonic()
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                code = _exec_script(script, args, cwd, out.fileno(), err.fileno())
+            finally:
+                os._exit(code)
+
+        timed_out = False
+
+        def expire(signum, frame):
+            nonlocal timed_out
+            timed_out = True
+            os.kill(pid, signal.SIGKILL)
+
+        signal.signal(signal.SIGALRM, expire)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            _, status, usage = os.wait4(pid, 0)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        duration_ms = (time.monotonic() - start) * 1000
+
+        if timed_out:
+            return {'timed_out': True}
+
+        out.seek(0)
+        err.seek(0)
+        stdout = out.read()
+        # ru_maxrss is kilobytes on Linux, bytes on macOS
+        rss_bytes = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+        return {
+            'returncode': os.waitstatus_to_exitcode(status),
+            'stdout': stdout.decode('utf-8', errors='replace'),
+            'stderr': err.read().decode('utf-8', errors='replace'),
+            'duration_ms': duration_ms,
+            'peak_rss_mb': rss_bytes / (1024 * 1024),
+            'output_bytes': len(stdout),
+        }
+
+
+def _handle(conn: socket.socket):
+    """In a per-request child of the server: run one script and send back the result"""
+    with conn, conn.makefile('rwb') as stream:
+        try:
+            request = json.loads(stream.readline())
+            response = run_forked(request['script'], request.get('args', []),
+                                  request.get('cwd'), request.get('timeout', 30))
+        except Exception as e:
+            response = {'error': f"{type(e).__name__}: {e}"}
+        stream.write(json.dumps(response).encode('utf-8') + b'\n')
+        stream.flush()
+
+
+def serve(socket_path: str, preload: Sequence[str], paths: Sequence[str] = ()):
+    """Preload modules, then fork a handler per connection until stdin closes"""
+    sys.path[1:1] = list(paths)
+    for name in preload:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"⚠️  Could not preload {name}: {e}", file=sys.stderr)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(128)
+    # Handlers are reaped automatically; each one waits for its own script child
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    print("ready", flush=True)
+    while True:
+        readable, _, _ = select.select([server, sys.stdin], [], [])
+        if sys.stdin in readable and not sys.stdin.buffer.read1(4096):
+            break
+        if server not in readable:
+            continue
+        conn, _ = server.accept()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        if os.fork() == 0:
+            server.close()
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            try:
+                _handle(conn)
+            finally:
+                os._exit(0)
+        conn.close()
+    server.close()
+
+
+class PreforkRunner:
+    """
+    Client side: starts the warm server and runs scripts through it
+
+    Safe to use from several threads; every run gets its own connection and
+    its own forked child.
+    """
+
+    def __init__(self, preload: Sequence[str] = DEFAULT_PRELOAD, paths: Sequence[str] = ()):
+        if not PREFORK_SUPPORTED:
+            raise RuntimeError("prefork runner needs fork() and Unix sockets")
+        self._dir = tempfile.mkdtemp(prefix='skill-prefork-')
+        self.socket_path = os.path.join(self._dir, 'server.sock')
+        command = [sys.executable, os.path.abspath(__file__), '--serve', self.socket_path,
+                   '--preload', ','.join(preload)]
+        for path in paths:
+            command += ['--path', str(path)]
+        self._proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        if self._proc.stdout.readline().strip() != b'ready':
+            self.close()
+            raise RuntimeError("prefork server failed to start")
+
+    def run(self, command: List[str], cwd: Optional[Path] = None, timeout: float = 30) -> Dict[str, Any]:
+        """
+        Run [script] + args in a forked child; same result dict and
+        TimeoutExpired behaviour as run_tests.run_measured
+        """
+        request = {'script': command[0], 'args': command[1:],
+                   'cwd': str(cwd) if cwd is not None else None, 'timeout': timeout}
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            # The server enforces the timeout; this only guards against a lost server
+            conn.settimeout(timeout + 10)
+            conn.connect(self.socket_path)
+            with conn.makefile('rwb') as stream:
+                stream.write(json.dumps(request).encode('utf-8') + b'\n')
+                stream.flush()
+                line = stream.readline()
+        if not line:
+            raise RuntimeError("prefork server closed the connection")
+        response = json.loads(line)
+        if response.get('timed_out'):
+            raise subprocess.TimeoutExpired(command, timeout)
+        if 'error' in response:
+            raise RuntimeError(f"prefork server: {response['error']}")
+        return response
+
+    def close(self):
+        if self._proc.poll() is None:
+            self._proc.stdin.close()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+                self._proc.wait()
+        self._proc.stdout.close()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def main():
+    args = sys.argv[1:]
+    socket_path = None
+    preload: List[str] = list(DEFAULT_PRELOAD)
+    paths: List[str] = []
+
+    i = 0
+    while i < len(args):
+        if args[i] == '--serve' and i + 1 < len(args):
+            socket_path = args[i + 1]
+            i += 2
+        elif args[i] == '--preload' and i + 1 < len(args):
+            preload = [name for name in args[i + 1].split(',') if name]
+            i += 2
+        elif args[i] == '--path' and i + 1 < len(args):
+            paths.append(args[i + 1])
+            i += 2
+        else:
+            print(f"Unknown argument: {args[i]}")
+            sys.exit(1)
+
+    if socket_path is None:
+        print("Usage: prefork_runner.py --serve <socket-path> [--preload mod1,mod2] [--path <dir>]")
+        print("\nStarted by run_tests.py --prefork; not meant to be run by hand.")
+        sys.exit(1)
+
+    serve(socket_path, preload, paths)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,41 +5,334 @@ Test Runner for Skills
 Executes test cases defined in JSON/YAML format and validates outputs.
 
 Usage:
-    run_tests.py <test-file> [--skill-path <path>] [--verbose]
+    run_tests.py <test-file> [--skill-path <path>] [--verbose] [-j N] [--record-history | --history <file>]
+
+With --record-history (or --history <file>) the run is recorded in a SQLite
+history file (see test_history.py for trend reports).
 
 Examples:
     run_tests.py tests/pdf-skill-tests.json
     run_tests.py tests/docx-tests.json --skill-path /mnt/skills/public/docx --verbose
+    run_tests.py tests/docx-tests.json -j 8
 """
 
 import sys
+import io
 import json
-import yaml
 from pathlib import Path
 from typing import Dict, List, Any, Optional
+import math
+import os
+import random
+import shlex
+import statistics
 import subprocess
 import tempfile
+import threading
+import time
+import contextlib
+import importlib
+import importlib.util
+import types
 import shutil
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from test_cache import DEFAULT_CACHE, TestCache, schedule, test_id
+from validate_test_results import SIMILARITY_THRESHOLD, SimilarityIndex, structural_diff
+# The prefork, executor, async backend, coverage, history and baseline store
+# modules are imported where they are used, so a run that needs none of them
+# (and the usage message) doesn't pay for asyncio, ssl, http.server, sqlite3...
+
+try:
+    import resource
+except ImportError:  # Windows: no per-child resource usage
+    resource = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: no reflinks
+    fcntl = None
+
+
+# Optional per-test limits: test field -> (metrics key, unit label)
+PERFORMANCE_LIMITS = {
+    'max_duration_ms': ('duration_ms', 'ms'),
+    'max_peak_rss_mb': ('peak_rss_mb', 'MB'),
+    'max_output_bytes': ('output_bytes', 'bytes'),
+    'max_peak_alloc_kb': ('peak_alloc_kb', 'KB'),
+}
+
+
+# expected_output keys that select a JSON structure comparison
+STRUCTURAL_KEYS = ('structural_match', 'structural_match_file', 'structural_match_store')
+# expected_output keys that select a token similarity comparison
+SIMILARITY_KEYS = ('similarity', 'similarity_files')
+
+# Benchmark defaults (overridable per test)
+BENCHMARK_WARMUP = 2
+BENCHMARK_RUNS = 10
+BENCHMARK_CONFIDENCE = 0.95
+BENCHMARK_MAX_SLOWDOWN = 0.10
+BOOTSTRAP_RESAMPLES = 2000
+
+# Linux ioctl that makes dst share src's extents (copy-on-write), on
+# filesystems that support it (btrfs, XFS, overlayfs on those)
+FICLONE = 0x40049409
+
+# Fixture materialization modes, in fallback order. A hardlink shares the
+# checked-in file, so a step writing to it in place would change the
+# fixture itself: hardlinks are only used when asked for.
+FIXTURE_MODES = {
+    'auto': ('reflink', 'copy'),
+    'reflink': ('reflink', 'copy'),
+    'hardlink': ('hardlink', 'copy'),
+    'copy': ('copy',),
+}
 
 
 class TestResult:
     """Represents the result of a single test case"""
-    def __init__(self, test_name: str, passed: bool, message: str = "", actual: Any = None, expected: Any = None):
+    def __init__(self, test_name: str, passed: bool, message: str = "", actual: Any = None, expected: Any = None,
+                 metrics: Optional[Dict[str, float]] = None):
         self.test_name = test_name
         self.passed = passed
         self.message = message
         self.actual = actual
         self.expected = expected
+        self.metrics = metrics
+        self.section: Optional[str] = None
+        self.elapsed_ms: Optional[float] = None
+
+
+def mann_whitney_p(a: List[float], b: List[float]) -> float:
+    """Two-sided Mann-Whitney U test p-value (normal approximation, tie-corrected)"""
+    combined = sorted((value, group) for group, values in ((0, a), (1, b)) for value in values)
+    n1, n2 = len(a), len(b)
+    n = n1 + n2
+    
+    # Average ranks over ties
+    ranks = [0.0] * n
+    tie_term = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        t = j - i + 1
+        tie_term += t ** 3 - t
+        i = j + 1
+    
+    rank_sum_a = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum_a - n1 * (n1 + 1) / 2
+    mean_u = n1 * n2 / 2
+    var_u = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if var_u <= 0:
+        return 1.0
+    z = (abs(u - mean_u) - 0.5) / math.sqrt(var_u)
+    return min(1.0, math.erfc(max(z, 0) / math.sqrt(2)))
+
+
+def bootstrap_ratio_ci(current: List[float], baseline: List[float], confidence: float,
+                       resamples: int = BOOTSTRAP_RESAMPLES, seed: int = 0) -> tuple:
+    """Percentile bootstrap interval for median(current) / median(baseline)"""
+    rng = random.Random(seed)
+    ratios = sorted(
+        statistics.median(rng.choices(current, k=len(current)))
+        / statistics.median(rng.choices(baseline, k=len(baseline)))
+        for _ in range(resamples)
+    )
+    tail = (1 - confidence) / 2
+    low = ratios[int(tail * (resamples - 1))]
+    high = ratios[int(math.ceil((1 - tail) * (resamples - 1)))]
+    return low, high
+
+
+def script_command(command: List[str]) -> List[str]:
+    """
+    Command line for [script] + args: .py files run with this interpreter,
+    as they do in the prefork server and under the line tracer, so they
+    needn't be executable; anything else runs directly
+    """
+    if command and command[0].endswith('.py'):
+        return [sys.executable] + command
+    return command
+
+
+def run_measured(command: List[str], cwd: Optional[Path] = None, timeout: float = 30) -> Dict[str, Any]:
+    """
+    Run a command and measure wall time, peak RSS and output size.
+    
+    Wall time uses a monotonic clock. Peak RSS comes from the child's own
+    rusage (os.wait4), so concurrent tests don't see each other's memory.
+    
+    Returns: dict with returncode, stdout, stderr, duration_ms, peak_rss_mb
+             (None where unavailable) and output_bytes (stdout size)
+    Raises: subprocess.TimeoutExpired if the command runs past the timeout
+    """
+    start = time.monotonic()
+    proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd)
+    
+    # Drain both pipes in the background so the child can't block on a full pipe
+    chunks = {'stdout': [], 'stderr': []}
+    readers = [threading.Thread(target=lambda name=name, pipe=pipe: chunks[name].append(pipe.read()), daemon=True)
+               for name, pipe in (('stdout', proc.stdout), ('stderr', proc.stderr))]
+    for reader in readers:
+        reader.start()
+    
+    timed_out = threading.Event()
+    
+    def kill():
+        timed_out.set()
+        proc.kill()
+    
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        if resource is not None and hasattr(os, 'wait4'):
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is kilobytes on Linux, bytes on macOS
+            rss_bytes = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+            peak_rss_mb = rss_bytes / (1024 * 1024)
+        else:
+            proc.wait()
+            peak_rss_mb = None
+        duration_ms = (time.monotonic() - start) * 1000
+    finally:
+        timer.cancel()
+    
+    for reader in readers:
+        reader.join()
+    proc.stdout.close()
+    proc.stderr.close()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout)
+    
+    stdout = b''.join(chunks['stdout'])
+    return {
+        'returncode': proc.returncode,
+        'stdout': stdout.decode('utf-8', errors='replace'),
+        'stderr': b''.join(chunks['stderr']).decode('utf-8', errors='replace'),
+        'duration_ms': duration_ms,
+        'peak_rss_mb': peak_rss_mb,
+        'output_bytes': len(stdout),
+    }
+
+
+def clone_file(src: Path, dst: Path, methods: tuple) -> str:
+    """
+    Create dst from src using the first method that works
+    
+    Returns:
+        The method used: 'reflink', 'hardlink' or 'copy'
+    """
+    for method in methods:
+        try:
+            if method == 'reflink':
+                if fcntl is None:
+                    continue
+                with open(src, 'rb') as src_f, open(dst, 'wb') as dst_f:
+                    fcntl.ioctl(dst_f.fileno(), FICLONE, src_f.fileno())
+                shutil.copystat(src, dst)
+            elif method == 'hardlink':
+                os.link(src, dst)
+            else:
+                shutil.copy2(src, dst)
+            return method
+        except OSError:
+            # Unsupported filesystem, cross-device link, ...: try the next one
+            if method == 'reflink' and dst.exists():
+                dst.unlink()
+    raise OSError(f"Could not materialize fixture {src}")
+
+
+def materialize_fixture(src: Path, dst: Path, mode: str = 'auto') -> Dict[str, int]:
+    """
+    Reproduce a fixture file or directory tree at dst without copying data
+    where possible
+    
+    Returns:
+        Number of files created per method
+    """
+    methods = FIXTURE_MODES[mode]
+    counts: Dict[str, int] = {}
+    
+    if src.is_dir():
+        for root, dirs, files in os.walk(src):
+            target = dst / Path(root).relative_to(src)
+            target.mkdir(parents=True, exist_ok=True)
+            for name in files:
+                method = clone_file(Path(root, name), target / name, methods)
+                counts[method] = counts.get(method, 0) + 1
+    else:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        method = clone_file(src, dst, methods)
+        counts[method] = 1
+    return counts
 
 
 class SkillTestRunner:
     """Runs test cases against a skill"""
     
-    def __init__(self, test_file: Path, skill_path: Optional[Path] = None, verbose: bool = False):
+    # (test file key, section heading, runner method name), in execution order
+    SECTIONS = [
+        ('unit_tests', "📦 Unit Tests", 'run_unit_test'),
+        ('integration_tests', "🔗 Integration Tests", 'run_integration_test'),
+        ('regression_tests', "🔄 Regression Tests", 'run_regression_test'),
+    ]
+    
+    def __init__(self, test_file: Path, skill_path: Optional[Path] = None, verbose: bool = False,
+                 jobs: int = 1, history_file: Optional[Path] = None, cache_file: Optional[Path] = None,
+                 failed_first: bool = False, stepwise: bool = False, keywords: Optional[List[str]] = None,
+                 preload: Optional[List[str]] = None, cassette_mode: Optional[str] = None,
+                 concurrency: Optional[int] = None, coverage_file: Optional[Path] = None,
+                 record_coverage: bool = False, impacted: bool = False):
         self.test_file = test_file
         self.skill_path = skill_path
         self.verbose = verbose
+        self.jobs = max(1, jobs)
+        self.history_file = history_file
+        self.cache_file = cache_file
+        self.failed_first = failed_first
+        self.stepwise = stepwise
+        self.keywords = keywords or []
+        self._stepwise_stop: Optional[tuple] = None
+        # Modules for the warm prefork server; None runs every script as its own process
+        self.preload = preload
+        self._prefork: Optional['PreforkRunner'] = None
+        # Regression test executor, from the test file's "executor" config
+        self.cassette_mode = cassette_mode
+        self._executor_config: Optional[Dict[str, Any]] = None
+        self._executor_instance: Optional['Executor'] = None
+        # Async backend for regression tests: outputs are requested up front,
+        # keyed by id() of the test dict, and awaited when each test runs
+        self.concurrency = concurrency
+        self._backend: Optional['AsyncBackend'] = None
+        self._prefetched: Dict[int, Any] = {}
+        # Modules under test for function tests, imported once per run
+        self._modules: Dict[str, Any] = {}
+        self._module_lock = threading.Lock()
+        # tracemalloc is process-wide: one tracked call at a time
+        self._trace_lock = threading.Lock()
+        # sys.stdout is process-wide too: a function test swaps it out while
+        # it runs, so report printing waits for the call to finish
+        self._output_lock = threading.Lock()
+        # Test impact analysis (see test_impact.py): with record_coverage,
+        # each test collects the files and lines it ran in _coverage.files
+        # (per thread, since a test runs on one thread)
+        self.coverage_file = coverage_file
+        self.record_coverage = record_coverage
+        self.impacted = impacted
+        self._coverage = threading.local()
+        self._covered: Dict[str, tuple] = {}
+        self._module_coverage: Dict[str, Dict[str, Any]] = {}
         self.results: List[TestResult] = []
+        self._stores: Dict[Path, 'BaselineStore'] = {}
+        self._similarity_indexes: Dict[tuple, SimilarityIndex] = {}
+        self._lock = threading.Lock()
         
     def load_tests(self) -> Dict[str, Any]:
         """Load test cases from JSON or YAML file"""
@@ -47,35 +340,172 @@ class SkillTestRunner:
             if self.test_file.suffix == '.json':
                 return json.load(f)
             elif self.test_file.suffix in ['.yaml', '.yml']:
+                import yaml
                 return yaml.safe_load(f)
             else:
                 raise ValueError(f"Unsupported test file format: {self.test_file.suffix}")
     
-    def run_unit_test(self, test: Dict[str, Any]) -> TestResult:
+    def run_unit_test(self, test: Dict[str, Any], cwd: Optional[Path] = None) -> TestResult:
         """Run a unit test (typically testing a single script or function)"""
         test_name = test.get('name', 'Unnamed test')
         test_type = test.get('type', 'script')
         
         if test_type == 'script':
-            return self._run_script_test(test)
+            return self._run_script_test(test, cwd)
+        elif test_type == 'benchmark':
+            return self._run_benchmark_test(test, cwd)
         elif test_type == 'function':
             return self._run_function_test(test)
         else:
             return TestResult(test_name, False, f"Unknown unit test type: {test_type}")
     
-    def run_integration_test(self, test: Dict[str, Any]) -> TestResult:
-        """Run an integration test (testing a complete workflow)"""
+    def run_integration_test(self, test: Dict[str, Any], cwd: Optional[Path] = None) -> TestResult:
+        """
+        Run an integration test (testing a complete workflow)
+        
+        Each test gets a fresh sandbox directory. Setup materializes the
+        fixtures into it and runs setup steps, then the workflow steps run
+        in order with the sandbox as working directory. Cleanup steps run
+        and the sandbox is removed whether or not the workflow passed.
+        Descriptive steps (no 'script' or 'command') are skipped.
+        """
         test_name = test.get('name', 'Unnamed test')
+        setup = test.get('setup', {}) or {}
+        cleanup = test.get('cleanup', {}) or {}
+        steps = test.get('steps', [])
+        
+        if not any(self._is_executable(step)
+                   for step in steps + setup.get('steps', []) + cleanup.get('steps', [])):
+            return TestResult(test_name, True, "No executable steps (descriptive workflow only)")
         
-        # Integration tests simulate a complete user interaction
-        # This would typically involve:
-        # 1. Setting up test environment
-        # 2. Running the skill workflow
-        # 3. Validating outputs
+        timings = []
+        failure = None
+        start = time.perf_counter()
         
-        return TestResult(test_name, True, "Integration test framework placeholder")
+        with tempfile.TemporaryDirectory(prefix='skill-test-', dir=self._sandbox_parent(setup)) as tmp:
+            sandbox = Path(tmp)
+            try:
+                failure = self._run_setup(setup, sandbox, timings)
+                if failure is None:
+                    failure = self._run_steps(steps, sandbox, timings)
+                if failure is None:
+                    failure = self._check_workflow_output(test.get('expected_output'), sandbox)
+            finally:
+                cleanup_failure = self._run_steps(cleanup.get('steps', []), sandbox, timings, label='cleanup')
+            failure = failure or cleanup_failure
+        
+        metrics = {'duration_ms': (time.perf_counter() - start) * 1000, 'peak_rss_mb': None, 'output_bytes': None}
+        step_report = "\n     └─ ".join(f"{label}: {ms:.1f} ms" for label, ms in timings)
+        if failure:
+            return TestResult(test_name, False, f"{failure}\n     └─ {step_report}", metrics=metrics)
+        return TestResult(test_name, True, f"Workflow completed\n     └─ {step_report}", metrics=metrics)
+    
+    def _is_executable(self, step: Any) -> bool:
+        return isinstance(step, dict) and ('script' in step or 'command' in step)
+    
+    def _sandbox_parent(self, setup: Dict[str, Any]) -> Optional[str]:
+        """
+        Where to create the sandbox: the system temp directory, unless it is
+        on a different filesystem than the fixtures (hardlinks and reflinks
+        cannot cross devices), in which case next to the test file
+        """
+        if not setup.get('fixtures'):
+            return None
+        try:
+            if os.stat(tempfile.gettempdir()).st_dev != os.stat(self.test_file.resolve().parent).st_dev:
+                return str(self.test_file.resolve().parent)
+        except OSError:
+            pass
+        return None
     
-    def run_regression_test(self, test: Dict[str, Any]) -> TestResult:
+    def _run_setup(self, setup: Dict[str, Any], sandbox: Path, timings: List[tuple]) -> Optional[str]:
+        """Materialize fixtures, then run setup steps; return a failure message or None"""
+        mode = setup.get('fixture_mode', 'auto')
+        if mode not in FIXTURE_MODES:
+            return f"Unknown fixture_mode: {mode} (use one of {', '.join(FIXTURE_MODES)})"
+        
+        start = time.perf_counter()
+        counts: Dict[str, int] = {}
+        for fixture in setup.get('fixtures', []):
+            if isinstance(fixture, str):
+                fixture = {'source': fixture}
+            if not (isinstance(fixture, dict) and isinstance(fixture.get('source'), str)
+                    and isinstance(fixture.get('dest', ''), str)):
+                return f"Invalid fixture {fixture!r}: needs a 'source' path and an optional 'dest' path"
+            source = self.test_file.parent / fixture['source']
+            if not source.exists():
+                return f"Fixture not found: {source}"
+            dest = sandbox / fixture.get('dest', Path(fixture['source']).name)
+            try:
+                for method, count in materialize_fixture(source, dest, mode).items():
+                    counts[method] = counts.get(method, 0) + count
+            except OSError as e:
+                return f"Fixture setup failed: {e}"
+        if counts:
+            methods = ', '.join(f"{count} {method}" for method, count in sorted(counts.items()))
+            timings.append((f"fixtures ({methods})", (time.perf_counter() - start) * 1000))
+        
+        return self._run_steps(setup.get('steps', []), sandbox, timings, label='setup')
+    
+    def _run_steps(self, steps: List[Any], sandbox: Path, timings: List[tuple],
+                   label: str = 'step') -> Optional[str]:
+        """Run executable steps in order, stopping at the first failure"""
+        for i, step in enumerate(steps, 1):
+            if not self._is_executable(step):
+                continue
+            command = step.get('command', [])
+            if isinstance(command, str):
+                # Split like a shell would, but never run one
+                try:
+                    command = shlex.split(command)
+                except ValueError as e:
+                    return f"{label} {i}: cannot parse command {command!r}: {e}"
+            if 'script' not in step and not (isinstance(command, list) and command
+                                             and all(isinstance(part, str) for part in command)):
+                return f"{label} {i}: command must be a string or a non-empty list of strings, got {command!r}"
+            name = f"{label} {i}: {step.get('action') or step.get('script') or ' '.join(command)}"
+            
+            if 'script' in step:
+                script = self._script_path(step['script'])
+                if not script.exists():
+                    return f"{name}: script not found: {script}"
+                command = [str(script.resolve())] + self._resolve_args(step.get('args', []), sandbox)
+            
+            try:
+                result = self._run_command(command, cwd=sandbox, timeout=step.get('timeout', 30))
+            except subprocess.TimeoutExpired:
+                timings.append((name, step.get('timeout', 30) * 1000))
+                return f"{name}: timed out"
+            except OSError as e:
+                return f"{name}: could not run: {e}"
+            timings.append((name, result['duration_ms']))
+            
+            expected_exit_code = step.get('expected_exit_code', 0)
+            if result['returncode'] != expected_exit_code:
+                detail = result['stderr'].strip().splitlines()[-1:] or ['']
+                return (f"{name}: exit code {result['returncode']}, expected {expected_exit_code}"
+                        f"{' (' + detail[0] + ')' if detail[0] else ''}")
+            if not self._compare_outputs(result['stdout'].strip(), step.get('expected_output')):
+                return f"{name}: {self._mismatch_message(result['stdout'], step.get('expected_output'), 'output mismatch')}"
+            missing = [path for path in step.get('expected_files', []) if not (sandbox / path).exists()]
+            if missing:
+                return f"{name}: expected files missing: {', '.join(missing)}"
+        return None
+    
+    def _check_workflow_output(self, expected: Any, sandbox: Path) -> Optional[str]:
+        """Check a workflow's expected_output file, if it names one"""
+        if not isinstance(expected, dict) or expected.get('type') != 'file' or 'path' not in expected:
+            return None
+        path = sandbox / expected['path']
+        if not path.exists():
+            return f"Expected output file missing: {expected['path']}"
+        if 'contains' in expected or 'pattern' in expected:
+            content = path.read_text(encoding='utf-8', errors='replace')
+            if not self._compare_outputs(content, expected):
+                return f"Output file {expected['path']} does not match expected content"
+        return None
+    
+    def run_regression_test(self, test: Dict[str, Any], cwd: Optional[Path] = None) -> TestResult:
         """Run a regression test (comparing against known good outputs)"""
         test_name = test.get('name', 'Unnamed test')
         
@@ -83,24 +513,56 @@ class SkillTestRunner:
         input_data = test.get('input', {})
         expected_output = test.get('expected_output', None)
         baseline_file = test.get('baseline_file', None)
+        baseline_store = test.get('baseline_store', None)
+        baseline_files = test.get('baseline_files', None)
+        structural = test.get('validation_method') == 'structural_match'
         
-        if baseline_file:
+        if baseline_store:
+            # Resolve through the store manifest: baseline_name (default: the
+            # test name) at baseline_version (default: the current version)
+            reference = {'store': baseline_store, 'name': test.get('baseline_name', test_name),
+                         'version': test.get('baseline_version')}
+            if structural:
+                expected_output = {'structural_match_store': reference}
+            else:
+                try:
+                    expected_output = self._baseline_store(baseline_store).read_text(
+                        reference['name'], reference['version'])
+                except ValueError as e:
+                    return TestResult(test_name, False, str(e))
+        elif baseline_file and structural:
+            # Streamed from disk during comparison rather than read here
+            expected_output = {'structural_match_file': baseline_file}
+        elif baseline_file:
             # Load baseline and compare
             baseline_path = self.test_file.parent / baseline_file
             if baseline_path.exists():
                 with open(baseline_path, 'r') as f:
                     expected_output = f.read()
         
+        if test.get('validation_method') == 'similarity':
+            # Score against every baseline given; the closest one counts
+            baselines = expected_output if isinstance(expected_output, list) else \
+                [expected_output] if isinstance(expected_output, str) else []
+            expected_output = {'similarity': baselines, 'similarity_files': baseline_files or [],
+                               'threshold': test.get('similarity_threshold', SIMILARITY_THRESHOLD)}
+        
+        from executors import ExecutorError
+        
         # Run test and compare
-        actual_output = self._execute_test(input_data)
+        try:
+            actual_output = self._execute_test(input_data, test)
+        except ExecutorError as e:
+            return TestResult(test_name, False, f"Execution failed: {e}")
         
         if self._compare_outputs(actual_output, expected_output):
             return TestResult(test_name, True, "Output matches expected")
         else:
-            return TestResult(test_name, False, "Output differs from expected", 
+            message = self._mismatch_message(actual_output, expected_output, "Output differs from expected")
+            return TestResult(test_name, False, message, 
                             actual=actual_output, expected=expected_output)
     
-    def _run_script_test(self, test: Dict[str, Any]) -> TestResult:
+    def _run_script_test(self, test: Dict[str, Any], cwd: Optional[Path] = None) -> TestResult:
         """Execute a script and validate its output"""
         test_name = test.get('name', 'Unnamed test')
         script_path = test.get('script', None)
@@ -111,53 +573,480 @@ class SkillTestRunner:
         if not script_path:
             return TestResult(test_name, False, "No script path specified")
         
-        # Construct full script path
-        if self.skill_path:
-            full_script_path = self.skill_path / 'scripts' / script_path
-        else:
-            full_script_path = Path(script_path)
+        full_script_path = self._script_path(script_path)
         
         if not full_script_path.exists():
             return TestResult(test_name, False, f"Script not found: {full_script_path}")
         
         # Execute script
         try:
-            result = subprocess.run(
-                [str(full_script_path)] + args,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            result = self._run_command([str(full_script_path.resolve())] + self._resolve_args(args),
+                                       cwd=cwd, timeout=30, prefork=True)
+            metrics = {key: result[key] for key in ('duration_ms', 'peak_rss_mb', 'output_bytes')}
             
             # Check exit code
-            if result.returncode != expected_exit_code:
+            if result['returncode'] != expected_exit_code:
                 return TestResult(test_name, False, 
-                                f"Exit code mismatch: expected {expected_exit_code}, got {result.returncode}")
+                                f"Exit code mismatch: expected {expected_exit_code}, got {result['returncode']}",
+                                metrics=metrics)
             
             # Check output if specified
             if expected_output is not None:
-                actual_output = result.stdout.strip()
+                actual_output = result['stdout'].strip()
                 if not self._compare_outputs(actual_output, expected_output):
-                    return TestResult(test_name, False, "Output mismatch",
-                                    actual=actual_output, expected=expected_output)
+                    return TestResult(test_name, False, self._mismatch_message(actual_output, expected_output),
+                                    actual=actual_output, expected=expected_output, metrics=metrics)
             
-            return TestResult(test_name, True, "Script executed successfully")
+            # Check performance limits if specified
+            exceeded = self._check_limits(test, metrics)
+            if exceeded:
+                return TestResult(test_name, False, "; ".join(exceeded), metrics=metrics)
+            
+            return TestResult(test_name, True, "Script executed successfully", metrics=metrics)
             
         except subprocess.TimeoutExpired:
             return TestResult(test_name, False, "Script execution timed out")
         except Exception as e:
             return TestResult(test_name, False, f"Script execution failed: {str(e)}")
     
+    def _run_command(self, command: List[str], cwd: Optional[Path] = None, timeout: float = 30,
+                     prefork: bool = False) -> Dict[str, Any]:
+        """
+        Run a test's command and measure it (see run_measured)
+        
+        While recording coverage, Python scripts run under the line tracer
+        and other commands count as depending on their whole file. Otherwise,
+        with prefork and --prefork, Python scripts run in the warm server.
+        """
+        from prefork_runner import is_python_script
+        
+        script = Path(command[0])
+        files = getattr(self._coverage, 'files', None)
+        if files is not None and is_python_script(script):
+            from test_impact import merge_coverage, read_trace, trace_command
+            fd, output = tempfile.mkstemp(prefix='skill-trace-', suffix='.json')
+            os.close(fd)
+            try:
+                result = run_measured(trace_command(command, self._coverage_roots(), output), cwd, timeout)
+                merge_coverage(files, read_trace(output) or {str(script): None})
+            finally:
+                os.unlink(output)
+            return result
+        if files is not None and script.is_file():
+            from test_impact import merge_coverage
+            merge_coverage(files, {str(script.resolve()): None})
+        if prefork and self.preload is not None and is_python_script(script):
+            return self._prefork_runner().run(command, cwd=cwd, timeout=timeout)
+        return run_measured(script_command(command), cwd=cwd, timeout=timeout)
+    
+    def _coverage_roots(self) -> List[Path]:
+        """Where covered files are recorded: the skill's git work tree, else the skill or test directory"""
+        from test_impact import git_root
+        
+        base = (self.skill_path or self.test_file.parent).resolve()
+        return [git_root(base) or base]
+    
+    def _prefork_runner(self) -> 'PreforkRunner':
+        """Warm server for in-process script runs, started on first use"""
+        from prefork_runner import PreforkRunner
+        
+        with self._lock:
+            if self._prefork is None:
+                paths = [self.skill_path / 'scripts'] if self.skill_path else []
+                self._prefork = PreforkRunner(self.preload, paths)
+            return self._prefork
+    
+    def _resolve_args(self, args: List[Any], sandbox: Optional[Path] = None) -> List[Any]:
+        """
+        Pass arguments naming an existing file or directory as absolute paths
+        
+        With -j N each test runs in its own empty directory, so a relative
+        input path has to mean the same thing wherever the test runs. It is
+        looked up next to the test file, then in the runner's working
+        directory (where a -j 1 run would find it). In a workflow sandbox,
+        files already in the sandbox (fixtures, earlier steps' output) win.
+        """
+        bases = [self.test_file.parent] if sandbox is not None else [self.test_file.parent, Path.cwd()]
+        resolved = []
+        for arg in args:
+            if isinstance(arg, str) and arg and not os.path.isabs(arg) \
+                    and not (sandbox is not None and (sandbox / arg).exists()):
+                arg = next((str((base / arg).resolve()) for base in bases if (base / arg).exists()), arg)
+            resolved.append(arg)
+        return resolved
+    
+    def _script_path(self, script_path: str) -> Path:
+        """Resolve a test's script path against --skill-path"""
+        if self.skill_path:
+            return self.skill_path / 'scripts' / script_path
+        return Path(script_path)
+    
+    def _run_benchmark_test(self, test: Dict[str, Any], cwd: Optional[Path] = None) -> TestResult:
+        """
+        Time a script over repeated runs and compare with a stored baseline
+        
+        The slowdown is reported as a bootstrap interval on the ratio of
+        medians. The test fails only when a Mann-Whitney U test finds a
+        significant difference and the whole interval lies above
+        1 + max_slowdown. Missing baselines are recorded from this run.
+        """
+        test_name = test.get('name', 'Unnamed test')
+        script_path = test.get('script', None)
+        args = test.get('args', [])
+        expected_exit_code = test.get('expected_exit_code', 0)
+        warmup = test.get('warmup', BENCHMARK_WARMUP)
+        runs = test.get('runs', BENCHMARK_RUNS)
+        confidence = test.get('confidence', BENCHMARK_CONFIDENCE)
+        max_slowdown = test.get('max_slowdown', BENCHMARK_MAX_SLOWDOWN)
+        baseline_file = test.get('baseline_file', None)
+        
+        if not script_path:
+            return TestResult(test_name, False, "No script path specified")
+        if not baseline_file:
+            return TestResult(test_name, False, "No baseline_file specified for benchmark")
+        if runs < 3:
+            return TestResult(test_name, False, "Benchmark needs at least 3 runs")
+        
+        full_script_path = self._script_path(script_path)
+        if not full_script_path.exists():
+            return TestResult(test_name, False, f"Script not found: {full_script_path}")
+        
+        args = self._resolve_args(args)
+        script = full_script_path.resolve()
+        command = script_command([str(script)] + args)
+        files = getattr(self._coverage, 'files', None)
+        if files is not None:
+            # Tracing would distort the timings: depend on the whole script instead
+            from test_impact import merge_coverage
+            merge_coverage(files, {str(script): None})
+        samples = []
+        # Memory and output limits apply to the worst timed run
+        peak_rss_mb = output_bytes = None
+        try:
+            for i in range(warmup + runs):
+                result = run_measured(command, cwd=cwd, timeout=30)
+                if result['returncode'] != expected_exit_code:
+                    return TestResult(test_name, False,
+                                    f"Exit code mismatch: expected {expected_exit_code}, got {result['returncode']}")
+                if i >= warmup:
+                    samples.append(result['duration_ms'])
+                    if result['peak_rss_mb'] is not None:
+                        peak_rss_mb = max(peak_rss_mb or 0, result['peak_rss_mb'])
+                    output_bytes = max(output_bytes or 0, result['output_bytes'])
+        except subprocess.TimeoutExpired:
+            return TestResult(test_name, False, "Script execution timed out")
+        except OSError as e:
+            return TestResult(test_name, False, f"Script execution failed: {e}")
+        
+        metrics = {'duration_ms': statistics.median(samples), 'peak_rss_mb': peak_rss_mb,
+                   'output_bytes': output_bytes}
+        baseline_path = self.test_file.parent / baseline_file
+        
+        # Limits apply with or without a baseline: max_duration_ms to the median,
+        # max_peak_rss_mb and max_output_bytes to the largest timed run
+        exceeded = self._check_limits(test, metrics)
+        if exceeded:
+            return TestResult(test_name, False, "; ".join(exceeded), metrics=metrics)
+        
+        if not baseline_path.exists():
+            try:
+                self._write_baseline(baseline_path, samples)
+            except OSError as e:
+                return TestResult(test_name, False, f"Could not record baseline {baseline_path}: {e}",
+                                metrics=metrics)
+            return TestResult(test_name, True, f"Baseline recorded: {baseline_path}", metrics=metrics)
+        
+        # A hand-edited or truncated baseline fails this test, not the run
+        try:
+            with open(baseline_path, 'r') as f:
+                data = json.load(f)
+            baseline = data.get('samples_ms') if isinstance(data, dict) else None
+            if not (isinstance(baseline, list) and baseline and all(
+                    isinstance(x, (int, float)) and not isinstance(x, bool) and 0 < x < math.inf
+                    for x in baseline)):
+                raise ValueError("expected a non-empty 'samples_ms' list of positive numbers")
+        except (OSError, ValueError) as e:
+            return TestResult(test_name, False, f"Invalid baseline {baseline_path}: {e} (delete it to re-baseline)",
+                            metrics=metrics)
+        
+        p_value = mann_whitney_p(samples, baseline)
+        low, high = bootstrap_ratio_ci(samples, baseline, confidence)
+        ratio = statistics.median(samples) / statistics.median(baseline)
+        significant = p_value < 1 - confidence
+        
+        if significant and low > 1:
+            verdict = "slowdown"
+        elif significant and high < 1:
+            verdict = "speedup"
+        else:
+            verdict = "no significant change"
+        
+        message = (f"{verdict}: {ratio:.2f}x baseline median "
+                   f"({confidence:.0%} CI {low:.2f}x-{high:.2f}x, p={p_value:.3f}, "
+                   f"{statistics.median(samples):.1f} ms vs {statistics.median(baseline):.1f} ms)")
+        
+        if significant and low > 1 + max_slowdown:
+            return TestResult(test_name, False, f"{message} exceeds max_slowdown {max_slowdown:.0%}",
+                            metrics=metrics)
+        return TestResult(test_name, True, message, metrics=metrics)
+    
+    def _write_baseline(self, path: Path, samples: List[float]):
+        """Write benchmark samples to a temp file next to path, then rename it into place"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({
+                    'samples_ms': samples,
+                    'median_ms': statistics.median(samples),
+                    'recorded': datetime.now().isoformat(timespec='seconds'),
+                }, f, indent=2)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    
+    def _check_limits(self, test: Dict[str, Any], metrics: Dict[str, Any]) -> List[str]:
+        """Return a message for every performance limit the metrics exceed"""
+        exceeded = []
+        for field, (key, unit) in PERFORMANCE_LIMITS.items():
+            limit = test.get(field)
+            if limit is None:
+                continue
+            measured = metrics.get(key)
+            if measured is None:
+                exceeded.append(f"{field} set but {key} can't be measured on this platform")
+            elif measured > limit:
+                exceeded.append(f"{key} {measured:.1f} {unit} exceeds {field} {limit}")
+        return exceeded
+    
     def _run_function_test(self, test: Dict[str, Any]) -> TestResult:
-        """Test a specific function within a module"""
+        """
+        Call a function in-process and check its return value
+        
+        The module is imported once per run; each call is timed and, with
+        track_allocations, its peak traced allocation is measured.
+        """
         test_name = test.get('name', 'Unnamed test')
-        # Placeholder for function testing
-        return TestResult(test_name, True, "Function test placeholder")
+        module_name = test.get('module')
+        function_name = test.get('function')
+        
+        if not module_name or not function_name:
+            return TestResult(test_name, False, "Function tests need 'module' and 'function'")
+        
+        files = getattr(self._coverage, 'files', None)
+        if files is not None:
+            from test_impact import LineTracer, merge_coverage
+        tracer = LineTracer(self._coverage_roots(), exclude=[__file__]) if files is not None else None
+        if tracer is not None:
+            tracer.start()
+        try:
+            return self._call_function(test, test_name, module_name, function_name)
+        finally:
+            if tracer is not None:
+                tracer.stop()
+                merge_coverage(files, tracer.coverage())
+                merge_coverage(files, self._module_coverage.get(module_name, {}))
     
-    def _execute_test(self, input_data: Dict[str, Any]) -> Any:
-        """Execute a test with given input data (placeholder for actual execution)"""
-        # This would interface with Claude or run scripts
-        return None
+    def _call_function(self, test: Dict[str, Any], test_name: str, module_name: str,
+                       function_name: str) -> TestResult:
+        args = test.get('args', [])
+        kwargs = test.get('kwargs', {})
+        repeat = max(1, test.get('repeat', 1))
+        expected_exception = test.get('expected_exception')
+        import inspect
+        
+        try:
+            function = self._load_module(module_name)
+            for attribute in function_name.split('.'):
+                # Class.method of an instance method: call it on an instance
+                # built from init_args/init_kwargs
+                if isinstance(function, type) and isinstance(
+                        inspect.getattr_static(function, attribute, None), types.FunctionType):
+                    function = function(*test.get('init_args', []), **test.get('init_kwargs', {}))
+                function = getattr(function, attribute)
+        except KeyboardInterrupt:
+            raise
+        except BaseException as e:
+            return TestResult(test_name, False, f"Cannot load {module_name}:{function_name}: {e}")
+        
+        durations = []
+        peak_alloc_kb = None
+        # The callee's own output is discarded so it can't interleave with
+        # the report; sys.exit() inside it counts as raising SystemExit
+        try:
+            with self._output_lock, contextlib.redirect_stdout(io.StringIO()), \
+                    contextlib.redirect_stderr(io.StringIO()):
+                for _ in range(repeat):
+                    if test.get('track_allocations'):
+                        result, duration_ms, peak = self._traced_call(function, args, kwargs)
+                        peak_alloc_kb = max(peak_alloc_kb or 0, peak / 1024)
+                    else:
+                        start = time.perf_counter()
+                        result = function(*args, **kwargs)
+                        duration_ms = (time.perf_counter() - start) * 1000
+                    durations.append(duration_ms)
+        except KeyboardInterrupt:
+            raise
+        except BaseException as e:
+            raised = [cls.__name__ for cls in type(e).__mro__]
+            if expected_exception and expected_exception in raised:
+                return TestResult(test_name, True, f"Raised {type(e).__name__} as expected")
+            return TestResult(test_name, False, f"Raised {type(e).__name__}: {e}")
+        
+        metrics = {'duration_ms': statistics.median(durations)}
+        if peak_alloc_kb is not None:
+            metrics['peak_alloc_kb'] = peak_alloc_kb
+        
+        if expected_exception:
+            return TestResult(test_name, False, f"Expected {expected_exception}, but the call returned",
+                              actual=result, metrics=metrics)
+        if 'expected_return' in test:
+            actual = self._plain(result)
+            if actual != test['expected_return']:
+                return TestResult(test_name, False, "Return value mismatch",
+                                  actual=actual, expected=test['expected_return'], metrics=metrics)
+        elif test.get('expected_output') is not None:
+            expected_output = test['expected_output']
+            actual = result if isinstance(result, str) else json.dumps(self._plain(result))
+            if not self._compare_outputs(actual, expected_output):
+                return TestResult(test_name, False, self._mismatch_message(actual, expected_output),
+                                  actual=actual, expected=expected_output, metrics=metrics)
+        
+        exceeded = self._check_limits(test, metrics)
+        if exceeded:
+            return TestResult(test_name, False, "; ".join(exceeded), metrics=metrics)
+        return TestResult(test_name, True, "Function returned expected value", metrics=metrics)
+    
+    def _load_module(self, name: str) -> Any:
+        """
+        Import a module under test once per run
+        
+        A name ending in .py (or containing a /) is a file, resolved like a
+        script path; anything else is imported by module name, with the
+        skill's scripts/ directory on sys.path.
+        """
+        with self._module_lock:
+            if name in self._modules:
+                return self._modules[name]
+            
+            # Module-level lines run only on first import: recorded
+            # separately and credited to every test that uses the module
+            if self.record_coverage:
+                from test_impact import LineTracer
+            tracer = LineTracer(self._coverage_roots(), exclude=[__file__]) if self.record_coverage else None
+            if tracer is not None:
+                tracer.start()
+            try:
+                module = self._import(name)
+            finally:
+                if tracer is not None:
+                    tracer.stop()
+                    self._module_coverage[name] = tracer.coverage()
+            self._modules[name] = module
+            return module
+    
+    def _import(self, name: str) -> Any:
+        if name.endswith('.py') or '/' in name:
+            path = self._script_path(name).resolve()
+            if not path.exists():
+                raise ImportError(f"module file not found: {path}")
+            # Sibling imports inside the module resolve like they do when it runs as a script
+            if str(path.parent) not in sys.path:
+                sys.path.insert(0, str(path.parent))
+            existing = sys.modules.get(path.stem)
+            if existing is not None:
+                if Path(getattr(existing, '__file__', '') or '').resolve() != path:
+                    raise ImportError(f"a different module named {path.stem} is already loaded")
+                module = existing
+            else:
+                spec = importlib.util.spec_from_file_location(path.stem, path)
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[path.stem] = module
+                try:
+                    spec.loader.exec_module(module)
+                except BaseException:
+                    del sys.modules[path.stem]
+                    raise
+        else:
+            if self.skill_path and str(self.skill_path / 'scripts') not in sys.path:
+                sys.path.insert(0, str(self.skill_path / 'scripts'))
+            module = importlib.import_module(name)
+        return module
+    
+    def _traced_call(self, function: Any, args: List[Any], kwargs: Dict[str, Any]) -> tuple:
+        """(result, duration in ms, peak traced bytes) of one call under tracemalloc"""
+        import tracemalloc
+        
+        with self._trace_lock:
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            try:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                start = time.perf_counter()
+                result = function(*args, **kwargs)
+                duration_ms = (time.perf_counter() - start) * 1000
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+            finally:
+                if started:
+                    tracemalloc.stop()
+        return result, duration_ms, peak
+    
+    def _plain(self, value: Any) -> Any:
+        """A return value as JSON data (tuples become lists), to compare with the test file"""
+        try:
+            return json.loads(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            return value
+    
+    def _execute_test(self, input_data: Dict[str, Any], test: Optional[Dict[str, Any]] = None) -> Any:
+        """Execute a test with given input data through the suite's executor"""
+        future = self._prefetched.pop(id(test), None) if test is not None else None
+        if future is not None:
+            return future.result()
+        return self._executor().execute(input_data)
+    
+    def _prefetch_outputs(self, runs: List[tuple]):
+        """
+        With a concurrency setting (executor "concurrency" or --concurrency),
+        start every selected regression test's execution on the async backend
+        
+        Not under --stepwise: the run may stop at the first failure, and
+        requests for tests that never run can still cost API calls.
+        """
+        config = self._executor_config or {}
+        if self.stepwise or not (self.concurrency or config.get('concurrency')):
+            return
+        tests = [run[4] for run in runs if run[1] == 'regression_tests']
+        if not tests:
+            return
+        from async_backend import AsyncBackend
+        from executors import ExecutorError
+        
+        try:
+            executor = self._executor()
+        except ExecutorError:
+            return  # Reported by each regression test
+        self._backend = AsyncBackend.from_config(executor, config, self.concurrency)
+        for test in tests:
+            self._prefetched[id(test)] = self._backend.submit(test.get('input', {}), test.get('timeout'))
+    
+    def _executor(self) -> 'Executor':
+        """The suite's executor (see executors.py), created on first use"""
+        from executors import ExecutorError, load_executor
+        
+        with self._lock:
+            if self._executor_instance is None:
+                config = self._executor_config
+                if config and self.cassette_mode:
+                    config = dict(config, cassette_mode=self.cassette_mode)
+                try:
+                    self._executor_instance = load_executor(config, self.test_file.resolve().parent)
+                except (ValueError, OSError) as e:
+                    raise ExecutorError(f"invalid executor config: {e}")
+            return self._executor_instance
     
     def _compare_outputs(self, actual: Any, expected: Any) -> bool:
         """Compare actual and expected outputs"""
@@ -173,49 +1062,343 @@ class SkillTestRunner:
         elif isinstance(expected, dict) and 'contains' in expected:
             # Substring matching
             return expected['contains'] in str(actual)
+        elif self._is_structural(expected):
+            # JSON structure matching (keys, types, array lengths)
+            return self._structural_divergence(actual, expected) is None
+        elif self._is_similarity(expected):
+            # Token similarity to the closest baseline
+            return self._similarity(actual, expected)[0]
         else:
             # Exact match
             return str(actual).strip() == str(expected).strip()
     
+    def _is_structural(self, expected: Any) -> bool:
+        return isinstance(expected, dict) and any(key in expected for key in STRUCTURAL_KEYS)
+    
+    def _is_similarity(self, expected: Any) -> bool:
+        return isinstance(expected, dict) and any(key in expected for key in SIMILARITY_KEYS)
+    
+    def _similarity(self, actual: Any, expected: Dict[str, Any]) -> tuple:
+        """
+        (passed, message) of a similarity comparison
+        
+        Baselines are given inline ('similarity', a string or a list) and/or as
+        files relative to the test file ('similarity_files'). Each baseline set
+        is indexed once per run, so tests sharing it only tokenize their output.
+        """
+        baselines = expected.get('similarity', [])
+        baselines = [baselines] if isinstance(baselines, str) else list(baselines)
+        for name in expected.get('similarity_files', []):
+            path = self.test_file.parent / name
+            if not path.exists():
+                return False, f"Similarity baseline not found: {path}"
+            baselines.append(path.read_text())
+        key = (tuple(baselines), expected.get('threshold', SIMILARITY_THRESHOLD))
+        with self._lock:
+            if key not in self._similarity_indexes:
+                self._similarity_indexes[key] = SimilarityIndex(baselines, key[1])
+            index = self._similarity_indexes[key]
+        return index.validate(actual if isinstance(actual, str) else json.dumps(actual))
+    
+    def _baseline_store(self, store_dir: str) -> 'BaselineStore':
+        """Baseline store relative to the test file, loaded once per run"""
+        from baseline_store import BaselineStore
+        
+        path = (self.test_file.parent / store_dir).resolve()
+        with self._lock:
+            if path not in self._stores:
+                self._stores[path] = BaselineStore(path)
+            return self._stores[path]
+    
+    def _structural_divergence(self, actual: Any, expected: Dict[str, Any]) -> Optional[str]:
+        """
+        Where actual's JSON structure first diverges from the expected example
+        
+        The example is given inline ('structural_match'), as a file relative
+        to the test file ('structural_match_file') or as a baseline store
+        entry ('structural_match_store'); files and store entries are
+        streamed so large baselines are never loaded whole.
+        """
+        actual_stream = io.StringIO(actual if isinstance(actual, str) else json.dumps(actual))
+        try:
+            if 'structural_match_store' in expected:
+                reference = expected['structural_match_store']
+                with self._baseline_store(reference['store']).open_text(
+                        reference['name'], reference.get('version')) as baseline:
+                    return structural_diff(baseline, actual_stream)
+            if 'structural_match_file' in expected:
+                path = self.test_file.parent / expected['structural_match_file']
+                if not path.exists():
+                    return f"structural baseline not found: {path}"
+                with open(path, 'r', encoding='utf-8') as baseline:
+                    return structural_diff(baseline, actual_stream)
+            return structural_diff(io.StringIO(json.dumps(expected['structural_match'])), actual_stream)
+        except ValueError as e:
+            return str(e)
+    
+    def _mismatch_message(self, actual: Any, expected: Any, default: str = "Output mismatch") -> str:
+        """Failure message; structural comparisons name the JSON path of the divergence"""
+        if self._is_structural(expected):
+            return f"Structure mismatch: {self._structural_divergence(actual, expected)}"
+        if self._is_similarity(expected):
+            return self._similarity(actual, expected)[1]
+        return default
+    
+    def _run_timed(self, section: str, method_name: str, test: Dict[str, Any],
+                   isolated: bool = False) -> TestResult:
+        """Run one test, tagging the result with its section and wall time"""
+        # Regression tests run through the executor, not skill code: never traced
+        recording = self.record_coverage and section != 'regression_tests'
+        if recording:
+            self._coverage.files = {}
+        start = time.perf_counter()
+        try:
+            if isolated:
+                with tempfile.TemporaryDirectory(prefix='skill-test-') as tmp:
+                    result = getattr(self, method_name)(test, Path(tmp))
+            else:
+                result = getattr(self, method_name)(test)
+        finally:
+            files = getattr(self._coverage, 'files', None)
+            self._coverage.files = None
+        result.elapsed_ms = (time.perf_counter() - start) * 1000
+        if recording:
+            with self._lock:
+                self._covered[test_id(section, result.test_name)] = (test, files)
+        result.section = section
+        return result
+    
     def run_all_tests(self):
         """Execute all tests in the test file"""
         test_data = self.load_tests()
+        self._executor_config = test_data.get('executor')
         
         print(f"\n🧪 Running tests from: {self.test_file.name}")
         print(f"{'='*60}\n")
         
-        # Run unit tests
-        if 'unit_tests' in test_data:
-            print("📦 Unit Tests")
-            print("-" * 40)
-            for test in test_data['unit_tests']:
-                result = self.run_unit_test(test)
-                self.results.append(result)
-                self._print_result(result)
-        
-        # Run integration tests
-        if 'integration_tests' in test_data:
-            print("\n🔗 Integration Tests")
-            print("-" * 40)
-            for test in test_data['integration_tests']:
-                result = self.run_integration_test(test)
-                self.results.append(result)
-                self._print_result(result)
-        
-        # Run regression tests
-        if 'regression_tests' in test_data:
-            print("\n🔄 Regression Tests")
-            print("-" * 40)
-            for test in test_data['regression_tests']:
-                result = self.run_regression_test(test)
-                self.results.append(result)
-                self._print_result(result)
+        runs = [(key, heading, method_name, test)
+                for key, heading, method_name in self.SECTIONS if key in test_data
+                for test in test_data[key]]
+        total = len(runs)
+        # (file position, section key, heading, method name, test)
+        runs = [(position,) + run for position, run in enumerate(runs) if self._selected(run[3])]
+        if self.keywords:
+            print(f"🔎 Selected {len(runs)} of {total} tests (-k {' | '.join(self.keywords)})\n")
+        
+        suite = str(self.test_file.resolve())
+        if self.impacted:
+            runs = self._impacted_runs(runs, suite)
+        cache = TestCache(self.cache_file) if self.cache_file else None
+        runs = self._order(runs, cache, suite)
+        
+        started_at = datetime.now()
+        start = time.perf_counter()
+        
+        try:
+            self._prefetch_outputs(runs)
+            if self.failed_first or self.stepwise:
+                self._run_as_completed(runs)
+            else:
+                self._run_grouped(runs)
+        finally:
+            if self._backend is not None:
+                # Interrupted runs: drop requests nobody will wait for
+                for future in self._prefetched.values():
+                    future.cancel()
+                self._backend.close()
+            if self._prefork is not None:
+                self._prefork.close()
+            if self._executor_instance is not None:
+                self._executor_instance.close()
         
         # Print summary
         self._print_summary()
+        
+        if self.stepwise:
+            self._stepwise_stop = self._first_unfinished(runs)
+            if self._stepwise_stop is not None:
+                print(f"⏸️  Stepwise: stopped at '{self._stepwise_stop[4].get('name', 'Unnamed test')}'; "
+                      f"rerun with --stepwise to resume there\n")
+        
+        if cache:
+            self._update_cache(cache, suite, runs)
+        if self.record_coverage:
+            self._save_coverage(suite)
+        if self.history_file:
+            self._record_history(started_at, (time.perf_counter() - start) * 1000)
+    
+    def _selected(self, test: Dict[str, Any]) -> bool:
+        """Whether a test matches any -k filter (case-insensitive substring of its name)"""
+        name = test.get('name', 'Unnamed test').lower()
+        return not self.keywords or any(keyword.lower() in name for keyword in self.keywords)
+    
+    def _impacted_runs(self, runs: List[tuple], suite: str) -> List[tuple]:
+        """Runs affected by changes since their coverage was recorded (see test_impact.py)"""
+        from test_impact import ChangeDetector, CoverageMap, select_impacted
+        
+        entries = CoverageMap(self.coverage_file).tests(suite)
+        if not entries:
+            print("⚠️  --impacted: no coverage recorded for this suite; running every test "
+                  "(record it with --record-coverage)\n")
+            return runs
+        tests = {test_id(run[1], run[4].get('name', 'Unnamed test')): run[4] for run in runs}
+        reasons = select_impacted(entries, tests, ChangeDetector())
+        impacted = [run for run in runs if test_id(run[1], run[4].get('name', 'Unnamed test')) in reasons]
+        print(f"🎯 Impacted: {len(impacted)} of {len(runs)} tests")
+        if self.verbose:
+            for run in impacted:
+                name = run[4].get('name', 'Unnamed test')
+                print(f"     └─ {name}: {reasons[test_id(run[1], name)]}")
+        print()
+        return impacted
+    
+    def _save_coverage(self, suite: str):
+        """Store the files and lines each test ran, plus the input files it names, in the coverage map"""
+        from test_impact import CoverageMap, merge_coverage, referenced_files
+        
+        coverage = CoverageMap(self.coverage_file)
+        base_dirs = [self.test_file.resolve().parent]
+        if self.skill_path:
+            base_dirs.append((self.skill_path / 'scripts').resolve())
+        for tid, (test, files) in self._covered.items():
+            files = dict(files or {})
+            merge_coverage(files, {path: None for path in referenced_files(test, base_dirs) if path not in files})
+            coverage.record(suite, tid, test, files)
+        try:
+            coverage.save([suite])
+        except OSError as e:
+            print(f"⚠️  Could not update coverage map {self.coverage_file}: {e}")
+            return
+        print(f"🗺️  Recorded coverage of {len(self._covered)} test(s) in {self.coverage_file}\n")
+    
+    def _order(self, runs: List[tuple], cache: Optional[TestCache], suite: str) -> List[tuple]:
+        """
+        Run order from the cached outcomes of earlier runs
+        
+        --stepwise keeps file order, starting at the test the last stepwise
+        run stopped at. Otherwise previously failing tests go first (with
+        --failed-first, or always when running in parallel, where they are
+        only submitted first) and, in parallel, the rest longest first.
+        """
+        if cache is None:
+            return runs
+        ids = [test_id(run[1], run[4].get('name', 'Unnamed test')) for run in runs]
+        if self.stepwise:
+            resume = cache.stepwise(suite)
+            if resume in ids:
+                skipped = ids.index(resume)
+                if skipped:
+                    print(f"⏭️  Stepwise: skipping {skipped} test(s) that passed before "
+                          f"'{runs[skipped][4].get('name', 'Unnamed test')}'\n")
+                return runs[skipped:]
+            return runs
+        if self.jobs == 1 and not self.failed_first:
+            return runs
+        return [runs[i] for i in schedule(ids, cache.outcomes(suite), longest_first=self.jobs > 1)]
+    
+    def _run_grouped(self, runs: List[tuple]):
+        """Run tests and print results by section, in file order"""
+        if self.jobs == 1:
+            self._print_grouped(runs, lambda run: self._run_timed(run[1], run[3], run[4]))
+            return
+        
+        # Submit in scheduled order, then print results in file order as
+        # each one becomes available
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            futures = {run[0]: pool.submit(self._run_timed, run[1], run[3], run[4], True) for run in runs}
+            self._print_grouped(sorted(runs), lambda run: futures[run[0]].result())
+    
+    def _print_grouped(self, runs: List[tuple], result_of):
+        section = None
+        for run in runs:
+            if run[1] != section:
+                self._print_section(run[2], first=(section is None))
+                section = run[1]
+            result = result_of(run)
+            self.results.append(result)
+            self._print_result(result)
+    
+    def _run_as_completed(self, runs: List[tuple]):
+        """
+        Run tests and print each result as soon as it is available
+        
+        With --stepwise, no further tests start after the first failure.
+        """
+        section = None
+        
+        def report(run: tuple, result: TestResult) -> bool:
+            nonlocal section
+            if run[1] != section:
+                self._print_section(run[2], first=(section is None))
+                section = run[1]
+            self.results.append(result)
+            self._print_result(result)
+            return self.stepwise and not result.passed
+        
+        if self.jobs == 1:
+            for run in runs:
+                if report(run, self._run_timed(run[1], run[3], run[4])):
+                    return
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            futures = {pool.submit(self._run_timed, run[1], run[3], run[4], True): run for run in runs}
+            for future in as_completed(futures):
+                if report(futures[future], future.result()):
+                    for pending in futures:
+                        pending.cancel()
+                    return
+    
+    def _first_unfinished(self, runs: List[tuple]) -> Optional[tuple]:
+        """First run (in file order) that failed or never ran"""
+        passed = {test_id(r.section, r.test_name) for r in self.results if r.passed}
+        for run in sorted(runs):
+            if test_id(run[1], run[4].get('name', 'Unnamed test')) not in passed:
+                return run
+        return None
+    
+    def _update_cache(self, cache: TestCache, suite: str, runs: List[tuple]):
+        """Store this run's outcomes (and the stepwise position) in the cache file"""
+        cache.update(suite, self.results)
+        if self.stepwise:
+            stop = self._stepwise_stop
+            if stop is not None:
+                cache.set_stepwise(suite, test_id(stop[1], stop[4].get('name', 'Unnamed test')))
+            elif cache.stepwise(suite) in {test_id(run[1], run[4].get('name', 'Unnamed test')) for run in runs}:
+                # Resumed and got through the rest; a stop outside a -k selection is kept
+                cache.set_stepwise(suite, None)
+        try:
+            cache.save([suite])
+        except OSError as e:
+            print(f"⚠️  Could not update test cache {self.cache_file}: {e}")
+    
+    def _record_history(self, started_at: datetime, duration_ms: float):
+        """Append this run to the SQLite history file"""
+        import sqlite3
+        from test_history import TestHistory
+        
+        try:
+            history = TestHistory(self.history_file)
+            try:
+                history.record_run(str(self.test_file.resolve()), self.results, started_at, duration_ms,
+                                   jobs=self.jobs, cwd=self.skill_path or self.test_file.resolve().parent)
+            finally:
+                history.close()
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️  Could not record test history in {self.history_file}: {e}")
+    
+    def _print_section(self, heading: str, first: bool = False):
+        """Print a test section heading"""
+        with self._output_lock:
+            print(heading if first else f"\n{heading}")
+            print("-" * 40)
     
     def _print_result(self, result: TestResult):
         """Print a single test result"""
+        with self._output_lock:
+            self._print_result_lines(result)
+    
+    def _print_result_lines(self, result: TestResult):
         status = "✅ PASS" if result.passed else "❌ FAIL"
         print(f"{status} | {result.test_name}")
         
@@ -225,6 +1408,17 @@ class SkillTestRunner:
             if result.actual is not None and result.expected is not None:
                 print(f"     └─ Expected: {result.expected}")
                 print(f"     └─ Actual:   {result.actual}")
+        
+        if result.metrics:
+            duration_ms = result.metrics['duration_ms']
+            parts = [f"{duration_ms:.1f} ms" if duration_ms >= 1 else f"{duration_ms * 1000:.1f} µs"]
+            if result.metrics.get('peak_rss_mb') is not None:
+                parts.append(f"{result.metrics['peak_rss_mb']:.1f} MB peak RSS")
+            if result.metrics.get('output_bytes') is not None:
+                parts.append(f"{result.metrics['output_bytes']} B output")
+            if result.metrics.get('peak_alloc_kb') is not None:
+                parts.append(f"{result.metrics['peak_alloc_kb']:.1f} KB peak allocated")
+            print(f"     └─ {', '.join(parts)}")
     
     def _print_summary(self):
         """Print test execution summary"""
@@ -244,16 +1438,42 @@ class SkillTestRunner:
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: run_tests.py <test-file> [--skill-path <path>] [--verbose]")
+        print("Usage: run_tests.py <test-file> [--skill-path <path>] [--verbose] [-j N] "
+              "[--record-history | --history <file>]")
+        print("                    [--failed-first] [--stepwise] [-k <name>] [--cache <file> | --no-cache]")
+        print("                    [--prefork [--preload mod1,mod2]] [--cassette-mode replay|record|new]")
+        print("                    [--concurrency N] [--record-coverage] [--impacted] [--coverage-map <file>]")
         print("\nExamples:")
         print("  run_tests.py tests/pdf-skill-tests.json")
         print("  run_tests.py tests/docx-tests.json --skill-path /mnt/skills/public/docx")
         print("  run_tests.py tests/all-tests.yaml --verbose")
+        print("  run_tests.py tests/all-tests.json -j 8")
+        print("  run_tests.py tests/all-tests.json -j 8 --failed-first")
+        print("  run_tests.py tests/all-tests.json --record-history")
+        print("  run_tests.py tests/all-tests.json --stepwise -k regression")
+        print("  run_tests.py tests/all-tests.json --prefork --preload yaml,pypdf")
+        print("  run_tests.py tests/regression.json --cassette-mode new")
+        print("  run_tests.py tests/regression.json --concurrency 16")
+        print("  run_tests.py tests/all-tests.json --record-coverage")
+        print("  run_tests.py tests/all-tests.json --impacted")
         sys.exit(1)
     
     test_file = Path(sys.argv[1])
     skill_path = None
     verbose = False
+    jobs = 1
+    history_file = None
+    cache_file = DEFAULT_CACHE
+    failed_first = False
+    stepwise = False
+    keywords = []
+    preload = None
+    extra_preload = []
+    cassette_mode = None
+    concurrency = None
+    coverage_file = None
+    record_coverage = False
+    impacted = False
     
     # Parse arguments
     i = 2
@@ -264,6 +1484,60 @@ def main():
         elif sys.argv[i] == '--verbose':
             verbose = True
             i += 1
+        elif sys.argv[i] in ('-j', '--jobs') and i + 1 < len(sys.argv):
+            jobs = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--record-history':
+            from test_history import DEFAULT_HISTORY
+            history_file = DEFAULT_HISTORY
+            i += 1
+        elif sys.argv[i] == '--history' and i + 1 < len(sys.argv):
+            history_file = Path(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--no-history':
+            history_file = None
+            i += 1
+        elif sys.argv[i] == '--cache' and i + 1 < len(sys.argv):
+            cache_file = Path(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--no-cache':
+            cache_file = None
+            i += 1
+        elif sys.argv[i] in ('--failed-first', '--ff'):
+            failed_first = True
+            i += 1
+        elif sys.argv[i] in ('--stepwise', '--sw'):
+            stepwise = True
+            i += 1
+        elif sys.argv[i] == '-k' and i + 1 < len(sys.argv):
+            keywords.append(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--cassette-mode' and i + 1 < len(sys.argv):
+            cassette_mode = sys.argv[i + 1]
+            from cassette_server import CASSETTE_MODES
+            if cassette_mode not in CASSETTE_MODES:
+                print(f"❌ Error: Invalid cassette mode '{cassette_mode}'. Use {', '.join(CASSETTE_MODES)}")
+                sys.exit(1)
+            i += 2
+        elif sys.argv[i] == '--concurrency' and i + 1 < len(sys.argv):
+            concurrency = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--record-coverage':
+            record_coverage = True
+            i += 1
+        elif sys.argv[i] == '--impacted':
+            impacted = True
+            i += 1
+        elif sys.argv[i] == '--coverage-map' and i + 1 < len(sys.argv):
+            coverage_file = Path(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--prefork':
+            from prefork_runner import DEFAULT_PRELOAD
+            preload = list(DEFAULT_PRELOAD)
+            i += 1
+        elif sys.argv[i] == '--preload' and i + 1 < len(sys.argv):
+            extra_preload += [name for name in sys.argv[i + 1].split(',') if name]
+            i += 2
         else:
             print(f"Unknown argument: {sys.argv[i]}")
             sys.exit(1)
@@ -272,7 +1546,28 @@ def main():
         print(f"❌ Error: Test file not found: {test_file}")
         sys.exit(1)
     
-    runner = SkillTestRunner(test_file, skill_path, verbose)
+    if preload is not None:
+        from prefork_runner import PREFORK_SUPPORTED
+        if not PREFORK_SUPPORTED:
+            print("⚠️  --prefork needs fork() and Unix sockets; running each script as its own process")
+            preload = None
+        else:
+            preload += extra_preload
+    elif extra_preload:
+        print("❌ Error: --preload is only used with --prefork")
+        sys.exit(1)
+    
+    if (record_coverage or impacted) and coverage_file is None:
+        from test_impact import DEFAULT_COVERAGE_MAP
+        coverage_file = DEFAULT_COVERAGE_MAP
+    
+    if stepwise and cache_file is None:
+        print("❌ Error: --stepwise needs the test cache (drop --no-cache)")
+        sys.exit(1)
+    
+    runner = SkillTestRunner(test_file, skill_path, verbose, jobs, history_file,
+                             cache_file, failed_first, stepwise, keywords, preload, cassette_mode,
+                             concurrency, coverage_file, record_coverage, impacted)
     runner.run_all_tests()
     
     # Exit with error code if any tests failed
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test Result Cache
+
+Keeps the latest outcome and duration of every test, per suite, in a small
+JSON file, along with where the last --stepwise run stopped. run_tests.py
+reads it to schedule previously failing tests first and long tests early.
+
+Usage:
+    test_cache.py [<test-file>] [--cache <file>] [--clear]
+
+Examples:
+    test_cache.py                                    # list cached suites
+    test_cache.py tests/pdf-skill-tests.json         # last outcomes, slowest first
+    test_cache.py tests/pdf-skill-tests.json --clear
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_CACHE = Path.home() / '.cache' / 'skill-testing-framework' / 'last_results.json'
+
+
+def test_id(section: str, name: str) -> str:
+    """Key of a test within its suite"""
+    return f"{section}::{name}"
+
+
+def schedule(ids: List[str], outcomes: Dict[str, Dict[str, Any]],
+             longest_first: bool = True) -> List[int]:
+    """
+    Run order for tests, as indices into ids
+
+    Tests that failed last time come first. With longest_first the rest
+    follow by descending last duration (tests without one first, since
+    they may be slow), which keeps workers busy until the end of a parallel
+    run; otherwise they keep their original order.
+    """
+    def key(index: int):
+        outcome = outcomes.get(ids[index])
+        failed = outcome is not None and not outcome['passed']
+        duration = outcome['duration_ms'] if outcome is not None else float('inf')
+        return (not failed, -duration if longest_first else 0)
+
+    return sorted(range(len(ids)), key=key)
+
+
+class TestCache:
+    """Last outcome of each test, keyed by suite (resolved test file path)"""
+
+    def __init__(self, path: Path = DEFAULT_CACHE):
+        self.path = Path(path)
+        self.data = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # Missing or unreadable: start over, it is only a cache
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _suite(self, suite: str) -> Dict[str, Any]:
+        return self.data.setdefault(suite, {'tests': {}, 'stepwise': None})
+
+    def outcomes(self, suite: str) -> Dict[str, Dict[str, Any]]:
+        """test id -> {'passed': bool, 'duration_ms': float}"""
+        return self._suite(suite)['tests']
+
+    def update(self, suite: str, results: List[Any]):
+        """Record TestResult objects; tests that did not run keep their entries"""
+        tests = self._suite(suite)['tests']
+        for result in results:
+            tests[test_id(result.section, result.test_name)] = {
+                'passed': result.passed,
+                'duration_ms': round(result.elapsed_ms, 3),
+            }
+
+    def stepwise(self, suite: str) -> Optional[str]:
+        """Test id the last --stepwise run stopped at, if any"""
+        return self._suite(suite)['stepwise']
+
+    def set_stepwise(self, suite: str, test: Optional[str]):
+        self._suite(suite)['stepwise'] = test
+
+    def clear(self, suite: str):
+        self.data.pop(suite, None)
+
+    def save(self, suites: Optional[List[str]] = None):
+        """
+        Write the cache atomically
+
+        With suites, only those entries are written over the file's current
+        content, so concurrent runs of other suites are not lost.
+        """
+        data = self.data
+        if suites is not None:
+            data = self._load()
+            for suite in suites:
+                if suite in self.data:
+                    data[suite] = self.data[suite]
+                else:
+                    data.pop(suite, None)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+
+def main():
+    args = sys.argv[1:]
+    cache_path = DEFAULT_CACHE
+    test_file = None
+    clear = False
+
+    i = 0
+    while i < len(args):
+        if args[i] == '--cache' and i + 1 < len(args):
+            cache_path = Path(args[i + 1])
+            i += 2
+        elif args[i] == '--clear':
+            clear = True
+            i += 1
+        elif args[i] in ('-h', '--help'):
+            print("Usage: test_cache.py [<test-file>] [--cache <file>] [--clear]")
+            sys.exit(0)
+        elif test_file is None and not args[i].startswith('-'):
+            test_file = args[i]
+            i += 1
+        else:
+            print(f"Unknown argument: {args[i]}")
+            sys.exit(1)
+
+    cache = TestCache(cache_path)
+
+    if test_file is None:
+        if clear:
+            print("❌ Error: --clear needs a test file")
+            sys.exit(1)
+        print(f"\n📚 Cached suites ({cache_path})")
+        print(f"{'='*60}")
+        for suite, entry in cache.data.items():
+            failed = sum(1 for outcome in entry['tests'].values() if not outcome['passed'])
+            print(f"{len(entry['tests']):>5} tests  {failed:>4} failed  {suite}")
+        print()
+        return
+
+    suite = str(Path(test_file).resolve())
+    if clear:
+        cache.clear(suite)
+        cache.save([suite])
+        print(f"✅ Cleared cached results for {suite}")
+        return
+
+    outcomes = cache.outcomes(suite)
+    print(f"\n🗂️  Cached results: {suite}")
+    print(f"{'='*60}")
+    if not outcomes:
+        print("No cached results.\n")
+        return
+    for tid in sorted(outcomes, key=lambda t: outcomes[t]['duration_ms'], reverse=True):
+        outcome = outcomes[tid]
+        print(f"{'✅' if outcome['passed'] else '❌'} {outcome['duration_ms']:>10.1f} ms  {tid}")
+    if cache.stepwise(suite):
+        print(f"\n⏸️  Stepwise resumes at: {cache.stepwise(suite)}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Test Timing History
+
+Stores run_tests.py runs made with --record-history (per-test status,
+duration and resource usage) in a local SQLite file keyed by git commit, and reports how test durations
+drift across runs.
+
+Usage:
+    test_history.py [<test-file>] [--last N] [--history <file>] [--slow-factor F]
+
+Examples:
+    test_history.py                              # list recorded suites
+    test_history.py tests/pdf-skill-tests.json   # trends over the last 10 runs
+    test_history.py tests/pdf-skill-tests.json --last 30 --slow-factor 1.25
+"""
+
+import sqlite3
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DEFAULT_HISTORY = Path.home() / '.cache' / 'skill-testing-framework' / 'history.db'
+
+# A test is "newly slow" when its latest duration exceeds the median of its
+# earlier runs by this factor and by at least MIN_SLOWDOWN_MS
+SLOW_FACTOR = 1.5
+MIN_SLOWDOWN_MS = 5.0
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    suite TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    git_commit TEXT,
+    git_dirty INTEGER NOT NULL DEFAULT 0,
+    jobs INTEGER NOT NULL DEFAULT 1,
+    total INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    duration_ms REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    section TEXT,
+    name TEXT NOT NULL,
+    passed INTEGER NOT NULL,
+    duration_ms REAL,
+    peak_rss_mb REAL,
+    output_bytes INTEGER,
+    message TEXT,
+    PRIMARY KEY (run_id, position)
+);
+CREATE INDEX IF NOT EXISTS runs_by_suite ON runs (suite, id);
+CREATE INDEX IF NOT EXISTS runs_by_commit ON runs (git_commit);
+"""
+
+
+def git_commit(cwd: Path) -> Tuple[Optional[str], bool]:
+    """Return (HEAD commit, working tree dirty) for cwd, or (None, False) outside git"""
+    # One git call: porcelain v2 reports HEAD in a "# branch.oid" header
+    # line, followed by one line per changed tracked file
+    try:
+        status = subprocess.run(['git', 'status', '--porcelain=v2', '--branch', '--untracked-files=no'],
+                                cwd=cwd, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+    commit = None
+    dirty = False
+    for line in status.splitlines():
+        if line.startswith('# branch.oid '):
+            commit = line.split()[2]
+        elif not line.startswith('#'):
+            dirty = True
+    if commit == '(initial)':
+        commit = None
+    return commit, dirty
+
+
+class TestHistory:
+    """SQLite store of test runs"""
+
+    def __init__(self, path: Path = DEFAULT_HISTORY):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def record_run(self, suite: str, results: List[Any], started_at: datetime,
+                   duration_ms: float, jobs: int = 1, cwd: Optional[Path] = None) -> int:
+        """
+        Store one run of a test suite
+
+        Args:
+            suite: Resolved path of the test file
+            results: TestResult objects, in file order
+            started_at: When the run started
+            duration_ms: Wall time of the whole run
+            jobs: Worker count the run used (timings from -j > 1 are noisier)
+            cwd: Directory whose git HEAD identifies the code under test
+
+        Returns:
+            The new run id
+        """
+        commit, dirty = git_commit(cwd or Path(suite).parent)
+
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (suite, started_at, git_commit, git_dirty, jobs, total, passed, duration_ms) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (suite, started_at.isoformat(timespec='seconds'), commit, int(dirty), jobs,
+                 len(results), sum(1 for r in results if r.passed), duration_ms)
+            )
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO results (run_id, position, section, name, passed, duration_ms, "
+                "peak_rss_mb, output_bytes, message) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, position, result.section, result.test_name, int(result.passed),
+                  (result.metrics or {}).get('duration_ms', result.elapsed_ms),
+                  (result.metrics or {}).get('peak_rss_mb'),
+                  (result.metrics or {}).get('output_bytes'),
+                  result.message or None)
+                 for position, result in enumerate(results)]
+            )
+        return run_id
+
+    def suites(self) -> List[sqlite3.Row]:
+        """Recorded suites with their run counts and latest run time"""
+        return self.conn.execute(
+            "SELECT suite, COUNT(*) AS runs, MAX(started_at) AS last_run "
+            "FROM runs GROUP BY suite ORDER BY last_run DESC"
+        ).fetchall()
+
+    def recent_runs(self, suite: str, last: int = 10) -> List[sqlite3.Row]:
+        """The last N runs of a suite, oldest first"""
+        rows = self.conn.execute(
+            "SELECT * FROM runs WHERE suite = ? ORDER BY id DESC LIMIT ?", (suite, last)
+        ).fetchall()
+        return rows[::-1]
+
+    def test_series(self, run_ids: List[int]) -> Dict[Tuple[str, str], List[Optional[sqlite3.Row]]]:
+        """
+        Per-test results across the given runs
+
+        Returns:
+            (section, name) -> one row per run id (None where the test did not run)
+        """
+        if not run_ids:
+            return {}
+        index = {run_id: i for i, run_id in enumerate(run_ids)}
+        placeholders = ', '.join('?' * len(run_ids))
+        rows = self.conn.execute(
+            f"SELECT * FROM results WHERE run_id IN ({placeholders}) ORDER BY position", run_ids
+        ).fetchall()
+
+        series: Dict[Tuple[str, str], List[Optional[sqlite3.Row]]] = {}
+        for row in rows:
+            key = (row['section'], row['name'])
+            series.setdefault(key, [None] * len(run_ids))[index[row['run_id']]] = row
+        return series
+
+
+def sparkline(values: List[Optional[float]]) -> str:
+    """Render durations as a sparkline; missing runs are shown as spaces"""
+    present = [v for v in values if v is not None]
+    if not present:
+        return ''
+    low, high = min(present), max(present)
+    span = high - low
+    chars = []
+    for value in values:
+        if value is None:
+            chars.append(' ')
+        elif span == 0:
+            chars.append(SPARK_CHARS[0])
+        else:
+            chars.append(SPARK_CHARS[int((value - low) / span * (len(SPARK_CHARS) - 1))])
+    return ''.join(chars)
+
+
+def drift_per_run(values: List[Optional[float]]) -> Optional[float]:
+    """Least-squares slope of duration over run index, in ms per run"""
+    points = [(i, v) for i, v in enumerate(values) if v is not None]
+    if len(points) < 3:
+        return None
+    mean_x = statistics.mean(x for x, _ in points)
+    mean_y = statistics.mean(y for _, y in points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator
+
+
+def analyze_history(history: TestHistory, suite: str, last: int = 10,
+                    slow_factor: float = SLOW_FACTOR) -> Dict[str, Any]:
+    """
+    Duration trends, slowest tests and newly slow tests over the last N runs
+
+    Returns:
+        Dict with 'runs' and 'tests' (one entry per test, slowest median first)
+    """
+    runs = history.recent_runs(suite, last)
+    series = history.test_series([run['id'] for run in runs])
+
+    tests = []
+    for (section, name), rows in series.items():
+        durations = [row['duration_ms'] if row is not None else None for row in rows]
+        present = [d for d in durations if d is not None]
+        if not present:
+            continue
+
+        latest = durations[-1]
+        earlier = [d for d in durations[:-1] if d is not None]
+        newly_slow = (
+            latest is not None and earlier
+            and latest > statistics.median(earlier) * slow_factor
+            and latest - statistics.median(earlier) >= MIN_SLOWDOWN_MS
+        )
+
+        tests.append({
+            'section': section,
+            'name': name,
+            'durations': durations,
+            'median_ms': statistics.median(present),
+            'latest_ms': latest,
+            'baseline_ms': statistics.median(earlier) if earlier else None,
+            'drift_ms_per_run': drift_per_run(durations),
+            'failures': sum(1 for row in rows if row is not None and not row['passed']),
+            'newly_slow': bool(newly_slow),
+        })
+
+    tests.sort(key=lambda t: t['median_ms'], reverse=True)
+    return {'runs': runs, 'tests': tests}
+
+
+def print_report(suite: str, report: Dict[str, Any], top: int = 10):
+    """Print trend, slowest-test and newly-slow sections"""
+    runs = report['runs']
+    tests = report['tests']
+
+    print(f"\n📈 Test history: {suite}")
+    print(f"{'='*60}")
+
+    if not runs:
+        print("No recorded runs.\n")
+        return
+
+    first, latest = runs[0], runs[-1]
+    print(f"Runs: {len(runs)} ({first['started_at']} → {latest['started_at']})")
+    print(f"Latest: {latest['passed']}/{latest['total']} passed in {latest['duration_ms']:.0f} ms"
+          f" @ {(latest['git_commit'] or 'no commit')[:10]}{' (dirty)' if latest['git_dirty'] else ''}")
+    if any(run['jobs'] > 1 for run in runs):
+        print("Note: some runs used -j > 1; their timings include contention")
+
+    print(f"\n📊 Duration trends (oldest → newest)")
+    print("-" * 40)
+    for test in tests:
+        drift = test['drift_ms_per_run']
+        drift_text = f"{drift:+.1f} ms/run" if drift is not None else ""
+        print(f"{sparkline(test['durations']):<{len(runs)}}  {test['median_ms']:>8.1f} ms  "
+              f"{drift_text:>14}  {test['name']}")
+
+    print(f"\n🐢 Slowest tests (median)")
+    print("-" * 40)
+    for test in tests[:top]:
+        print(f"{test['median_ms']:>8.1f} ms  {test['name']}")
+
+    newly_slow = [t for t in tests if t['newly_slow']]
+    print(f"\n⚠️  Newly slow in latest run")
+    print("-" * 40)
+    if newly_slow:
+        for test in newly_slow:
+            print(f"{test['latest_ms']:>8.1f} ms  (was {test['baseline_ms']:.1f} ms, "
+                  f"{test['latest_ms'] / test['baseline_ms']:.2f}x)  {test['name']}")
+    else:
+        print("None")
+
+    flaky = [t for t in tests if 0 < t['failures'] < sum(1 for d in t['durations'] if d is not None)]
+    if flaky:
+        print(f"\n🎲 Intermittent failures")
+        print("-" * 40)
+        for test in flaky:
+            print(f"{test['failures']} failed run(s)  {test['name']}")
+    print()
+
+
+def main():
+    args = sys.argv[1:]
+    history_path = DEFAULT_HISTORY
+    last = 10
+    slow_factor = SLOW_FACTOR
+    test_file = None
+
+    i = 0
+    while i < len(args):
+        if args[i] == '--history' and i + 1 < len(args):
+            history_path = Path(args[i + 1])
+            i += 2
+        elif args[i] == '--last' and i + 1 < len(args):
+            last = int(args[i + 1])
+            i += 2
+        elif args[i] == '--slow-factor' and i + 1 < len(args):
+            slow_factor = float(args[i + 1])
+            i += 2
+        elif args[i] in ('-h', '--help'):
+            print("Usage: test_history.py [<test-file>] [--last N] [--history <file>] [--slow-factor F]")
+            print("\nExamples:")
+            print("  test_history.py")
+            print("  test_history.py tests/pdf-skill-tests.json --last 30")
+            sys.exit(0)
+        elif test_file is None and not args[i].startswith('-'):
+            test_file = args[i]
+            i += 1
+        else:
+            print(f"Unknown argument: {args[i]}")
+            sys.exit(1)
+
+    if not history_path.exists():
+        print(f"❌ Error: No history file at {history_path}")
+        sys.exit(1)
+
+    history = TestHistory(history_path)
+    try:
+        if test_file is None:
+            print(f"\n📚 Recorded suites ({history_path})")
+            print(f"{'='*60}")
+            for row in history.suites():
+                print(f"{row['runs']:>5} runs  last {row['last_run']}  {row['suite']}")
+            print()
+        else:
+            suite = str(Path(test_file).resolve())
+            print_report(suite, analyze_history(history, suite, last, slow_factor))
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
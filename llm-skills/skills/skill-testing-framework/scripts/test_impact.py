@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Test Impact Analysis
+
+Records which lines of which files each test executes, and picks the tests
+affected by the changes made since. run_tests.py --record-coverage builds
+the map: script tests run under a line tracer in their own process,
+function tests are traced in-process. run_tests.py --impacted then runs
+only the tests whose covered lines changed, plus tests whose definition
+changed, tests reading a changed input file, and tests with no recorded
+coverage (regression tests, new tests).
+
+Each covered file is stored with its content hash and, when it matched the
+committed version at the time, the git commit; later changes are mapped
+onto the recorded line numbers with git diff. Without git, any change to
+a covered file counts as touching every line.
+
+Usage:
+    test_impact.py <test-file> [--coverage-map <file>]
+    test_impact.py --trace <output.json> [--root <dir>]... <script> [args...]
+
+Examples:
+    test_impact.py tests/pdf-skill-tests.json      # which tests the working tree affects, and why
+"""
+
+import hashlib
+import json
+import os
+import re
+import runpy
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set
+
+try:
+    import coverage
+except ImportError:  # sys.settrace fallback
+    coverage = None
+
+
+DEFAULT_COVERAGE_MAP = Path.home() / '.cache' / 'skill-testing-framework' / 'coverage_map.json'
+
+# Test file sections, as in run_tests.SkillTestRunner.SECTIONS
+TEST_SECTIONS = ('unit_tests', 'integration_tests', 'regression_tests')
+
+# Installed packages are never part of a skill
+SKIPPED_DIRS = ('site-packages', 'dist-packages')
+
+HUNK_HEADER = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+\d+(?:,\d+)? @@', re.MULTILINE)
+
+# Per file: None means "depends on the whole file"
+Coverage = Dict[str, Optional[Set[int]]]
+
+
+def merge_coverage(into: Coverage, files: Coverage):
+    """Add files to into; a whole-file dependency absorbs line sets"""
+    for path, lines in files.items():
+        if lines is None or into.get(path, set()) is None:
+            into[path] = None
+        else:
+            into.setdefault(path, set()).update(lines)
+
+
+def blob_hash(path: str) -> Optional[str]:
+    """git's object id for the file's content (None if it is gone)"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+
+def definition_hash(test: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(test, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def _git(cwd: str, *args: str) -> Optional[str]:
+    try:
+        result = subprocess.run(['git', *args], cwd=cwd, capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def git_root(path: Path) -> Optional[Path]:
+    """Top of the git work tree containing path"""
+    output = _git(str(path if path.is_dir() else path.parent), 'rev-parse', '--show-toplevel')
+    return Path(output.strip()) if output else None
+
+
+def changed_old_lines(diff: str) -> Set[int]:
+    """
+    Line numbers on the old side of a -U0 diff that were changed or
+    removed; an insertion marks the lines on both sides of it
+    """
+    lines: Set[int] = set()
+    for match in HUNK_HEADER.finditer(diff):
+        start = int(match.group(1))
+        count = int(match.group(2)) if match.group(2) is not None else 1
+        lines.update(range(start, start + count) if count else (start, start + 1))
+    return lines
+
+
+class LineTracer:
+    """
+    sys.settrace collector of executed lines in files under the given roots
+
+    Started on one thread it traces that thread only (function tests, which
+    may run in parallel); with threads=True, threads started later as well.
+    """
+
+    def __init__(self, roots: Sequence[Path], exclude: Sequence[str] = ()):
+        self.roots = tuple(os.path.join(os.path.realpath(root), '') for root in roots)
+        self.exclude = {os.path.realpath(path) for path in exclude}
+        self.lines: Dict[str, Set[int]] = {}
+        self._files: Dict[str, Optional[Set[int]]] = {}
+        self._previous = None
+        self._threads = False
+
+    def _lines_for(self, filename: str) -> Optional[Set[int]]:
+        if filename not in self._files:
+            path = os.path.realpath(filename)
+            wanted = (path.startswith(self.roots) and path not in self.exclude
+                      and not any(part in SKIPPED_DIRS for part in Path(path).parts))
+            self._files[filename] = self.lines.setdefault(path, set()) if wanted else None
+        return self._files[filename]
+
+    def _trace(self, frame, event, arg):
+        lines = self._lines_for(frame.f_code.co_filename)
+        if lines is None:
+            return None
+        # The def line: a changed signature affects every caller (0 for module code)
+        if frame.f_lineno:
+            lines.add(frame.f_lineno)
+
+        def trace_lines(frame, event, arg):
+            if event == 'line':
+                lines.add(frame.f_lineno)
+            return trace_lines
+        return trace_lines
+
+    def start(self, threads: bool = False):
+        self._threads = threads
+        self._previous = sys.gettrace()
+        if threads:
+            threading.settrace(self._trace)
+        sys.settrace(self._trace)
+
+    def stop(self):
+        """Stop tracing; an enclosing tracer on this thread resumes"""
+        sys.settrace(self._previous)
+        if self._threads:
+            threading.settrace(None)
+
+    def coverage(self) -> Coverage:
+        return {path: lines for path, lines in self.lines.items() if lines}
+
+
+def trace_command(command: List[str], roots: Sequence[Path], output: str) -> List[str]:
+    """Command that runs a Python script like command would, recording its lines to output"""
+    traced = [sys.executable, os.path.abspath(__file__), '--trace', output]
+    for root in roots:
+        traced += ['--root', str(root)]
+    return traced + command
+
+
+def read_trace(output: str) -> Optional[Coverage]:
+    """Lines written by a --trace run; None if it left nothing (e.g. killed, os._exit)"""
+    try:
+        with open(output, 'r') as f:
+            return {path: set(lines) for path, lines in json.load(f).items()}
+    except (OSError, ValueError):
+        return None
+
+
+def _trace_script(output: str, roots: List[Path], script: str, args: List[str]):
+    """In the child: run the script as __main__ under a tracer, then write what it executed"""
+    sys.argv = [script] + args
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+    roots = roots or [Path(script).resolve().parent]
+
+    if coverage is not None:
+        # C tracer: much less overhead than sys.settrace
+        cov = coverage.Coverage(data_file=None, config_file=False, auto_data=False,
+                                include=[os.path.join(os.path.realpath(root), '*') for root in roots],
+                                omit=[os.path.realpath(__file__)] + [f"*/{name}/*" for name in SKIPPED_DIRS])
+        cov.start()
+    else:
+        tracer = LineTracer(roots, exclude=[__file__])
+        tracer.start(threads=True)
+    try:
+        runpy.run_path(script, run_name='__main__')
+    finally:
+        if coverage is not None:
+            cov.stop()
+            data = cov.get_data()
+            lines = {os.path.realpath(path): sorted(data.lines(path) or []) for path in data.measured_files()}
+        else:
+            tracer.stop()
+            lines = {path: sorted(covered) for path, covered in tracer.coverage().items()}
+        with open(output, 'w') as f:
+            json.dump(lines, f)
+
+
+class CoverageMap:
+    """
+    Covered files and lines of each test, keyed by suite (resolved test file path)
+
+    Entry per test: {'definition': hash of the test, 'files': {path:
+    {'blob': content hash, 'commit': sha or None, 'lines': [...] or None}}}
+    """
+
+    def __init__(self, path: Path = DEFAULT_COVERAGE_MAP):
+        self.path = Path(path)
+        self.data = self._load()
+        self._states: Dict[str, tuple] = {}
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def tests(self, suite: str) -> Dict[str, Dict[str, Any]]:
+        return self.data.setdefault(suite, {})
+
+    def _file_state(self, path: str) -> tuple:
+        """(content hash, HEAD commit if the file is unmodified there), once per file"""
+        if path not in self._states:
+            blob = blob_hash(path)
+            commit = None
+            root = git_root(Path(path))
+            if blob is not None and root is not None:
+                relative = Path(path).relative_to(root.resolve()).as_posix() \
+                    if Path(path).is_relative_to(root.resolve()) else None
+                head = _git(str(root), 'rev-parse', 'HEAD')
+                committed = _git(str(root), 'rev-parse', f"HEAD:{relative}") if relative and head else None
+                if committed is not None and committed.strip() == blob:
+                    commit = head.strip()
+            self._states[path] = (blob, commit)
+        return self._states[path]
+
+    def record(self, suite: str, tid: str, test: Dict[str, Any], files: Coverage):
+        entry = {'definition': definition_hash(test), 'files': {}}
+        for path, lines in sorted(files.items()):
+            blob, commit = self._file_state(path)
+            if blob is None:
+                continue
+            entry['files'][path] = {'blob': blob, 'commit': commit,
+                                    'lines': sorted(lines) if lines is not None else None}
+        self.tests(suite)[tid] = entry
+
+    def clear(self, suite: str):
+        self.data.pop(suite, None)
+
+    def save(self, suites: Optional[List[str]] = None):
+        """Write the map atomically; with suites, only those entries are replaced in the file"""
+        data = self.data
+        if suites is not None:
+            data = self._load()
+            for suite in suites:
+                if suite in self.data:
+                    data[suite] = self.data[suite]
+                else:
+                    data.pop(suite, None)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+
+class ChangeDetector:
+    """What changed in covered files since they were recorded, computed once per file"""
+
+    def __init__(self):
+        self._blobs: Dict[str, Optional[str]] = {}
+        self._diffs: Dict[tuple, Optional[Set[int]]] = {}
+
+    def changed_lines(self, path: str, recorded: Dict[str, Any]) -> Optional[Set[int]]:
+        """
+        Recorded-side line numbers changed since: an empty set when the file
+        is unchanged, None when it changed in a way that can't be mapped
+        (deleted, recorded with uncommitted edits, no git)
+        """
+        if path not in self._blobs:
+            self._blobs[path] = blob_hash(path)
+        current = self._blobs[path]
+        if current == recorded['blob']:
+            return set()
+        if current is None or not recorded.get('commit'):
+            return None
+
+        key = (path, recorded['commit'])
+        if key not in self._diffs:
+            diff = _git(os.path.dirname(path), 'diff', '-U0', '--no-color', '--no-ext-diff',
+                        recorded['commit'], '--', os.path.basename(path))
+            self._diffs[key] = changed_old_lines(diff) if diff is not None else None
+        return self._diffs[key]
+
+
+def _strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def referenced_files(test: Dict[str, Any], base_dirs: Sequence[Path], limit: int = 1000) -> Set[str]:
+    """
+    Existing files a test names (fixtures, input files, baselines), resolved
+    against base_dirs; directories contribute the files under them
+    """
+    found: Set[str] = set()
+    for value in _strings(test):
+        if not value or len(value) > 4096 or '\n' in value:
+            continue
+        for base in base_dirs:
+            try:
+                path = (base / value).resolve()
+                if path.is_file():
+                    found.add(str(path))
+                    break
+                if path.is_dir() and path != base.resolve():
+                    for root, _, names in os.walk(path):
+                        found.update(os.path.join(root, name) for name in names)
+                    break
+            except (OSError, ValueError):
+                continue
+        if len(found) >= limit:
+            break
+    return found
+
+
+def impact_reason(entry: Optional[Dict[str, Any]], test: Dict[str, Any], changes: ChangeDetector) -> Optional[str]:
+    """Why a test has to run again, or None if nothing it depends on changed"""
+    if entry is None:
+        return "no coverage recorded"
+    if entry['definition'] != definition_hash(test):
+        return "test definition changed"
+    for path, recorded in entry['files'].items():
+        changed = changes.changed_lines(path, recorded)
+        if changed is None or (changed and recorded['lines'] is None):
+            return f"{os.path.basename(path)} changed"
+        touched = changed.intersection(recorded['lines'] or ())
+        if touched:
+            return f"{os.path.basename(path)}:{min(touched)} changed"
+    return None
+
+
+def select_impacted(entries: Dict[str, Dict[str, Any]], tests: Dict[str, Dict[str, Any]],
+                    changes: Optional[ChangeDetector] = None) -> Dict[str, str]:
+    """test id -> reason, for the tests (by id) that need to run"""
+    changes = changes or ChangeDetector()
+    reasons = {}
+    for tid, test in tests.items():
+        reason = impact_reason(entries.get(tid), test, changes)
+        if reason is not None:
+            reasons[tid] = reason
+    return reasons
+
+
+def main():
+    args = sys.argv[1:]
+
+    if args[:1] == ['--trace'] and len(args) >= 3:
+        output = args[1]
+        roots: List[Path] = []
+        i = 2
+        while args[i:i + 1] == ['--root'] and i + 1 < len(args):
+            roots.append(Path(args[i + 1]))
+            i += 2
+        if i >= len(args):
+            print("Usage: test_impact.py --trace <output.json> [--root <dir>]... <script> [args...]")
+            sys.exit(1)
+        _trace_script(output, roots, args[i], args[i + 1:])
+        return
+
+    test_file = None
+    map_path = DEFAULT_COVERAGE_MAP
+    i = 0
+    while i < len(args):
+        if args[i] == '--coverage-map' and i + 1 < len(args):
+            map_path = Path(args[i + 1])
+            i += 2
+        elif test_file is None and not args[i].startswith('-'):
+            test_file = Path(args[i])
+            i += 1
+        else:
+            print(f"Unknown argument: {args[i]}")
+            sys.exit(1)
+
+    if test_file is None:
+        print("Usage: test_impact.py <test-file> [--coverage-map <file>]")
+        print("\nExamples:")
+        print("  test_impact.py tests/pdf-skill-tests.json")
+        sys.exit(1)
+
+    with open(test_file, 'r') as f:
+        if test_file.suffix in ('.yaml', '.yml'):
+            import yaml
+            test_data = yaml.safe_load(f)
+        else:
+            test_data = json.load(f)
+
+    suite = str(test_file.resolve())
+    entries = CoverageMap(map_path).tests(suite)
+    tests = {f"{section}::{test.get('name', 'Unnamed test')}": test
+             for section in TEST_SECTIONS for test in test_data.get(section, [])}
+    reasons = select_impacted(entries, tests)
+
+    print(f"\n🎯 Impacted tests: {suite}")
+    print(f"{'='*60}")
+    if not entries:
+        print("No coverage recorded for this suite; run run_tests.py --record-coverage first.\n")
+        return
+    for tid in tests:
+        print(f"{'▶️ ' if tid in reasons else '⏭️ '} {tid}" + (f"  ({reasons[tid]})" if tid in reasons else ""))
+    print(f"\n{len(reasons)} of {len(tests)} tests impacted\n")
+
+
+if __name__ == "__main__":
+    main()
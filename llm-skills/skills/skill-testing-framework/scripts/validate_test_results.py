@@ -5,34 +5,541 @@ Test Results Validator
 Validates test outputs against expected results and manages baseline files.
 
 Usage:
-    validate_test_results.py <actual-file> <expected-file> [--mode exact|contains|pattern]
-    validate_test_results.py --create-baseline <output-file> <baseline-dir>
+    validate_test_results.py <actual-file> <expected-file> [--mode exact|contains|pattern|structural_match]
+    validate_test_results.py <actual-file> <expected-file> --mode similarity [--threshold 0.8] [--baseline <file> ...]
+    validate_test_results.py --create-baseline <output-file> <baseline-dir> [--name <test-name>]
 
 Examples:
     validate_test_results.py output.txt expected.txt
     validate_test_results.py result.json baseline.json --mode exact
     validate_test_results.py output.txt expected.txt --mode contains
+    validate_test_results.py report.json baselines/report.json --mode structural_match
+    validate_test_results.py summary.txt baselines/summary_a.txt --mode similarity --baseline baselines/summary_b.txt
     validate_test_results.py --create-baseline test_output.txt baselines/
+    validate_test_results.py --create-baseline test_output.txt baselines/ --name "Regression: Output format"
 """
 
 import sys
+import hashlib
+import io
 import json
+import mmap
+import os
 import re
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 import difflib
 
 
+# Bytes compared per step when scanning for the first difference
+CHUNK_SIZE = 1 << 20
+# Lines of context shown before the first difference, and lines shown after it
+DIFF_CONTEXT_LINES = 3
+DIFF_WINDOW_LINES = 20
+# Cap on characters taken from either side of the difference (long lines)
+DIFF_WINDOW_CHARS = 4096
+MAX_DIFF_CHARS = 500
+
+# ASCII characters str.strip() removes (bytes.strip() skips \x1c-\x1f)
+WHITESPACE = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+HUNK_HEADER = re.compile(r'@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@')
+
+
+def content_bounds(data) -> Tuple[int, int]:
+    """(start, end) of data with leading/trailing whitespace excluded, without copying it all"""
+    strip_chars = None if isinstance(data, str) else WHITESPACE
+    start, end = 0, len(data)
+    
+    while start < end:
+        block = data[start:start + 4096]
+        stripped = block.lstrip(strip_chars)
+        start += len(block) - len(stripped)
+        if stripped:
+            break
+    while end > start:
+        block = data[max(start, end - 4096):end]
+        stripped = block.rstrip(strip_chars)
+        end -= len(block) - len(stripped)
+        if stripped:
+            break
+    return start, end
+
+
+def ascii_at_bounds(data, bounds: Tuple[int, int]) -> bool:
+    """
+    Whether the first and last bytes inside bounds are ASCII. Otherwise
+    they may start or end Unicode whitespace (NBSP, U+2028, ...) that
+    str.strip() would remove but content_bounds() keeps for bytes.
+    """
+    start, end = bounds
+    return start == end or (data[start] < 0x80 and data[end - 1] < 0x80)
+
+
+def first_difference(a, b, a_range: Tuple[int, int], b_range: Tuple[int, int],
+                     chunk_size: int = CHUNK_SIZE) -> Optional[int]:
+    """
+    Offset (relative to the range starts) of the first differing element
+    
+    Works on str, bytes or mmap. Compares chunk by chunk, stopping at the
+    first chunk that differs, then narrows down to the exact offset by
+    binary search within that chunk.
+    
+    Returns: None if the ranges are equal
+    """
+    a_start, b_start = a_range[0], b_range[0]
+    a_len, b_len = a_range[1] - a_start, b_range[1] - b_start
+    common = min(a_len, b_len)
+    
+    pos = 0
+    while pos < common:
+        size = min(chunk_size, common - pos)
+        if a[a_start + pos:a_start + pos + size] != b[b_start + pos:b_start + pos + size]:
+            # Invariant: everything before lo matches, the difference is in [lo, hi)
+            lo, hi = pos, pos + size
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if a[a_start + lo:a_start + mid] == b[b_start + lo:b_start + mid]:
+                    lo = mid
+                else:
+                    hi = mid
+            return lo
+        pos += size
+    
+    return None if a_len == b_len else common
+
+
+def _count(data, needle, start: int, end: int) -> int:
+    """Occurrences of needle in data[start:end], counted chunk by chunk"""
+    return sum(data[i:min(i + CHUNK_SIZE, end)].count(needle) for i in range(start, end, CHUNK_SIZE))
+
+
+def _window(data, data_range: Tuple[int, int], window_start: int, offset: int, newline) -> str:
+    """Text from window_start to DIFF_WINDOW_LINES lines past offset"""
+    end = offset
+    for _ in range(DIFF_WINDOW_LINES):
+        found = data.find(newline, end, data_range[1])
+        if found == -1:
+            end = data_range[1]
+            break
+        end = found + 1
+    end = min(end, offset + DIFF_WINDOW_CHARS)
+    text = data[window_start:end]
+    return text.decode('utf-8', errors='replace') if isinstance(text, bytes) else text
+
+
+def window_diff(expected, actual, expected_range: Tuple[int, int], actual_range: Tuple[int, int],
+                offset: int) -> str:
+    """
+    Unified diff of the region around the first difference only
+    
+    Both sides share everything before offset, so the window starts at the
+    same relative position (a few lines before the difference) in each.
+    Hunk line numbers are shifted to match the full content.
+    """
+    newline = '\n' if isinstance(expected, str) else b'\n'
+    e_start, a_start = expected_range[0], actual_range[0]
+    
+    window_start = e_start + offset
+    for _ in range(DIFF_CONTEXT_LINES + 1):
+        found = expected.rfind(newline, e_start, window_start)
+        if found == -1:
+            window_start = e_start
+            break
+        window_start = found
+    else:
+        window_start += 1
+    window_start = max(window_start, e_start + offset - DIFF_WINDOW_CHARS)
+    
+    line_offset = _count(expected, newline, e_start, window_start)
+    relative = window_start - e_start
+    expected_text = _window(expected, expected_range, window_start, e_start + offset, newline)
+    actual_text = _window(actual, actual_range, a_start + relative, a_start + offset, newline)
+    
+    def shift(hunk_header: str) -> str:
+        match = HUNK_HEADER.match(hunk_header)
+        if not match:
+            return hunk_header
+        e_line, e_count, a_line, a_count = match.groups()
+        return (f"@@ -{int(e_line) + line_offset}{e_count or ''} "
+                f"+{int(a_line) + line_offset}{a_count or ''} @@{hunk_header[match.end():]}")
+    
+    diff = difflib.unified_diff(
+        expected_text.splitlines(),
+        actual_text.splitlines(),
+        fromfile='expected',
+        tofile='actual',
+        lineterm=''
+    )
+    diff_text = '\n'.join(shift(line) if line.startswith('@@') else line for line in diff)
+    
+    line = line_offset + _count(expected, newline, window_start, e_start + offset) + 1
+    return f"First difference at line {line}:\n{diff_text}"
+
+
+# One JSON token per match, anchored at the current position: separators
+# (whitespace and commas) are skipped, an object key is a string followed by
+# ':'. Scalar values are matched but never decoded.
+JSON_TOKEN = re.compile(r"""
+    [ \t\n\r,]*
+    (?:
+        ([{\[])                               # 1: open
+      | ([}\]])                               # 2: close
+      | "([^"\\]*(?:\\.[^"\\]*)*)"([ \t\n\r]*:)?  # 3: string body, 4: key colon
+      | (-?\d[\d.eE+-]*)                      # 5: number
+      | (true|false)                          # 6: boolean
+      | (null)                                # 7: null
+    )""", re.VERBOSE)
+JSON_SCALAR_TYPES = {3: 'string', 5: 'number', 6: 'boolean', 7: 'null'}
+JSON_CLOSERS = {'{': '}', '[': ']'}
+# Tokens ending this close to the end of the buffer may be cut off (a
+# number's last digits, a key's ':'), so they wait for the next read
+JSON_LOOKAHEAD = 64
+
+# Event kinds that begin a value
+VALUE_STARTS = ('start_map', 'start_array', 'scalar')
+
+
+def json_events(stream, chunk_size: int = CHUNK_SIZE):
+    """
+    Parse JSON incrementally, yielding (event, value) pairs
+    
+    Events: ('start_map', None), ('key', name), ('end_map', None),
+    ('start_array', None), ('end_array', None), ('scalar', type_name).
+    Memory use is bounded by the chunk size, the longest single token and
+    the nesting depth. Brackets and keys are checked; separators are only
+    skipped, since this serves structure comparison, not validation.
+    
+    Raises:
+        ValueError: On malformed JSON
+    """
+    buf = ''
+    pos = 0
+    eof = False
+    stack = []
+    finished = False
+    awaiting_value = False
+    
+    while True:
+        carry = buf[pos:]
+        chunk = '' if eof else stream.read(max(chunk_size, len(carry)))
+        eof = eof or not chunk
+        buf, pos = carry + chunk, 0
+        limit = len(buf) if eof else len(buf) - JSON_LOOKAHEAD
+        deferred = False
+        
+        for match in iter(JSON_TOKEN.scanner(buf).match, None):
+            if match.end() > limit:
+                deferred = True
+                break
+            pos = match.end()
+            group = match.lastindex
+            if finished:
+                raise ValueError("unexpected data after JSON value")
+            
+            if group == 2:
+                closer = match.group(2)
+                if not stack or stack.pop() != closer or awaiting_value:
+                    raise ValueError(f"unexpected {closer!r}")
+                finished = not stack
+                yield ('end_map', None) if closer == '}' else ('end_array', None)
+            elif group == 4:
+                if not stack or stack[-1] != '}' or awaiting_value:
+                    raise ValueError(f"unexpected object key {match.group(3)!r}")
+                awaiting_value = True
+                key = match.group(3)
+                yield ('key', json.loads(f'"{key}"') if '\\' in key else key)
+            else:
+                if stack and stack[-1] == '}' and not awaiting_value:
+                    raise ValueError("object value without a key")
+                awaiting_value = False
+                if group == 1:
+                    stack.append(JSON_CLOSERS[match.group(1)])
+                    yield ('start_map', None) if match.group(1) == '{' else ('start_array', None)
+                else:
+                    finished = not stack
+                    yield ('scalar', JSON_SCALAR_TYPES[group])
+        
+        rest = buf[pos:].lstrip(' \t\n\r,')
+        if eof:
+            if rest:
+                raise ValueError(f"unexpected character {rest[0]!r}")
+            if stack or not finished:
+                raise ValueError("unexpected end of input")
+            return
+        if not deferred and len(rest) > JSON_LOOKAHEAD and not rest.startswith('"'):
+            # Not a token cut off by the chunk boundary
+            raise ValueError(f"unexpected character {rest[0]!r}")
+
+
+def format_json_path(path: list) -> str:
+    """Render path components as $.key[index]['odd key']"""
+    parts = ['$']
+    for component in path:
+        if component is None:
+            continue
+        if isinstance(component, int):
+            parts.append(f"[{component}]")
+        elif re.fullmatch(r'[A-Za-z_][A-Za-z0-9_]*', component):
+            parts.append(f".{component}")
+        else:
+            parts.append(f"[{json.dumps(component, ensure_ascii=False)}]")
+    return ''.join(parts)
+
+
+def _shape_name(event) -> str:
+    if event is None:
+        return 'end of input'
+    names = {'start_map': 'object', 'start_array': 'array', 'end_map': 'end of object',
+             'end_array': 'end of array', 'key': f"key {json.dumps(event[1], ensure_ascii=False)}"}
+    return names.get(event[0], event[1])
+
+
+def _shape_digest(event, events) -> bytes:
+    """Digest of the shape of the value starting with event (object key order ignored)"""
+    stack = []
+    while True:
+        kind, value = event
+        if kind == 'key':
+            stack[-1][2] = value
+            event = next(events)
+            continue
+        if kind == 'start_map':
+            stack.append(['map', {}, None])
+            event = next(events)
+            continue
+        if kind == 'start_array':
+            stack.append(['array', hashlib.blake2b(b'[', digest_size=16), None])
+            event = next(events)
+            continue
+        
+        if kind == 'end_map':
+            members = stack.pop()[1]
+            hasher = hashlib.blake2b(b'{', digest_size=16)
+            for key in sorted(members):
+                hasher.update(json.dumps(key).encode('utf-8') + b':' + members[key])
+            digest = hasher.digest()
+        elif kind == 'end_array':
+            digest = stack.pop()[1].digest()
+        else:
+            digest = value.encode('ascii')
+        
+        if not stack:
+            return digest
+        if stack[-1][0] == 'map':
+            stack[-1][1][stack[-1][2]] = digest
+        else:
+            stack[-1][1].update(digest + b',')
+        event = next(events)
+
+
+def _member_shapes(event, events) -> dict:
+    """Key -> shape digest for the rest of an object, from a 'key' or 'end_map' event"""
+    members = {}
+    while event[0] != 'end_map':
+        members[event[1]] = _shape_digest(next(events), events)
+        event = next(events)
+    return members
+
+
+def _labeled(events, label: str):
+    try:
+        yield from events
+    except ValueError as e:
+        raise ValueError(f"invalid JSON in {label}: {e}")
+
+
+def structural_diff(expected_stream, actual_stream) -> Optional[str]:
+    """
+    Compare the structure of two JSON documents without loading either
+    
+    Objects must have the same keys, values the same types (object, array,
+    string, number, boolean, null) and arrays the same lengths; scalar
+    values are ignored. Both documents are walked in lockstep. When an
+    object's keys appear in a different order, the rest of that object is
+    compared by per-key shape digests instead.
+    
+    Returns: Description of the first divergence, prefixed with its JSON path, or None
+    
+    Raises:
+        ValueError: If either document is not valid JSON
+    """
+    expected = _labeled(json_events(expected_stream), 'expected')
+    actual = _labeled(json_events(actual_stream), 'actual')
+    path = []
+    containers = []
+    
+    while True:
+        e = next(expected, None)
+        a = next(actual, None)
+        if e is None and a is None:
+            return None
+        
+        if containers and containers[-1] == 'array' and (
+                (e and e[0] in VALUE_STARTS) or (a and a[0] in VALUE_STARTS)):
+            path[-1] += 1
+        
+        if e == a:
+            if e[0] == 'start_map':
+                containers.append('map')
+                path.append(None)
+            elif e[0] == 'start_array':
+                containers.append('array')
+                path.append(-1)
+            elif e[0] == 'key':
+                path[-1] = e[1]
+            elif e[0] in ('end_map', 'end_array'):
+                containers.pop()
+                path.pop()
+            continue
+        
+        if e and a and containers and containers[-1] == 'map' and {e[0], a[0]} <= {'key', 'end_map'}:
+            object_path = path[:-1]
+            expected_members = _member_shapes(e, expected)
+            actual_members = _member_shapes(a, actual)
+            for key in expected_members:
+                if key not in actual_members:
+                    return f"{format_json_path(object_path)}: missing key {json.dumps(key, ensure_ascii=False)}"
+            for key in actual_members:
+                if key not in expected_members:
+                    return f"{format_json_path(object_path)}: unexpected key {json.dumps(key, ensure_ascii=False)}"
+            for key, digest in expected_members.items():
+                if actual_members[key] != digest:
+                    return f"{format_json_path(object_path + [key])}: structure differs"
+            containers.pop()
+            path.pop()
+            continue
+        
+        if e and e[0] == 'end_array':
+            return (f"{format_json_path(path[:-1])}: array has more items than expected "
+                    f"(expected {path[-1]})")
+        if a and a[0] == 'end_array':
+            return (f"{format_json_path(path[:-1])}: array has fewer items than expected "
+                    f"(got {path[-1]})")
+        return f"{format_json_path(path)}: expected {_shape_name(e)}, got {_shape_name(a)}"
+
+
+# Similarity mode: outputs are compared as lowercase word tokens
+SIMILARITY_TOKEN = re.compile(r'\w+')
+SIMILARITY_NGRAM = 3
+SIMILARITY_THRESHOLD = 0.8
+# Outputs up to this many tokens may also pass on token edit distance, which
+# tolerates a changed word that would break several n-grams of a short text
+SHORT_OUTPUT_TOKENS = 64
+
+
+def similarity_tokens(text: str) -> list:
+    """Lowercase word tokens; punctuation and whitespace are ignored"""
+    return SIMILARITY_TOKEN.findall(text.lower())
+
+
+def ngram_set(tokens: list, n: int = SIMILARITY_NGRAM) -> frozenset:
+    """Hashes of the token n-grams (of the tokens themselves when there are fewer than n)"""
+    if len(tokens) < n:
+        return frozenset(map(hash, tokens))
+    return frozenset(map(hash, zip(*(tokens[i:] for i in range(n)))))
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    if not a and not b:
+        return 1.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+def bounded_edit_distance(a: list, b: list, bound: int) -> int:
+    """
+    Token-level Levenshtein distance, or bound + 1 as soon as it must exceed bound
+    
+    Only the diagonal band of width 2 * bound + 1 is computed.
+    """
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    if len(a) > len(b):
+        a, b = b, a
+    over = bound + 1
+    previous = list(range(len(b) + 1))
+    for i, token in enumerate(a, 1):
+        low, high = max(1, i - bound), min(len(b), i + bound)
+        current = [over] * (len(b) + 1)
+        current[0] = min(i, over)
+        for j in range(low, high + 1):
+            current[j] = min(previous[j - 1] + (token != b[j - 1]), previous[j] + 1, current[j - 1] + 1)
+        if min(current[low - 1:high + 1]) > bound:
+            return over
+        previous = current
+    return min(previous[-1], over)
+
+
+class SimilarityIndex:
+    """
+    Baselines tokenized and shingled once, so many outputs can be scored
+    against them cheaply
+    
+    An output's score against a baseline is the Jaccard similarity of their
+    token n-gram sets; short outputs (both sides up to SHORT_OUTPUT_TOKENS)
+    score 1 - distance / length instead when their token edit distance is
+    within the threshold's budget. The best score over all baselines counts.
+    """
+    
+    def __init__(self, baselines: List[str], threshold: float = SIMILARITY_THRESHOLD,
+                 n: int = SIMILARITY_NGRAM):
+        self.threshold = threshold
+        self.n = n
+        self._baselines = []
+        for text in baselines:
+            tokens = similarity_tokens(text)
+            self._baselines.append((tokens, ngram_set(tokens, n)))
+    
+    def best_match(self, text: str) -> Tuple[float, int]:
+        """(best score, index of the baseline that produced it)"""
+        tokens = similarity_tokens(text)
+        grams = ngram_set(tokens, self.n)
+        best, best_index = 0.0, 0
+        for index, (baseline_tokens, baseline_grams) in enumerate(self._baselines):
+            longest = max(len(tokens), len(baseline_tokens))
+            short = longest <= SHORT_OUTPUT_TOKENS
+            # Size ratio bounds the Jaccard score: skip baselines that cannot win
+            small, large = sorted((len(grams), len(baseline_grams)))
+            if not short and large and small / large <= best:
+                continue
+            score = jaccard(grams, baseline_grams)
+            target = max(best, score, self.threshold)
+            if short and score < target and longest:
+                bound = int((1 - target) * longest + 1e-9)
+                distance = bounded_edit_distance(tokens, baseline_tokens, bound)
+                if distance <= bound:
+                    score = max(score, 1 - distance / longest)
+            if score > best or index == 0:
+                best, best_index = score, index
+            if best == 1.0:
+                break
+        return best, best_index
+    
+    def validate(self, text: str) -> Tuple[bool, str]:
+        if not self._baselines:
+            return False, "No similarity baselines given"
+        score, index = self.best_match(text)
+        closest = f" (closest: baseline {index + 1} of {len(self._baselines)})" if len(self._baselines) > 1 else ""
+        if score >= self.threshold:
+            return True, f"Similarity {score:.2f} >= {self.threshold:.2f}{closest}"
+        return False, f"Similarity {score:.2f} below threshold {self.threshold:.2f}{closest}"
+
+
 class OutputValidator:
     """Validates test outputs against expectations"""
     
-    def __init__(self, mode: str = 'exact'):
+    def __init__(self, mode: str = 'exact', threshold: float = SIMILARITY_THRESHOLD):
         self.mode = mode
+        self.threshold = threshold
+        self._indexes = {}
         
-    def validate(self, actual: str, expected: str) -> Tuple[bool, str]:
+    def validate(self, actual: str, expected) -> Tuple[bool, str]:
         """
         Validate actual output against expected output
         
+        In similarity mode expected may be a list of baselines.
+        
         Returns: (passed, message)
         """
         if self.mode == 'exact':
@@ -41,9 +548,33 @@ class OutputValidator:
             return self._validate_contains(actual, expected)
         elif self.mode == 'pattern':
             return self._validate_pattern(actual, expected)
+        elif self.mode == 'structural_match':
+            return self._validate_structural(io.StringIO(actual), io.StringIO(expected))
+        elif self.mode == 'similarity':
+            return self._validate_similarity(actual, [expected] if isinstance(expected, str) else expected)
         else:
             return False, f"Unknown validation mode: {self.mode}"
     
+    def validate_files(self, actual_file: Path, expected_file: Path) -> Tuple[bool, str]:
+        """
+        Validate file contents; exact and structural_match modes stream both
+        files instead of reading them
+        
+        Returns: (passed, message)
+        """
+        if self.mode == 'exact':
+            return self._validate_exact_files(actual_file, expected_file)
+        if self.mode == 'structural_match':
+            with open(actual_file, 'r', encoding='utf-8') as actual, \
+                    open(expected_file, 'r', encoding='utf-8') as expected:
+                return self._validate_structural(actual, expected)
+        
+        with open(actual_file, 'r') as f:
+            actual = f.read()
+        with open(expected_file, 'r') as f:
+            expected = f.read()
+        return self.validate(actual, expected)
+    
     def _validate_exact(self, actual: str, expected: str) -> Tuple[bool, str]:
         """Exact string match"""
         actual_clean = actual.strip()
@@ -56,6 +587,55 @@ class OutputValidator:
             diff = self._generate_diff(expected_clean, actual_clean)
             return False, f"Content mismatch:\n{diff}"
     
+    def _validate_exact_files(self, actual_file: Path, expected_file: Path) -> Tuple[bool, str]:
+        """
+        Exact match of two files (ignoring leading/trailing whitespace) via mmap
+        
+        Equal files are confirmed chunk by chunk without loading either one;
+        on mismatch only a window around the first difference is diffed.
+        If the first difference is a line ending (CRLF vs LF), or either file
+        starts or ends with a non-ASCII character, falls back to the text
+        comparison, which normalizes line endings and strips Unicode
+        whitespace.
+        """
+        if actual_file.samefile(expected_file):
+            return True, "Exact match (same file)"
+        
+        with open(actual_file, 'rb') as actual_f, open(expected_file, 'rb') as expected_f:
+            with _map(actual_f) as actual, _map(expected_f) as expected:
+                actual_range = content_bounds(actual)
+                expected_range = content_bounds(expected)
+                if ascii_at_bounds(actual, actual_range) and ascii_at_bounds(expected, expected_range):
+                    offset = first_difference(expected, actual, expected_range, actual_range)
+                    if offset is None:
+                        return True, "Exact match"
+                    at_offset = (expected[expected_range[0] + offset:expected_range[0] + offset + 1]
+                                 + actual[actual_range[0] + offset:actual_range[0] + offset + 1])
+                    if b'\r' not in at_offset:
+                        diff = window_diff(expected, actual, expected_range, actual_range, offset)
+                        return False, f"Content mismatch:\n{self._truncate(diff)}"
+        
+        # Line endings differ, or Unicode whitespace may surround the content:
+        # compare as text (universal newlines, str.strip()) like the other modes
+        return self._validate_exact(actual_file.read_text(), expected_file.read_text())
+    
+    def _validate_structural(self, actual, expected) -> Tuple[bool, str]:
+        """JSON structure match (keys, types, array lengths), ignoring scalar values"""
+        try:
+            divergence = structural_diff(expected, actual)
+        except ValueError as e:
+            return False, f"Cannot compare structure: {e}"
+        if divergence is None:
+            return True, "Structure matches"
+        return False, f"Structure mismatch: {divergence}"
+    
+    def _validate_similarity(self, actual: str, baselines: List[str]) -> Tuple[bool, str]:
+        """Token similarity to the closest baseline, at least the threshold"""
+        key = tuple(baselines)
+        if key not in self._indexes:
+            self._indexes[key] = SimilarityIndex(baselines, self.threshold)
+        return self._indexes[key].validate(actual)
+    
     def _validate_contains(self, actual: str, expected: str) -> Tuple[bool, str]:
         """Check if actual contains expected substring"""
         if expected in actual:
@@ -74,35 +654,61 @@ class OutputValidator:
             return False, f"Invalid regex pattern: {e}"
     
     def _generate_diff(self, expected: str, actual: str) -> str:
-        """Generate a unified diff between expected and actual"""
-        expected_lines = expected.splitlines(keepends=True)
-        actual_lines = actual.splitlines(keepends=True)
-        
-        diff = difflib.unified_diff(
-            expected_lines,
-            actual_lines,
-            fromfile='expected',
-            tofile='actual',
-            lineterm=''
-        )
-        
-        diff_text = ''.join(diff)
-        if len(diff_text) > 500:
-            diff_text = diff_text[:500] + "\n... (truncated)"
-        
+        """Generate a unified diff around the first difference between expected and actual"""
+        expected_range = (0, len(expected))
+        actual_range = (0, len(actual))
+        offset = first_difference(expected, actual, expected_range, actual_range)
+        if offset is None:
+            return ""
+        return self._truncate(window_diff(expected, actual, expected_range, actual_range, offset))
+    
+    def _truncate(self, diff_text: str) -> str:
+        if len(diff_text) > MAX_DIFF_CHARS:
+            diff_text = diff_text[:MAX_DIFF_CHARS] + "\n... (truncated)"
         return diff_text
 
 
-def create_baseline(output_file: Path, baseline_dir: Path):
-    """Create a baseline file from test output"""
-    baseline_dir.mkdir(parents=True, exist_ok=True)
+class _EmptyMap(bytes):
+    """Stand-in for mmap on empty files (which cannot be mapped)"""
     
-    baseline_file = baseline_dir / output_file.name
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+
+def _map(f):
+    """Read-only mmap of an open binary file, usable as a context manager"""
+    if os.fstat(f.fileno()).st_size == 0:
+        return _EmptyMap()
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def create_baseline(output_file: Path, baseline_dir: Path, test_name: Optional[str] = None):
+    """
+    Create a baseline file from test output
     
+    With a test name, the output is added to the content-addressed baseline
+    store in baseline_dir instead of copied into it.
+    """
     if not output_file.exists():
         print(f"❌ Error: Output file not found: {output_file}")
         sys.exit(1)
     
+    if test_name is not None:
+        from baseline_store import BaselineStore
+        version, digest, stored = BaselineStore(baseline_dir).add(test_name, output_file)
+        print(f"✅ Baseline stored: {test_name} → {version} ({digest[:12]}"
+              f"{'' if stored else ', identical content already stored'})")
+        print(f"\n📝 Use it in regression tests with:")
+        print(f'   "baseline_store": "{baseline_dir}"')
+        return
+    
+    baseline_dir.mkdir(parents=True, exist_ok=True)
+    
+    baseline_file = baseline_dir / output_file.name
+    
     # Copy output to baseline
     import shutil
     shutil.copy2(output_file, baseline_file)
@@ -112,34 +718,36 @@ def create_baseline(output_file: Path, baseline_dir: Path):
     print(f'   "baseline_file": "{baseline_file}"')
 
 
-def compare_files(actual_file: Path, expected_file: Path, mode: str = 'exact'):
+def compare_files(actual_file: Path, expected_file: Path, mode: str = 'exact',
+                  threshold: float = SIMILARITY_THRESHOLD, extra_baselines: Optional[List[Path]] = None):
     """Compare two files and report results"""
+    extra_baselines = extra_baselines or []
     
     if not actual_file.exists():
         print(f"❌ Error: Actual file not found: {actual_file}")
         sys.exit(1)
     
-    if not expected_file.exists():
-        print(f"❌ Error: Expected file not found: {expected_file}")
-        sys.exit(1)
-    
-    # Read files
-    with open(actual_file, 'r') as f:
-        actual = f.read()
-    
-    with open(expected_file, 'r') as f:
-        expected = f.read()
+    for path in [expected_file] + extra_baselines:
+        if not path.exists():
+            print(f"❌ Error: Expected file not found: {path}")
+            sys.exit(1)
     
     # Validate
-    validator = OutputValidator(mode)
-    passed, message = validator.validate(actual, expected)
+    validator = OutputValidator(mode, threshold)
+    if extra_baselines:
+        baselines = [path.read_text() for path in [expected_file] + extra_baselines]
+        passed, message = validator.validate(actual_file.read_text(), baselines)
+    else:
+        passed, message = validator.validate_files(actual_file, expected_file)
     
     # Print results
     print(f"\n📊 Validation Results")
     print(f"{'='*60}")
     print(f"Actual:   {actual_file}")
     print(f"Expected: {expected_file}")
-    print(f"Mode:     {mode}")
+    for path in extra_baselines:
+        print(f"          {path}")
+    print(f"Mode:     {mode}" + (f" (threshold {threshold})" if mode == 'similarity' else ""))
     print(f"{'='*60}")
     
     if passed:
@@ -155,13 +763,17 @@ def compare_files(actual_file: Path, expected_file: Path, mode: str = 'exact'):
 def main():
     if len(sys.argv) < 2:
         print("Usage:")
-        print("  validate_test_results.py <actual-file> <expected-file> [--mode exact|contains|pattern]")
-        print("  validate_test_results.py --create-baseline <output-file> <baseline-dir>")
+        print("  validate_test_results.py <actual-file> <expected-file> [--mode exact|contains|pattern|structural_match]")
+        print("  validate_test_results.py <actual-file> <expected-file> --mode similarity [--threshold 0.8] [--baseline <file> ...]")
+        print("  validate_test_results.py --create-baseline <output-file> <baseline-dir> [--name <test-name>]")
         print("\nExamples:")
         print("  validate_test_results.py output.txt expected.txt")
         print("  validate_test_results.py result.json baseline.json --mode exact")
         print("  validate_test_results.py output.txt expected.txt --mode contains")
+        print("  validate_test_results.py report.json baselines/report.json --mode structural_match")
+        print("  validate_test_results.py summary.txt baselines/summary_a.txt --mode similarity --baseline baselines/summary_b.txt")
         print("  validate_test_results.py --create-baseline test_output.txt baselines/")
+        print('  validate_test_results.py --create-baseline test_output.txt baselines/ --name "Regression: Output format"')
         sys.exit(1)
     
     # Check for baseline creation mode
@@ -172,22 +784,48 @@ def main():
         
         output_file = Path(sys.argv[2])
         baseline_dir = Path(sys.argv[3])
-        create_baseline(output_file, baseline_dir)
+        test_name = None
+        if len(sys.argv) >= 6 and sys.argv[4] == '--name':
+            test_name = sys.argv[5]
+        create_baseline(output_file, baseline_dir, test_name)
         sys.exit(0)
     
     # Comparison mode
     actual_file = Path(sys.argv[1])
     expected_file = Path(sys.argv[2])
     mode = 'exact'
+    threshold = SIMILARITY_THRESHOLD
+    extra_baselines = []
     
     # Parse additional arguments
-    if len(sys.argv) >= 5 and sys.argv[3] == '--mode':
-        mode = sys.argv[4]
-        if mode not in ['exact', 'contains', 'pattern']:
-            print(f"❌ Error: Invalid mode '{mode}'. Use 'exact', 'contains', or 'pattern'")
+    args = sys.argv[3:]
+    while args:
+        option = args.pop(0)
+        if option not in ('--mode', '--threshold', '--baseline') or not args:
+            print(f"❌ Error: Unexpected argument '{option}'")
             sys.exit(1)
+        value = args.pop(0)
+        if option == '--mode':
+            mode = value
+        elif option == '--threshold':
+            try:
+                threshold = float(value)
+            except ValueError:
+                threshold = -1.0
+            if not 0.0 <= threshold <= 1.0:
+                print(f"❌ Error: --threshold must be a number between 0 and 1, got '{value}'")
+                sys.exit(1)
+        else:
+            extra_baselines.append(Path(value))
+    
+    if mode not in ['exact', 'contains', 'pattern', 'structural_match', 'similarity']:
+        print(f"❌ Error: Invalid mode '{mode}'. Use 'exact', 'contains', 'pattern', 'structural_match', or 'similarity'")
+        sys.exit(1)
+    if extra_baselines and mode != 'similarity':
+        print("❌ Error: --baseline is only supported with --mode similarity")
+        sys.exit(1)
     
-    exit_code = compare_files(actual_file, expected_file, mode)
+    exit_code = compare_files(actual_file, expected_file, mode, threshold, extra_baselines)
     sys.exit(exit_code)
 
 
@@ -0,0 +1,2 @@
+#!/usr/bin/env python3
+"""Do nothing (script for the benchmark baseline suite)"""
@@ -0,0 +1,3 @@
+#!/usr/bin/env python3
+"""Print a line (script for the benchmark limit tests)"""
+print("hello")
@@ -0,0 +1,6 @@
+#!/usr/bin/env python3
+"""Print a file's contents (input for the relative-args suite)"""
+import sys
+
+with open(sys.argv[1]) as f:
+    sys.stdout.write(f.read())